@@ -0,0 +1,455 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+import Dashboard
+
+
+# ============================== Daten-Klasse ===========================
+
+class Daten_Generator:
+    """
+    Erzeugt reproduzierbare, gültige Testdaten im Format des Dashboards:
+    Student.csv + Module_abgeschlossen.csv (ein Student) sowie
+    Kohorte_Student.csv + Kohorte_Module.csv (mehrere Studenten).
+    Gleicher Seed ergibt byte-gleiche Dateien. Zeilenende wie csv-Modul (\\r\\n).
+    """
+
+    noten_schritte = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0]
+
+    def __init__(self, ordner, seed=42):
+        self.ordner = ordner
+        self.seed = seed
+
+    def datum_text(self, tage):
+        """
+        Wandelt Tage seit 1970 (Array) in Texte im Format TT.MM.JJJJ um.
+        Formatiert nur verschiedene Tage (wenige Tausend) und verteilt sie danach.
+        """
+        einzeln, position = np.unique(np.asarray(tage, dtype=np.int64), return_inverse=True)
+        texte = pd.Series(einzeln.astype("datetime64[D]")).dt.strftime("%d.%m.%Y").to_numpy()
+        return texte[position]
+
+    def module(self, anzahl, start_studium, rng):
+        """
+        Gibt DataFrame mit anzahl Modulen zurück, sortiert nach Prüfungsdatum (wie CSV_Speicher).
+        Modulnamen sind eindeutig, Prüfung liegt 5-60 Tage nach Modulstart.
+        """
+        start = start_studium + rng.integers(0, 3 * 365, anzahl)
+        tage = rng.integers(5, 61, anzahl)
+        ende = start + tage
+        reihenfolge = np.argsort(ende, kind="stable")
+        start, ende, tage = start[reihenfolge], ende[reihenfolge], tage[reihenfolge]
+        return pd.DataFrame({
+            "Modul": [f"Modul {nummer:07d}" for nummer in range(anzahl)],
+            "ECTS": rng.choice([5, 10], anzahl),
+            "Start": self.datum_text(start),
+            "Ende": self.datum_text(ende),
+            "Note": np.asarray(self.noten_schritte)[rng.integers(0, len(self.noten_schritte), anzahl)],
+            "Tage": tage
+        })
+
+    def student(self, name, matrikelnummer, start_studium):
+        """
+        Gibt Zeile für Student-CSV zurück (über Entity-Klassen, wie CSV_Controller).
+        """
+        student = Dashboard.Student(name, matrikelnummer)
+        studium = Dashboard.Studiengang(student, "Angewandte KI", "Bachelor of Science", self.datum_text([start_studium])[0])
+        return studium.daten
+
+    def erzeuge_einzeln(self, anzahl_module):
+        """
+        Schreibt Student.csv und Module_abgeschlossen.csv mit anzahl_module Modulen.
+        """
+        rng = np.random.default_rng(self.seed)
+        start_studium = np.datetime64("2023-10-01", "D").astype(np.int64)
+        pd.DataFrame([self.student("Test Student", "BM000001", start_studium)]).to_csv(
+            os.path.join(self.ordner, "Student.csv"), index=False, lineterminator="\r\n")
+        self.module(anzahl_module, start_studium, rng).to_csv(
+            os.path.join(self.ordner, "Module_abgeschlossen.csv"), index=False, lineterminator="\r\n")
+
+    def erzeuge_kohorte(self, anzahl_studenten, module_je_student):
+        """
+        Schreibt Kohorte_Student.csv und Kohorte_Module.csv (Matrikelnummer als erste Spalte).
+        """
+        rng = np.random.default_rng(self.seed)
+        basis = np.datetime64("2022-10-01", "D").astype(np.int64)
+        starts = basis + rng.integers(0, 2 * 365, anzahl_studenten)
+        matrikelnummern = [f"BM{nummer:06d}" for nummer in range(anzahl_studenten)]
+
+        studenten = [self.student(f"Student {nummer}", matrikel, start)
+                     for nummer, (matrikel, start) in enumerate(zip(matrikelnummern, starts))]
+        pd.DataFrame(studenten).to_csv(os.path.join(self.ordner, "Kohorte_Student.csv"), index=False, lineterminator="\r\n")
+
+        teile = []
+        for matrikel, start in zip(matrikelnummern, starts):
+            module = self.module(module_je_student, start, rng)
+            module.insert(0, "Matrikelnummer", matrikel)
+            teile.append(module)
+        pd.concat(teile, ignore_index=True).to_csv(
+            os.path.join(self.ordner, "Kohorte_Module.csv"), index=False, lineterminator="\r\n")
+
+
+
+# ============================== Benchmark-Klasse =======================
+
+class Benchmark:
+    """
+    Misst Laufzeit und Spitzenspeicher der heißen Pfade des Dashboards:
+    - CSV_Controller: setze_student_csv, füge_modul_csv_hinzu, lösche_modul_csv
+    - Plots_Berechnungen: Konstruktion und jede Kennzahl-/Diagramm-Methode
+    - Dashboard ohne Fenster: alle Kennzahlen + Panels auf Agg-Canvas gezeichnet
+    - Kohorte: Kohorte_Berechnungen und Kohorte_Speicher über CSV_Controller
+    - Schreiber (Stresstest): viele Prozesse ändern gleichzeitig dieselbe Modul-CSV
+    Laufzeiten ohne tracemalloc (verfälscht Zeiten), Spitzenspeicher in eigenem Lauf.
+    "kalt" = alle Klassen-Caches (Daten_Cache, Statistik_Engine, Journal-Zähler) geleert.
+    """
+
+    def __init__(self, größen=(10, 1000, 100000, 1000000), module_je_student=30, wiederholungen=3,
+                 grenze_tabelle=1000, seed=42):
+        self.größen = größen
+        self.module_je_student = module_je_student
+        self.wiederholungen = wiederholungen
+        self.grenze_tabelle = grenze_tabelle # tabelle_module zeichnet jede Zelle -> darüber übersprungen
+        self.seed = seed
+        self.ergebnisse = []
+
+    def leere_caches(self):
+        """
+        Leert alle klassenweiten Caches, damit nächste Messung kalt startet.
+        """
+        Dashboard.Daten_Cache().verwerfe()
+        Dashboard.Statistik_Engine._instanzen.clear()
+        Dashboard.CSV_Speicher._journal_status.clear()
+        Dashboard.Render_Cache._einträge.clear()
+        Dashboard.Render_Cache._bytes = 0
+        Dashboard.Abschluss_Prognose._ergebnisse.clear()
+
+    def miss(self, gruppe, größe, operation, funktion, vorbereitung=None):
+        """
+        Führt funktion wiederholungen-mal aus (vorher jeweils vorbereitung, nicht gemessen)
+        und speichert Zeiten (ms) sowie Spitzenspeicher (KiB, tracemalloc) als Ergebnis.
+        """
+        zeiten = []
+        for _ in range(self.wiederholungen):
+            if vorbereitung:
+                vorbereitung()
+            start = time.perf_counter()
+            funktion()
+            zeiten.append((time.perf_counter() - start) * 1000)
+
+        if vorbereitung:
+            vorbereitung()
+        tracemalloc.start()
+        funktion()
+        spitze = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        ergebnis = {
+            "gruppe": gruppe,
+            "größe": größe,
+            "operation": operation,
+            "zeiten_ms": [round(zeit, 3) for zeit in zeiten],
+            "median_ms": round(float(np.median(zeiten)), 3),
+            "min_ms": round(min(zeiten), 3),
+            "spitze_kib": round(spitze / 1024, 1)
+        }
+        self.ergebnisse.append(ergebnis)
+        print(f"{gruppe:<10} {größe:>9} {operation:<34} {ergebnis['median_ms']:>11.3f} ms {ergebnis['spitze_kib']:>11.1f} KiB")
+        return ergebnis
+
+    def überspringe(self, gruppe, größe, operation, grund):
+        """
+        Speichert übersprungene Messung mit Grund (bleibt im JSON sichtbar).
+        """
+        self.ergebnisse.append({"gruppe": gruppe, "größe": größe, "operation": operation, "übersprungen": grund})
+        print(f"{gruppe:<10} {größe:>9} {operation:<34} übersprungen ({grund})")
+
+    def messe_einzeln(self, größe):
+        """
+        Misst CSV_Controller, Plots_Berechnungen und Dashboard ohne Fenster für einen Studenten.
+        """
+        Daten_Generator(os.getcwd(), self.seed).erzeuge_einzeln(größe)
+        controller = Dashboard.CSV_Controller()
+
+        # Schreiboperationen: Einfügen mitten in Datei und Löschen (je ein Gruppen-Commit),
+        # jede Wiederholung hinterlässt Datei wie vorher
+        self.miss("einzeln", größe, "setze_student_csv", lambda: controller.setze_student_csv(
+            "Test Student", "BM000001", "Angewandte KI", "Bachelor of Science", "01.10.2023"))
+        self.miss("einzeln", größe, "füge_modul_csv_hinzu", lambda: controller.füge_modul_csv_hinzu(
+            "Benchmark Modul", 5, "01.03.2025", "20.03.2025", 2.3), vorbereitung=lambda: self.entferne_modul(controller))
+        self.miss("einzeln", größe, "lösche_modul_csv", lambda: controller.lösche_modul_csv("Benchmark Modul"),
+                  vorbereitung=lambda: self.ergänze_modul(controller))
+        self.entferne_modul(controller)
+
+        # Modul_Tabelle kalt: CSV parsen (+ Spaltendatei schreiben) gegen Laden der Spaltendatei
+        self.miss("einzeln", größe, "lese_tabelle (kalt, CSV)", lambda: Dashboard.CSV_Speicher().lese_tabelle(),
+                  vorbereitung=self.entferne_spalten_datei)
+        self.miss("einzeln", größe, "lese_tabelle (kalt, Spaltendatei)", lambda: Dashboard.CSV_Speicher().lese_tabelle(),
+                  vorbereitung=self.leere_caches)
+
+        # Plots_Berechnungen: Konstruktion kalt, Methoden auf warmer Instanz
+        self.miss("einzeln", größe, "Plots_Berechnungen (kalt)",
+                  lambda: Dashboard.Plots_Berechnungen().tabelle_ansicht, vorbereitung=self.leere_caches)
+        plots = Dashboard.Plots_Berechnungen()
+        for methode in ["zahl_mittelwert_noten", "zahl_abweichung_zeitplan"] + list(Dashboard.Bericht_Renderer.methoden):
+            if methode == "tabelle_module" and größe > self.grenze_tabelle:
+                self.überspringe("einzeln", größe, methode, f"mehr als {self.grenze_tabelle} Zeilen")
+                continue
+            self.miss("einzeln", größe, methode, getattr(plots, methode))
+
+        # Prognose (100000 Trajektorien) aus Modulen bis 60 ECTS -> restliche ECTS offen, unabhängig von größe
+        speicher = Dashboard.CSV_Speicher()
+        tabelle = speicher.lese_tabelle()
+        tabelle = tabelle.auswahl(np.flatnonzero(np.cumsum(tabelle.ects, dtype=np.int64) <= 60))
+        self.miss("einzeln", größe, f"Abschluss_Prognose ({len(tabelle)} Module)",
+                  lambda: Dashboard.Abschluss_Prognose().prognose_student(speicher.lese_student(), tabelle))
+
+        self.miss("einzeln", größe, "Dashboard ohne Fenster (kalt)", self.dashboard_ohne_fenster,
+                  vorbereitung=self.leere_caches)
+
+    def entferne_spalten_datei(self):
+        """
+        Leert Caches und löscht Spaltendatei, damit Modul-CSV neu geparst wird (nicht gemessen).
+        """
+        self.leere_caches()
+        datei = Dashboard.Daten_Cache().spalten_datei(Dashboard.CSV_Speicher().datei_module)
+        if os.path.exists(datei):
+            os.remove(datei)
+
+    def ergänze_modul(self, controller):
+        """
+        Fügt Benchmark-Modul hinzu (Vorbereitung für Löschmessung, nicht gemessen).
+        """
+        self.entferne_modul(controller)
+        controller.füge_modul_csv_hinzu("Benchmark Modul", 5, "01.03.2025", "20.03.2025", 2.3)
+
+    def entferne_modul(self, controller):
+        """
+        Entfernt Benchmark-Modul, falls vorhanden (Vorbereitung, nicht gemessen).
+        """
+        if "Benchmark Modul" in controller.speicher.lese_module()["Modul"].values:
+            controller.lösche_modul_csv("Benchmark Modul")
+
+    def dashboard_ohne_fenster(self):
+        """
+        Baut Inhalt des Dashboards wie GUI_Controller, nur ohne Tk-Fenster:
+        Kennzahlen, Tabellendaten und alle Diagramm-Panels auf Agg-Canvas gezeichnet.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        plots = Dashboard.Plots_Berechnungen()
+        plots.zahl_mittelwert_noten()
+        plots.zahl_abweichung_zeitplan()
+        plots.tabelle_ansicht
+        for methode in ["plot_zeit_ects", "plot_verteilung_noten", "plot_verlauf_noten", "plot_dauer_modul_semester"]:
+            FigureCanvasAgg(getattr(plots, methode)()).draw()
+
+    def messe_kohorte(self, größe):
+        """
+        Misst Kohorten-Modus mit größe Modulen insgesamt (module_je_student je Student).
+        """
+        studenten = max(1, größe // self.module_je_student)
+        Daten_Generator(os.getcwd(), self.seed).erzeuge_kohorte(studenten, self.module_je_student)
+        bezeichnung = f"{studenten}x{self.module_je_student}"
+
+        self.miss("kohorte", bezeichnung, "Kohorte_Berechnungen (kalt)",
+                  lambda: Dashboard.Kohorte_Berechnungen(), vorbereitung=self.leere_caches)
+        kohorte = Dashboard.Kohorte_Berechnungen()
+        for methode in ["kennzahlen", "verteilung_noten", "dauer_modul_semester", "perzentile"]:
+            self.miss("kohorte", bezeichnung, methode, getattr(kohorte, methode))
+        self.miss("kohorte", bezeichnung, "prognose_abschluss", kohorte.prognose_abschluss,
+                  vorbereitung=Dashboard.Abschluss_Prognose._ergebnisse.clear)
+
+        controller = Dashboard.CSV_Controller(speicher=Dashboard.Kohorte_Speicher("BM000000"))
+        self.miss("kohorte", bezeichnung, "füge_modul_csv_hinzu", lambda: controller.füge_modul_csv_hinzu(
+            "Benchmark Modul", 5, "01.03.2025", "20.03.2025", 2.3), vorbereitung=lambda: self.entferne_modul(controller))
+        self.miss("kohorte", bezeichnung, "lösche_modul_csv", lambda: controller.lösche_modul_csv("Benchmark Modul"),
+                  vorbereitung=lambda: self.ergänze_modul(controller))
+        self.miss("kohorte", bezeichnung, "Plots_Berechnungen (kalt)",
+                  lambda: Dashboard.Plots_Berechnungen(controller.speicher).tabelle_ansicht, vorbereitung=self.leere_caches)
+
+    def messe_schreiber(self, prozesse, änderungen, größe=1000, löschen_alle=5):
+        """
+        Stresstest: prozesse Schreiber-Prozesse fügen gleichzeitig je änderungen Module in dieselbe
+        Modul-CSV ein (zufälliges Prüfungsdatum -> Einfügen mitten in Datei) und löschen jedes
+        löschen_alle-te wieder. Misst Änderungen je Sekunde und prüft danach: keine verlorenen
+        oder doppelten Zeilen, gelöschte fehlen, Zeilenzahl stimmt, keine leeren/unlesbaren Felder,
+        Datei sortiert, keine Reste (Warteschlange, Stapel, temporäre Dateien).
+        """
+        Daten_Generator(os.getcwd(), self.seed).erzeuge_einzeln(größe)
+        bereit = multiprocessing.Barrier(prozesse + 1) # Zeitmessung erst, wenn alle Prozesse gestartet sind
+        schreiber = [multiprocessing.Process(target=self.schreibe_parallel, args=(os.getcwd(), nummer, änderungen, löschen_alle, bereit))
+                     for nummer in range(prozesse)]
+        for prozess in schreiber:
+            prozess.start()
+        bereit.wait()
+        start = time.perf_counter()
+        for prozess in schreiber:
+            prozess.join()
+        sekunden = time.perf_counter() - start
+
+        # Erwarteter Bestand aus Namen der Schreiber
+        namen = [f"Stress {nummer:03d}-{position:05d}" for nummer in range(prozesse) for position in range(änderungen)]
+        gelöscht = {name for name in namen if (int(name[-5:]) + 1) % löschen_alle == 0}
+        module = pd.read_csv("Module_abgeschlossen.csv", dtype={"Modul": str})
+        anzahl = Counter(module["Modul"])
+        gültig = module.notna().all(axis=1) # leere Felder oder fehlende Spalten -> beschädigte Zeile
+        ende = Dashboard.Daten_Cache().datum_tage(module.loc[gültig, "Ende"])
+        fehler = {
+            "abgebrochene_prozesse": sum(prozess.exitcode != 0 for prozess in schreiber),
+            "verloren": sum(anzahl[name] == 0 for name in namen if name not in gelöscht),
+            "doppelt": sum(wert > 1 for wert in anzahl.values()),
+            "nicht_gelöscht": sum(anzahl[name] > 0 for name in gelöscht),
+            "zeilen_abweichung": len(module) - (größe + len(namen) - len(gelöscht)),
+            "beschädigt": int((~gültig).sum()),
+            "unsortiert": int((np.diff(ende.astype(np.int64)) < 0).sum()),
+            "reste": sum(datei.endswith((".tmp", "_warteschlange.csv", "_stapel.csv")) for datei in os.listdir()) # Sperrdateien bleiben
+        }
+
+        operationen = len(namen) + len(gelöscht)
+        ergebnis = {
+            "gruppe": "schreiber",
+            "größe": f"{prozesse}x{änderungen}",
+            "operation": "füge_modul_csv_hinzu + lösche_modul_csv (parallel)",
+            "sekunden": round(sekunden, 3),
+            "änderungen_je_s": round(operationen / sekunden, 1),
+            "fehler": fehler,
+            "korrekt": not any(fehler.values())
+        }
+        self.ergebnisse.append(ergebnis)
+        print(f"{'schreiber':<10} {ergebnis['größe']:>9} {operationen:>6} Änderungen {sekunden:>9.3f} s "
+              f"{ergebnis['änderungen_je_s']:>9.1f} /s  {'korrekt' if ergebnis['korrekt'] else fehler}")
+        return ergebnis
+
+    def schreibe_parallel(self, ordner, nummer, änderungen, löschen_alle, bereit):
+        """
+        Schreiber-Prozess für messe_schreiber: eigene Module "Stress <nummer>-<position>"
+        einfügen, jedes löschen_alle-te danach wieder löschen.
+        """
+        os.chdir(ordner)
+        rng = np.random.default_rng(nummer)
+        controller = Dashboard.CSV_Controller()
+        bereit.wait()
+        for position in range(änderungen):
+            name = f"Stress {nummer:03d}-{position:05d}"
+            ende = datetime(2024, 3, 2) + timedelta(days=int(rng.integers(0, 300)))
+            controller.füge_modul_csv_hinzu(name, 5, "01.03.2024", ende.strftime("%d.%m.%Y"), 2.3)
+            if (position + 1) % löschen_alle == 0:
+                controller.lösche_modul_csv(name)
+
+    def starte_schreiber(self, anzahlen, änderungen, größe=1000):
+        """
+        Führt Stresstest je Anzahl Schreiber-Prozesse in eigenem temporären Ordner aus
+        und gibt Bericht als Dictionary zurück.
+        """
+        ordner_vorher = os.getcwd()
+        for prozesse in anzahlen:
+            with tempfile.TemporaryDirectory(prefix="dashboard_schreiber_") as ordner:
+                os.chdir(ordner)
+                try:
+                    self.leere_caches()
+                    self.messe_schreiber(prozesse, änderungen, größe)
+                finally:
+                    os.chdir(ordner_vorher)
+                    self.leere_caches()
+        return self.bericht()
+
+    def starte(self):
+        """
+        Führt alle Messungen je Größe in eigenem temporären Ordner aus
+        (Dashboard arbeitet mit relativen Dateinamen) und gibt Bericht als Dictionary zurück.
+        """
+        ordner_vorher = os.getcwd()
+        for größe in self.größen:
+            for messung in (self.messe_einzeln, self.messe_kohorte):
+                with tempfile.TemporaryDirectory(prefix="dashboard_benchmark_") as ordner:
+                    os.chdir(ordner)
+                    try:
+                        self.leere_caches()
+                        messung(größe)
+                    finally:
+                        os.chdir(ordner_vorher)
+                        self.leere_caches()
+        return self.bericht()
+
+    def bericht(self):
+        """
+        Gibt Ergebnisse mit Umgebung und Parametern als JSON-fähiges Dictionary zurück.
+        """
+        import matplotlib
+        return {
+            "zeitpunkt": datetime.now().isoformat(timespec="seconds"),
+            "umgebung": {
+                "python": sys.version.split()[0],
+                "plattform": platform.platform(),
+                "prozessor": platform.processor() or platform.machine(),
+                "cpu_kerne": os.cpu_count(),
+                "numpy": np.__version__,
+                "pandas": pd.__version__,
+                "matplotlib": matplotlib.__version__
+            },
+            "parameter": {
+                "größen": list(self.größen),
+                "module_je_student": self.module_je_student,
+                "wiederholungen": self.wiederholungen,
+                "grenze_tabelle": self.grenze_tabelle,
+                "seed": self.seed
+            },
+            "ergebnisse": self.ergebnisse
+        }
+
+
+
+# ============================== Ausführung =============================
+
+def main(argumente=None):
+    """
+    Startet Benchmark über Kommandozeile und schreibt Ergebnisse als JSON.
+    --schreiber startet stattdessen Stresstest mit so vielen gleichzeitigen Schreiber-Prozessen,
+    Rückgabe 1, wenn ein Lauf Daten verloren oder beschädigt hat (sonst 0).
+    """
+    parser = argparse.ArgumentParser(description="Benchmark für Dashboard mit synthetischen Daten")
+    parser.add_argument("--größen", type=int, nargs="+", default=[10, 1000, 100000, 1000000], help="Anzahl Module je Lauf")
+    parser.add_argument("--module-je-student", type=int, default=30, help="Module je Student im Kohorten-Modus")
+    parser.add_argument("--wiederholungen", type=int, default=3, help="Messungen je Operation")
+    parser.add_argument("--grenze-tabelle", type=int, default=1000, help="tabelle_module nur bis zu dieser Zeilenzahl messen")
+    parser.add_argument("--seed", type=int, default=42, help="Seed des Datengenerators")
+    parser.add_argument("--ausgabe", default="benchmark.json", help="Zieldatei für JSON-Ergebnisse")
+    parser.add_argument("--schreiber", type=int, nargs="+", default=None, help="Stresstest: Anzahl gleichzeitiger Schreiber-Prozesse je Lauf")
+    parser.add_argument("--änderungen", type=int, default=50, help="Stresstest: eingefügte Module je Schreiber")
+    parser.add_argument("--bestand", type=int, default=1000, help="Stresstest: Module in Modul-CSV vor dem Start")
+    argumente = parser.parse_args(argumente)
+
+    import matplotlib
+    matplotlib.use("Agg") # keine Anzeige nötig
+
+    benchmark = Benchmark(argumente.größen, argumente.module_je_student, argumente.wiederholungen,
+                          argumente.grenze_tabelle, argumente.seed)
+    if argumente.schreiber:
+        bericht = benchmark.starte_schreiber(argumente.schreiber, argumente.änderungen, argumente.bestand)
+    else:
+        bericht = benchmark.starte()
+    with open(argumente.ausgabe, "w", encoding="utf-8") as datei:
+        json.dump(bericht, datei, ensure_ascii=False, indent=2)
+    print(f"Ergebnisse in {argumente.ausgabe} gespeichert.")
+
+    fehlerhaft = [ergebnis["größe"] for ergebnis in bericht["ergebnisse"] if ergebnis.get("korrekt") is False]
+    if fehlerhaft:
+        print(f"Stresstest fehlgeschlagen: {', '.join(fehlerhaft)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
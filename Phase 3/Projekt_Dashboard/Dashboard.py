@@ -1,12 +1,62 @@
+import time
+IMPORT_START = time.perf_counter() # Referenz für Messung der Importzeit (--startzeit)
+
+import argparse
+import asyncio
+import atexit
 import csv
+import functools
+import hashlib
+import heapq
+import importlib
+import inspect
+import io
+import json
+import mmap
+import os
+import queue
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import urllib.parse
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-import numpy as np
-import pandas as pd
-from matplotlib.figure import Figure
-from matplotlib.ticker import MaxNLocator
+from itertools import islice
 import tkinter as tk
-from tkinter import messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import messagebox, ttk
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+
+class Verzögerter_Import:
+    """
+    Platzhalter für schweres Modul (numpy, pandas), das erst beim ersten
+    Attributzugriff importiert wird. Ersetzt sich danach im Namensraum dieses
+    Moduls durch das echte Modul, weitere Zugriffe kosten nichts extra.
+    matplotlib wird direkt in den Methoden importiert, die Figures erstellen.
+    """
+
+    def __init__(self, modulname, alias):
+        self.modulname = modulname
+        self.alias = alias
+
+    def __getattr__(self, attribut):
+        modul = importlib.import_module(self.modulname)
+        globals()[self.alias] = modul
+        return getattr(modul, attribut)
+
+
+np = Verzögerter_Import("numpy", "np")
+pd = Verzögerter_Import("pandas", "pd")
 
 
 # ============================== Entity-Klassen =========================
@@ -18,6 +68,8 @@ class Student:
     Klasse stellt Basisdaten bereit, die von anderen 
     Klassen (folgend Studiengang) verwendet werden können.
     """
+    __slots__ = ("name", "matrikelnummer") # kein __dict__ je Instanz
+
     def __init__(self, eingabe_name, eingabe_matrikelnummer):
         self.name = eingabe_name
         self.matrikelnummer = eingabe_matrikelnummer
@@ -40,6 +92,8 @@ class Studiengang:
     Ist aggregiert mit Klasse "Student", bedeutet sie benötigt
     ein existierendes Student-Objekt.
     """
+    __slots__ = ("student", "studiengang", "abschluss", "datum_start", "datum_ende")
+
     def __init__(self, eingabe_student: Student, eingabe_studiengang, eingabe_abschluss, eingabe_datum_start):
         self.student = eingabe_student  # verknüftes Objekt -> Komposition: Studiengang ist darauf angewiesen, dass Student existiert
         self.studiengang = eingabe_studiengang
@@ -71,6 +125,8 @@ class Modul:
     Repräsentiert ein Modul mit Bezeichnung, ECTS und Startdatum.
     Kann eigenständig bestehen und von Prüfungsleistung aggregiert werden.
     """
+    __slots__ = ("bezeichnung", "ects", "datum_start")
+
     def __init__(self, eingabe_bezeichnung, eingabe_ects, eingabe_datum_start):
         self.bezeichnung = eingabe_bezeichnung
         self.ects = eingabe_ects
@@ -94,6 +150,8 @@ class Prüfungsleistung:
     Repräsentiert Prüfungsleistung zu einem Modul.
     Aggregiert Modul, da ohne Modul keine Prüfungsleistung existiert.
     """
+    __slots__ = ("modul", "datum_prüfung", "note", "tage_vorbereitung")
+
     def __init__(self, eingabe_modul: Modul, eingabe_datum_prüfung, note):
         self.modul = eingabe_modul # verknüftes Objekt -> Komposition: Prüfungsleistung ist darauf angewiesen, dass Modul existiert
         self.datum_prüfung = datetime.strptime(eingabe_datum_prüfung, "%d.%m.%Y") # Wandelt eingegebenes Startdatum in datetime-Objekt
@@ -117,317 +175,2815 @@ class Prüfungsleistung:
         return {**daten_modul, **daten_prüfungsleistung} # Zusammenführen beider Dictionarys
 
 
+class Modul_Tabelle:
 
-# ============================== CSV-Klassen ============================
-
-class CSV_Controller:
     """
-    Verwaltet CSV-Dateien, zuständig für Speicherung von Studentendaten 
-    und abgeschlossenen Modulen. Nutzt Entity-Klassen und erzeugt passende CSV-Struktur.
+    Spaltenweise Darstellung vieler Module (statt je Modul ein Objekt mit Dictionarys).
+    Jede Spalte ist ein typisiertes numpy-Array:
+    - start, ende: Tage seit 01.01.1970 (int32)
+    - ects: uint8, tage: int32 (Tage-Spalte der CSV, bei neuen Zeilen ende - start)
+    - note_codes: Position in noten_werte (int8), noten_werte beginnt mit noten_schritte,
+      abweichende Noten werden hinten angefügt -> jede Note bleibt exakt erhalten
+    - namen: Modulnamen (object-Array)
+    Sortieren, Tage und Notensummen sind damit reine Array-Operationen.
     """
+    __slots__ = ("namen", "ects", "start", "ende", "note_codes", "noten_werte", "tage", "_ansicht", "_prüfsumme")
 
-    def __init__(self):
-        self.datei_student = "Student.csv"
-        self.datei_module = "Module_abgeschlossen.csv"
+    spalten = ["Modul", "ECTS", "Start", "Ende", "Note", "Tage"]
+    noten_schritte = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0]
 
-    def setze_student_csv(self, eingabe_name, eingabe_matrikelnummer, eingabe_studiengang, eingabe_abschluss, eingabe_datum_start):
+    def __init__(self, namen, ects, start, ende, noten, tage=None):
+        self.namen = np.asarray(namen, dtype=object)
+        ects = np.asarray(ects)
+        außerhalb = (ects < 0) | (ects > 255) # uint8 würde sonst still umbrechen
+        if außerhalb.any():
+            raise ValueError(f"Zeile {int(np.argmax(außerhalb)) + 1}: ECTS außerhalb 0-255")
+        self.ects = ects.astype(np.uint8)
+        self.start = np.asarray(start).astype(np.int32)
+        self.ende = np.asarray(ende).astype(np.int32)
+        self.tage = (self.ende - self.start) if tage is None else np.asarray(tage).astype(np.int32)
+
+        # Noten als Codes: bekannte Notenschritte zuerst, weitere Noten dahinter
+        noten = np.round(np.asarray(noten, dtype=float), 2)
+        sonstige = np.setdiff1d(noten, self.noten_schritte)
+        self.noten_werte = np.concatenate([self.noten_schritte, sonstige])
+        sortierung = np.argsort(self.noten_werte, kind="stable")
+        position = np.searchsorted(self.noten_werte, noten, sorter=sortierung)
+        self.note_codes = sortierung[position].astype(np.int8 if len(self.noten_werte) < 128 else np.int16)
+
+    @classmethod
+    def aus_dataframe(cls, module):
         """
-        Erstellt neue CSV-Datei mit Studentendaten mit nur einer Zeile.
-        Speichert Ausgabe der Entity-Klassen Student + Studiengang als CSV.
-        Überschreibt bei erneutem Aufruf den alten Eintrag.
+        Erstellt Tabelle aus DataFrame mit Spalten der Modul-CSV (Daten vektorisiert geparst).
         """
-        self.student = Student(eingabe_name, eingabe_matrikelnummer)
-        self.studium = Studiengang(self.student, eingabe_studiengang, eingabe_abschluss, eingabe_datum_start)
+        return cls(
+            module["Modul"].to_numpy(dtype=object),
+            module["ECTS"].to_numpy(),
+            Daten_Cache().datum_tage(module["Start"]).astype(np.int64),
+            Daten_Cache().datum_tage(module["Ende"]).astype(np.int64),
+            module["Note"].to_numpy(dtype=float),
+            module["Tage"].to_numpy()
+        )
 
-        spalten = ["Name", "Matrikelnummer", "Studiengang", "Abschluss", "Startdatum", "Enddatum"]
-        neue_zeile = self.studium.daten
+    @classmethod
+    def aus_zeilen(cls, zeilen, erste_zeile=1):
+        """
+        Erstellt Tabelle aus Dictionarys wie Prüfungsleistung.daten (Tage = ende - start).
+        Prüft alle Zeilen, ValueError nennt Zeilennummer (ab erste_zeile gezählt).
+        """
+        zeilen = list(zeilen)
+        for nummer, zeile in enumerate(zeilen, erste_zeile):
+            if not zeile.get("Modul"):
+                raise ValueError(f"Zeile {nummer}: Modulname fehlt")
+        try:
+            ects = np.array([int(zeile["ECTS"]) for zeile in zeilen], dtype=np.int64)
+            noten = np.array([float(zeile["Note"]) for zeile in zeilen], dtype=float)
+        except (KeyError, TypeError, ValueError) as fehler:
+            raise ValueError(f"Ungültige ECTS/Note im Stapel ab Zeile {erste_zeile}: {fehler}") from None
+        if ((ects < 0) | (ects > 255)).any():
+            raise ValueError(f"Zeile {erste_zeile + int(np.argmax((ects < 0) | (ects > 255)))}: ECTS außerhalb 0-255")
 
-        # CSV neu erstellen, wenn vorhanden überschreiben
-        with open(self.datei_student, mode="w", newline="", encoding="utf-8") as csv_1:
-            writer = csv.DictWriter(csv_1, fieldnames=spalten)
-            if csv_1.tell() == 0:
-                writer.writeheader()
-            writer.writerow(neue_zeile)
+        tabelle = Modul_Tabelle.__new__(Modul_Tabelle)
+        daten = {}
+        for spalte in ("Start", "Ende"):
+            texte = np.array([str(zeile.get(spalte, "")) for zeile in zeilen], dtype=str)
+            try:
+                tage = Daten_Cache().datum_tage(texte).astype(np.int64)
+            except ValueError as fehler:
+                raise ValueError(f"Ungültiges Datum in Spalte {spalte} im Stapel ab Zeile {erste_zeile}: {fehler}") from None
+            # schnelles Parsen prüft Ziffern nicht -> Rückumwandlung muss Eingabe ergeben
+            falsch = (np.char.str_len(texte) == 10) & (tabelle.datum_texte(tage) != texte)
+            if falsch.any():
+                position = int(np.argmax(falsch))
+                raise ValueError(f"Zeile {erste_zeile + position}: ungültiges Datum in Spalte {spalte}: {texte[position]}")
+            daten[spalte] = tage
 
-    def füge_modul_csv_hinzu(self, eingabe_name, eingabe_ects, eingabe_datum_start, eingabe_datum_prüfung, eingabe_note):
+        return cls([zeile["Modul"] for zeile in zeilen], ects, daten["Start"], daten["Ende"], noten)
+
+    def __len__(self):
+        return len(self.namen)
+
+    def noten(self):
         """
-        Fügt neuen Datensatz zu Modul und Prüfungsleistung in Modul-CSV ein.
-        Erzeugt Eintrag einer Zeile mit Entity-Klassen Modul + Prüfungsleistung.
-        Hängt Zeile an CSV an, sortiert diese anschließend nach Prüfungsdatum neu,
-        sodass Zeilen und Modulabschlüsse chronologisch geordnet sind.
-        (wichtig für spätere Diagramme)
+        Gibt Noten als float-Array zurück.
         """
-        self.modul = Modul(eingabe_name, eingabe_ects, eingabe_datum_start)
-        self.prüfungsleistung = Prüfungsleistung(self.modul, eingabe_datum_prüfung, eingabe_note)
+        return self.noten_werte[self.note_codes]
 
-        spalten = ["Modul", "ECTS", "Start", "Ende", "Note", "Tage"]
-        neue_zeile = self.prüfungsleistung.daten
+    def noten_hundertstel(self):
+        """
+        Gibt Noten in Hundertsteln (int64) zurück -> Summen ohne Rundungsdrift.
+        """
+        return np.rint(self.noten_werte * 100).astype(np.int64)[self.note_codes]
 
-        # Neue Zeile anhängen, wenn keine Datei vorhanden, neu erstellen
-        with open(self.datei_module, mode="a", newline="", encoding="utf-8") as csv_2:
-            writer = csv.DictWriter(csv_2, fieldnames=spalten)
-            if csv_2.tell() == 0:
-                writer.writeheader()
-            writer.writerow(neue_zeile)
+    def reihenfolge(self):
+        """
+        Gibt Positionen chronologisch nach Prüfungsdatum zurück (stabil bei gleichem Datum).
+        """
+        return np.argsort(self.ende, kind="stable")
 
-        # Datei neu sortieren nach Datum der Prüfung (Ende)
-        einträge = []
-        with open(self.datei_module, mode="r", encoding="utf-8") as csv_2:
-            reader = csv.DictReader(csv_2)
-            for zeile in reader:
-                einträge.append(zeile)
+    def auswahl(self, positionen):
+        """
+        Gibt neue Tabelle mit Zeilen an positionen zurück (Noten-Codes bleiben gültig).
+        """
+        tabelle = Modul_Tabelle.__new__(Modul_Tabelle)
+        for spalte in ("namen", "ects", "start", "ende", "note_codes", "tage"):
+            setattr(tabelle, spalte, getattr(self, spalte)[positionen])
+        tabelle.noten_werte = self.noten_werte
+        return tabelle
 
-        einträge.sort(key=lambda d: datetime.strptime(d["Ende"], "%d.%m.%Y"))
+    def datum_texte(self, tage):
+        """
+        Wandelt Tage seit 1970 vektorisiert in Texte "TT.MM.JJJJ" um
+        (Zeichen aus "JJJJ-MM-TT" umgestellt, kein strftime je Zeile).
+        """
+        iso = np.datetime_as_string(np.asarray(tage, dtype=np.int64).astype("datetime64[D]"), unit="D")
+        zeichen = iso.astype("U10").view("U1").reshape(-1, 10)[:, [8, 9, 4, 5, 6, 7, 0, 1, 2, 3]]
+        zeichen[:, [2, 5]] = "."
+        return np.ascontiguousarray(zeichen).view("U10").ravel()
 
-        with open(self.datei_module, mode="w", newline="", encoding="utf-8") as csv_2:
-            writer = csv.DictWriter(csv_2, fieldnames=spalten)
-            writer.writeheader()
-            writer.writerows(einträge)
+    def zeilen(self):
+        """
+        Gibt Zeilen als Listen in Reihenfolge der Spalten zurück (Werte wie in Modul-CSV).
+        """
+        return zip(self.namen.tolist(), self.ects.tolist(), self.datum_texte(self.start).tolist(),
+                   self.datum_texte(self.ende).tolist(), self.noten().tolist(), self.tage.tolist())
 
-    def lösche_modul_csv(self, suchwert):
+    def als_dataframe(self):
         """
-        Löscht alle Einträge aus Modul-CSV, deren Modulname exakt dem Suchwert entspricht.
+        Gibt Tabelle als DataFrame mit Spalten der Modul-CSV zurück.
         """
-        spalten = ["Modul", "ECTS", "Start", "Ende", "Note", "Tage"]
-        spalte = "Modul"
-        einträge = []
+        return pd.DataFrame({
+            "Modul": self.namen,
+            "ECTS": self.ects.astype(np.int64),
+            "Start": self.datum_texte(self.start),
+            "Ende": self.datum_texte(self.ende),
+            "Note": self.noten(),
+            "Tage": self.tage.astype(np.int64)
+        })
 
-        # Nur Einträge übernehmen, die nicht Suchwert entsprechen
-        with open(self.datei_module, mode="r", encoding="utf-8") as csv_2:
-            reader = csv.DictReader(csv_2)
-            for zeile in reader:
-                if zeile.get(spalte) != suchwert:
-                    einträge.append(zeile)
+    def ansicht(self):
+        """
+        Gibt Spalten Modul, Tage, Note als DataFrame zurück (Tabelle der GUI).
+        Einmal je Tabelle erstellt -> unveränderte Tabelle liefert dasselbe DataFrame.
+        """
+        if getattr(self, "_ansicht", None) is None:
+            self._ansicht = pd.DataFrame({"Modul": self.namen, "Tage": self.tage.astype(np.int64), "Note": self.noten()})
+        return self._ansicht
 
-        # Datei mit bereinigten Einträgen neu schreiben
-        with open(self.datei_module, mode="w", newline="", encoding="utf-8") as csv_2:
-            writer = csv.DictWriter(csv_2, fieldnames=spalten)
-            writer.writeheader()
-            writer.writerows(einträge)
+    def prüfsumme(self):
+        """
+        Gibt SHA-256 (hex) über Modulnamen, Tage und Noten zurück (Inhalt von ansicht),
+        aus den rohen Array-Bytes einmal je Tabelle berechnet.
+        """
+        if getattr(self, "_prüfsumme", None) is None:
+            prüfsumme = hashlib.sha256(np.asarray(self.namen, dtype=str).tobytes())
+            for werte in (self.tage.astype(np.int64), self.noten()):
+                prüfsumme.update(werte.tobytes())
+            self._prüfsumme = prüfsumme.hexdigest()
+        return self._prüfsumme
 
+    def nbytes(self):
+        """
+        Gibt Speicherbedarf in Bytes zurück (Arrays + Modulnamen).
+        """
+        arrays = sum(getattr(self, spalte).nbytes for spalte in ("namen", "ects", "start", "ende", "note_codes", "tage"))
+        return arrays + sum(sys.getsizeof(name) for name in self.namen)
 
 
-# ============================== Logik-Klasse ===========================
 
-class Plots_Berechnungen:
+# ============================== Speicher-Klassen =======================
+
+class Datei_Sperre:
     """
-    Berechnungs- und Visualisierungsklasse.
-    Verarbeitet CSV-Daten, erstellt statistische Auswertungen, Diagramme und Tabelle.
-    Nutzt pandas, numpy und matplotlib (via Figure, für später flexible Anpassbarkeit in GUI).
+    Beratende Sperre (advisory lock) einer Datei über Sperrdatei "<datei>.lock",
+    prozessübergreifend per fcntl.flock (Windows: msvcrt.locking), als Kontextmanager.
+    Innerhalb eines Prozesses wiedereintrittsfähig und zwischen Threads gesperrt
+    (RLock je Datei) -> verschachtelte Aufrufe (z. B. Komprimieren beim Einfügen) blockieren nicht.
+    Sperrdatei bleibt liegen (Löschen wäre zwischen Prozessen nicht sicher).
     """
 
-    def __init__(self):
-        self.read_student_csv = pd.read_csv("Student.csv")
-        self.read_module_csv = pd.read_csv("Module_abgeschlossen.csv")
-        
-        self.tage_vergangen = (datetime.today() - pd.to_datetime(self.read_student_csv.at[0, "Startdatum"], dayfirst=True)).days # berechnet vergangene Tage seit Studienstart
-        self.ects_summe = self.read_module_csv["ECTS"].sum() # summiert bisher gesammelte ECTS-Punkte
-        self.noten_schritte = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0] # legt Notenschitte in Diagrammachsen fest
+    _zustand = {} # Sperrdatei -> [RLock, Tiefe, Dateideskriptor]
+    _zustand_sperre = threading.Lock()
 
-    def zahl_mittelwert_noten(self):
+    def __init__(self, datei):
+        self.datei = os.path.abspath(datei) + ".lock"
+
+    def __enter__(self):
+        with self._zustand_sperre:
+            zustand = self._zustand.setdefault(self.datei, [threading.RLock(), 0, None])
+        zustand[0].acquire()
+        if zustand[1] == 0:
+            try:
+                zustand[2] = os.open(self.datei, os.O_RDWR | os.O_CREAT, 0o644)
+                self.sperre(zustand[2])
+            except BaseException:
+                if zustand[2] is not None:
+                    os.close(zustand[2])
+                    zustand[2] = None
+                zustand[0].release()
+                raise
+        zustand[1] += 1
+        return self
+
+    def __exit__(self, *fehler):
+        zustand = self._zustand[self.datei]
+        zustand[1] -= 1
+        if zustand[1] == 0:
+            self.entsperre(zustand[2])
+            os.close(zustand[2])
+            zustand[2] = None
+        zustand[0].release()
+
+    def sperre(self, deskriptor):
         """
-        Berechnet Mittelwert aller Noten aus CSV und rundet auf 2 Nachkommastellen.
+        Wartet auf exklusive Sperre der Sperrdatei.
         """
-        mittelwert = np.mean(self.read_module_csv["Note"])
-        return round(mittelwert, 2)
+        if fcntl is not None:
+            fcntl.flock(deskriptor, fcntl.LOCK_EX)
+            return
+        while True: # msvcrt wartet höchstens 10 s, danach OSError
+            try:
+                os.lseek(deskriptor, 0, os.SEEK_SET)
+                msvcrt.locking(deskriptor, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
 
-    def zahl_abweichung_zeitplan(self):
+    def entsperre(self, deskriptor):
         """
-        Berechnet:
-        - vergangene Tage seit Studienbeginn prozentual von Studiendauer 
-        - erreichte ECTS-Punkten prozentual von gesamten ECTS-Punkten
-        
-        Vergleicht beide prozentualen Werte und gibt Abweichung zum Zeitplan
-        in Tagen der Gesamtstudiendauer aus.
-        Gibt positive oder negative Abweichung in Tagen als Text zurück.
+        Gibt Sperre der Sperrdatei frei.
         """
-        self.fortschritt_zeit_prozentual = 100 / 1095 * self.tage_vergangen
-        self.fortschritt_ects_prozentual = 100 / 180 * self.ects_summe
-        
-        abweichung = int(np.floor((self.fortschritt_ects_prozentual - self.fortschritt_zeit_prozentual) / 100 * 1095))
-
-        if abweichung >= 0:
-            return f"{abweichung} Tage vor dem Zeitplan" # f-Str nötig bei Ausgabe Variablen
+        if fcntl is not None:
+            fcntl.flock(deskriptor, fcntl.LOCK_UN)
         else:
-            return f"{abweichung} Tage hinter dem Zeitplan"
+            os.lseek(deskriptor, 0, os.SEEK_SET)
+            msvcrt.locking(deskriptor, msvcrt.LK_UNLCK, 1)
+
+
+class Speicher(ABC):
+    """
+    Abstrakte Schnittstelle für Speicher-Backends von CSV_Controller und Plots_Berechnungen.
+    Schreibt Student- und Modulzeilen (Dictionarys der Entity-Klassen) und
+    liefert beide Bestände als DataFrame mit den Spalten der CSV-Dateien.
+    Module werden immer chronologisch nach Prüfungsdatum (Ende) geliefert.
+    kennung() benennt den Datenbestand, version() ändert sich bei jeder Änderung
+    der Daten (genutzt von Statistik_Engine zum Erkennen fremder Änderungen).
+    füge_modul_hinzu/lösche_modul geben (Version vorher, Version nachher) zurück, beide unter
+    Sperre unmittelbar vor/nach dem Commit gelesen, oder False, wenn die Änderung gemeinsam
+    mit anderen übernommen wurde (Statistik dann nicht schrittweise nachführen).
+    """
+
+    @abstractmethod
+    def kennung(self):
+        raise NotImplementedError
 
-    def plot_zeit_ects(self):
+    @abstractmethod
+    def version(self):
+        raise NotImplementedError
+
+    @staticmethod
+    def datei_version(*dateien):
         """
-        Erstellt horizontales Balkendiagramm mit:
-        - vergangenen Tage seit Studienbeginn prozentual von Studiendauer 
-        - erreichten ECTS-Punkten prozentual von gesamten ECTS-Punkten
+        Gibt Versionsschlüssel (mtime + Größe) mehrerer Dateien zurück, None für fehlende Datei.
         """
-        tage_insgesamt = 1095
-        ects_gesamt = 180
+        return tuple(Daten_Cache().schlüssel(datei) if os.path.exists(datei) else None for datei in dateien)
 
-        werte = np.clip([
-            (self.tage_vergangen / tage_insgesamt) * 100,
-            (self.ects_summe / ects_gesamt) * 100
-        ], 0, 100)
+    @abstractmethod
+    def setze_student(self, zeile):
+        raise NotImplementedError
 
-        labels = ["Zeit vergangen", "ECTS erreicht"]
+    @contextmanager
+    def schreibe_atomar(self, datei, zeit_ns=None, binär=False):
+        """
+        Gibt temporäre Datei neben datei zum Schreiben zurück (Text mit CSV-Zeilenenden oder
+        binär) und ersetzt datei danach per os.replace (nach fsync) -> Leser sehen alte oder
+        neue Datei, nie halbe, Absturz während Schreiben lässt alte Datei unverändert.
+        zeit_ns setzt mtime der neuen Datei.
+        """
+        temporär = f"{datei}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with (open(temporär, mode="wb") if binär else open(temporär, mode="w", newline="", encoding="utf-8")) as ausgabe:
+                yield ausgabe
+                ausgabe.flush()
+                os.fsync(ausgabe.fileno())
+            if zeit_ns is not None:
+                os.utime(temporär, ns=(zeit_ns, zeit_ns))
+            os.replace(temporär, datei)
+        finally:
+            if os.path.exists(temporär):
+                os.remove(temporär)
 
-        fig = Figure(figsize=(8, 1.5), dpi=90)
-        ax = fig.add_subplot(111)
-        ax.barh(labels, werte, color="black", alpha=0.8)
-        ax.set_xlim(0, 100)
-        ax.set_xlabel("Fortschritt in %")
-        ax.invert_yaxis()
-        fig.tight_layout()
+    @abstractmethod
+    def füge_modul_hinzu(self, zeile):
+        raise NotImplementedError
 
-        for i, v in enumerate(werte):
-            ax.text(v + 1, i, f"{v:.1f}%", va="center") # zeigt Prozentwerte an
+    @abstractmethod
+    def lösche_modul(self, suchwert):
+        raise NotImplementedError
 
-        return fig
+    @abstractmethod
+    def lese_student(self):
+        raise NotImplementedError
 
-    def plot_verteilung_noten(self):
+    @abstractmethod
+    def lese_module(self):
+        raise NotImplementedError
+
+    def lese_tabelle(self):
         """
-        Erstellt Histogramm der erreichten Noten (Häufigkeitsverteilung).
+        Gibt Module als Modul_Tabelle zurück (gleiche Reihenfolge wie lese_module).
         """
-        noten = self.read_module_csv["Note"]
-        häufigkeit = noten.value_counts().reindex(self.noten_schritte, fill_value=0) # zählt Noten nach Schrittwerten
+        return Modul_Tabelle.aus_dataframe(self.lese_module())
 
-        fig = Figure(figsize=(4, 4), dpi=90)
-        ax = fig.add_subplot(111)
-        ax.bar(häufigkeit.index.astype(str), häufigkeit.values, color="#468FD7")
-        ax.set_xlabel("Note")
-        ax.set_ylabel("Häufigkeit")
-        ax.set_xticklabels(häufigkeit.index.astype(str), rotation=45)
-        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
-        ax.grid(axis="y")
-        fig.tight_layout()
+    def importiere_module(self, stapel):
+        """
+        Fügt Module aus geprüften, sortierten Stapeln (Modul_Tabelle) hinzu.
+        Standard: erst alle Stapel prüfen (ValueError -> Bestand unverändert), dann zeilenweise
+        über füge_modul_hinzu (ein Commit je Zeile, Backends überschreiben für einen Commit).
+        Gibt Anzahl Module zurück.
+        """
+        stapel = list(stapel)
+        anzahl = 0
+        for tabelle in stapel:
+            for zeile in tabelle.zeilen():
+                self.füge_modul_hinzu(dict(zip(Modul_Tabelle.spalten, zeile)))
+            anzahl += len(tabelle)
+        return anzahl
 
-        return fig
 
-    def plot_verlauf_noten(self):
+class CSV_Speicher(Speicher):
+    """
+    Speicher-Backend auf Basis der CSV-Dateien Student.csv und Module_abgeschlossen.csv.
+    Module werden sortiert eingefügt, optional über Journal mit Löschvermerken.
+    Mehrere Prozesse dürfen gleichzeitig schreiben: jede Änderung läuft unter Datei_Sperre
+    der Modul-CSV. Chronologisch neue Zeilen werden angehängt (fsync, abgebrochenes Anhängen
+    wird beim Öffnen zurückgenommen), sonst Ersetzen per temporärer Datei + os.replace.
+    Einzelne Änderungen werden per Gruppen-Commit gesammelt übernommen (übernehme_änderung).
+    """
+
+    _journal_status = {} # Journaldatei -> (Schlüssel, lebende Einträge je Modulname, Anzahl toter Einträge)
+    _komprimierungen = {} # Journaldatei -> laufender Komprimierungs-Thread
+    _komprimierung_sperre = threading.Lock()
+    schwelle_komprimierung = 100 # ab so vielen toten Einträgen wird Journal in Modul-CSV zurückgeführt
+    stapel_größe = 100000 # Zeilen je sortiertem Lauf beim Import aus unsortiertem Bestand
+    max_läufe = 64 # höchstens gleichzeitig gemischte Läufe (offene Dateien)
+
+    def __init__(self, journal=False):
         """
-        Erstellt Liniendiagramm mit chronologischem Notenverlauf.
-        Zeigt tatsächliche Noten und gleitenden Durchschnitt.
+        journal=True aktiviert Journal-Modus: Hinzufügen und Löschen werden nur als
+        Datensatz an Journaldatei angehängt (O(1) je Änderung), Modul-CSV bleibt
+        bis zur Komprimierung unverändert.
         """
-        self.read_module_csv["Index"] = range(1, len(self.read_module_csv) + 1)
-        noten = self.read_module_csv["Note"]
-        durchschnitt_gleitend = noten.expanding().mean()
+        self.datei_student = "Student.csv"
+        self.datei_module = "Module_abgeschlossen.csv"
+        self.datei_journal = Daten_Cache().journal_datei(self.datei_module)
+        basis = os.path.splitext(self.datei_module)[0]
+        self.datei_warteschlange = basis + "_warteschlange.csv" # angehängte, noch nicht übernommene Änderungen
+        self.datei_stapel = basis + "_stapel.csv" # Warteschlange während eines Gruppen-Commits
+        self.datei_anhang = basis + "_anhang.pos" # Größe der Modul-CSV vor laufendem Anhängen
+        self.journal = journal
+        if self.braucht_wiederherstellung():
+            with Datei_Sperre(self.datei_module):
+                self.stelle_stapel_wieder_her()
 
-        fig = Figure(figsize=(4, 4), dpi=90)
-        ax = fig.add_subplot(111)
-        ax.plot(self.read_module_csv["Index"], noten, marker="o", label="Tatsächliche Note", color="black")
-        ax.plot(self.read_module_csv["Index"], durchschnitt_gleitend, linewidth=4, alpha=0.3, label="Gleitender Durchschnitt", color="#468FD7")
-        ax.set_xlabel("Modul (chronologisch)")
-        ax.set_ylabel("Note")
-        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
-        ax.set_yticks(self.noten_schritte)
-        ax.invert_yaxis()
-        ax.grid(True)
-        ax.legend()
-        fig.tight_layout()
+    def kennung(self):
+        return ("CSV", os.path.abspath(self.datei_module))
 
-        return fig
+    def version(self):
+        return self.datei_version(self.datei_student, self.datei_module, self.datei_journal)
 
-    def plot_dauer_modul_semester(self):
+    def lese_student(self):
         """
-        Erstellt Balkendiagramm durchschnittlicher Bearbeitungstage für ein 
-        Modul je Semester.
+        Gibt Student.csv als DataFrame aus gemeinsamem Daten_Cache zurück.
+        """
+        return Daten_Cache().lese_csv(self.datei_student)
 
-        Semester wird aus Differenz Tage zum Studienstart (alle 182 Tage) berechnet.
-        Jedem Modul wird anhand seines Startdatums das jeweilige Semester zugeordnet.
-        """ 
-        
-        # Liest "Studienstart" in Student.csv, konvertiert in datetime
-        studium_start = datetime.strptime(self.read_student_csv["Startdatum"][0], "%d.%m.%Y")
-        
-        # Liest "Start" in Module_abgeschlossen.csv, konvertiert in datetime
-        self.read_module_csv["Start"] = pd.to_datetime(self.read_module_csv["Start"], format="%d.%m.%Y")
-        
-        # ordnet jedem Modul in Module_abgeschlossen.csv ein Semester über fiktive Spalte "Semester" zu
-        # Spalte "Semester" erscheint nicht real in CSV
-        self.read_module_csv["Semester"] = ((self.read_module_csv["Start"] - studium_start).dt.days // 182) + 1
+    def lese_module(self):
+        """
+        Gibt Module (inkl. offener Journal-Einträge) als DataFrame aus Daten_Cache zurück.
+        """
+        return Daten_Cache().lese_module(self.datei_module)
 
-        # gruppiert alle Module in deren Semester und berechnet Gruppen-Durchschnitt
-        durchschnitt = self.read_module_csv.groupby("Semester")["Tage"].mean()
+    def lese_tabelle(self):
+        """
+        Gibt Module als Modul_Tabelle aus Daten_Cache zurück.
+        """
+        return Daten_Cache().lese_tabelle(self.datei_module)
 
-        fig = Figure(figsize=(2, 7), dpi=90)
-        ax = fig.add_subplot(111)
-        ax.bar(durchschnitt.index, durchschnitt.values, color="#468FD7", width=0.6)
-        ax.set_xlabel("Semester")
-        ax.set_ylabel("Durchschn. Bearbeitungstage pro Modul je Semester")
-        ax.set_xticks(durchschnitt.index)
-        ax.grid(axis="y")
-        fig.tight_layout()
+    def setze_student(self, neue_zeile):
+        """
+        Erstellt neue CSV-Datei mit Studentendaten mit nur einer Zeile.
+        Überschreibt bei erneutem Aufruf den alten Eintrag.
+        """
+        spalten = ["Name", "Matrikelnummer", "Studiengang", "Abschluss", "Startdatum", "Enddatum"]
 
-        return fig
+        # CSV neu erstellen, wenn vorhanden überschreiben (atomar, unter Sperre)
+        with Datei_Sperre(self.datei_student), self.schreibe_atomar(self.datei_student) as csv_1:
+            writer = csv.DictWriter(csv_1, fieldnames=spalten)
+            writer.writeheader()
+            writer.writerow(neue_zeile)
 
-    def tabelle_module(self):
+    def füge_modul_hinzu(self, neue_zeile):
         """
-        Erstellt Tabelle mit Modulen, Noten und Bearbeitungstagen.
-        Zeigt nur relevante Spalten aus Modul-CSV.
+        Fügt Zeile aus Modul + Prüfungsleistung in Modul-CSV ein.
+        Zeile wird an passender Stelle nach Prüfungsdatum (Ende) eingefügt,
+        sodass Zeilen und Modulabschlüsse chronologisch geordnet bleiben.
+        (wichtig für spätere Diagramme)
+        Übernahme per Gruppen-Commit mit gleichzeitigen Änderungen anderer Schreiber.
         """
-        module_csv_kurz = self.read_module_csv[["Modul", "Tage", "Note"]]
+        if self.journal:
+            return self.schreibe_journal("+", neue_zeile)
+        return self.übernehme_änderung("+", neue_zeile)
 
-        fig = Figure(figsize=(3, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.axis('off')
+    def übernehme_änderung(self, aktion, zeile):
+        """
+        Gruppen-Commit: Änderung wird (kurz gesperrt) an Warteschlange angehängt. Wer eine neue
+        Warteschlange beginnt, führt diese Gruppe an: wartet auf Sperre der Modul-CSV und übernimmt
+        alle bis dahin angehängten Änderungen (auch anderer Prozesse) in einem Umschreiben.
+        Übrige Schreiber der Gruppe warten (geteilte flock-Sperre auf Warteschlange) nur, bis ihre
+        Gruppe übernommen ist -> ein Umschreiben je Gruppe statt je Änderung.
+        Ohne fcntl (Windows) warten alle auf Sperre der Modul-CSV, dort übernimmt der Erste.
+        Rückgabe erst, wenn Änderung in Modul-CSV steht. Gibt Versionen vor/nach dem Commit
+        zurück, wenn der Commit nur diese Änderung enthielt, sonst False.
+        """
+        gruppe = None # Deskriptor der Warteschlange, in die Änderung eingereiht wurde
+        with Datei_Sperre(self.datei_warteschlange):
+            anführer = self.hänge_an(self.datei_warteschlange, aktion, zeile)
+            eingereiht = os.stat(self.datei_warteschlange)
+            if fcntl is not None:
+                gruppe = os.open(self.datei_warteschlange, os.O_RDONLY)
+                if anführer:
+                    fcntl.flock(gruppe, fcntl.LOCK_EX) # neue Datei -> sofort frei
+        try:
+            if gruppe is not None and not anführer:
+                fcntl.flock(gruppe, fcntl.LOCK_SH) # frei, sobald Anführer fertig (oder abgestürzt) ist
+                if os.fstat(gruppe).st_nlink == 0:
+                    return False # Gruppe übernommen, Stapel gelöscht
+            return self.übernehme_warteschlange(eingereiht)
+        finally:
+            if gruppe is not None:
+                os.close(gruppe)
 
-        table = ax.table(
-            cellText=module_csv_kurz.values,
-            colLabels=module_csv_kurz.columns,
-            loc='center',
-            cellLoc='center'
-        )
+    def übernehme_warteschlange(self, eingereiht=None):
+        """
+        Übernimmt Warteschlange unter Sperre der Modul-CSV als Stapel in Modul-CSV.
+        Gibt (Version vorher, Version nachher) zurück, wenn Stapel genau eine Änderung aus
+        Warteschlange eingereiht enthielt, sonst False.
+        """
+        with Datei_Sperre(self.datei_module):
+            self.stelle_stapel_wieder_her()
+            if os.path.exists(self.datei_journal):
+                self.komprimiere_journal() # offene Journal-Einträge zuerst in Modul-CSV übernehmen
 
-        # passt Spaltenbreite automatisch an und segt Schriftgröße fest
-        table.auto_set_column_width(col=list(range(len(module_csv_kurz.columns))))
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        fig.tight_layout()
+            with Datei_Sperre(self.datei_warteschlange):
+                if not os.path.exists(self.datei_warteschlange):
+                    return False # bereits von anderem Schreiber übernommen
+                eigene = eingereiht is not None and os.path.samestat(eingereiht, os.stat(self.datei_warteschlange))
+                # Zeitmarke: Modul-CSV erhält mtime des Stapels -> nach Absturz erkennbar, ob übernommen
+                zeit_ns = time.time_ns()
+                os.utime(self.datei_warteschlange, ns=(zeit_ns, zeit_ns))
+                os.replace(self.datei_warteschlange, self.datei_stapel)
+            vorher = self.version() # Stand unmittelbar vor dem Commit (inkl. fremder Commits)
+            anzahl = self.wende_journal_an(self.datei_stapel, zeit_ns)
+            os.remove(self.datei_stapel)
+            return (vorher, self.version()) if eigene and anzahl == 1 else False
 
-        return fig
+    def braucht_wiederherstellung(self):
+        """
+        Prüft ohne Sperre, ob ein Schreiber abgebrochen ist (Stapel, Anhang-Marke oder
+        angerissene letzte Zeile der Modul-CSV).
+        """
+        if os.path.exists(self.datei_stapel) or os.path.exists(self.datei_anhang):
+            return True
+        if not os.path.exists(self.datei_module) or os.path.getsize(self.datei_module) == 0:
+            return False
+        with open(self.datei_module, mode="rb") as csv_2:
+            csv_2.seek(-1, os.SEEK_END)
+            return csv_2.read(1) != b"\n"
 
+    def stelle_stapel_wieder_her(self):
+        """
+        Macht abgebrochenes Anhängen rückgängig (Modul-CSV auf Größe aus Anhang-Marke kürzen)
+        bzw. kürzt angerissene letzte Zeile. Übernimmt danach Stapel eines abgebrochenen
+        Gruppen-Commits (Absturz des Schreibers), außer Modul-CSV trägt bereits dessen Zeitmarke.
+        Nur unter Sperre der Modul-CSV aufrufen.
+        """
+        abgebrochen = False
+        if os.path.exists(self.datei_anhang):
+            with open(self.datei_anhang, mode="r", encoding="utf-8") as marke:
+                größe = marke.read()
+            abgebrochen = bool(größe) # leere Marke -> Anhängen hatte noch nicht begonnen
+            if abgebrochen:
+                os.truncate(self.datei_module, int(größe))
+            os.remove(self.datei_anhang)
+        self.kürze_angerissene_zeile()
 
+        if not os.path.exists(self.datei_stapel):
+            return
+        zeit_ns = os.stat(self.datei_stapel).st_mtime_ns
+        if abgebrochen or not os.path.exists(self.datei_module) or os.stat(self.datei_module).st_mtime_ns < zeit_ns:
+            self.wende_journal_an(self.datei_stapel, zeit_ns)
+        os.remove(self.datei_stapel)
 
-# ============================== GUI-Klasse ============================== 
+    def kürze_angerissene_zeile(self):
+        """
+        Kürzt Modul-CSV hinter dem letzten Zeilenende (unvollständige letzte Zeile nach Absturz
+        während Anhängen). Nur unter Sperre der Modul-CSV aufrufen.
+        """
+        if not os.path.exists(self.datei_module):
+            return
+        with open(self.datei_module, mode="r+b") as csv_2:
+            ende = csv_2.seek(0, os.SEEK_END)
+            position = ende
+            while position > 0:
+                anfang = max(0, position - 4096)
+                csv_2.seek(anfang)
+                block = csv_2.read(position - anfang)
+                if position == ende and block.endswith(b"\n"):
+                    return
+                zeilenende = block.rfind(b"\n")
+                if zeilenende >= 0:
+                    position = anfang + zeilenende + 1
+                    break
+                position = anfang
+            csv_2.truncate(position)
+            csv_2.flush()
+            os.fsync(csv_2.fileno())
 
-class GUI_Controller:
-    """
-    Controller-Klasse für grafische Benutzeroberfläche (GUI).
-    Organisiert Aufbau, Inhalte, Interaktion und Button-Logik mit tkinter.
-    """
+    def hänge_an(self, datei, aktion, zeile):
+        """
+        Hängt Datensatz im Journal-Format (Aktion + Modulspalten) an datei an, Kopfzeile bei neuer Datei.
+        Gibt True zurück, wenn Datei neu begonnen wurde.
+        """
+        spalten = ["Aktion", "Modul", "ECTS", "Start", "Ende", "Note", "Tage"]
+        with open(datei, mode="a", newline="", encoding="utf-8") as csv_3:
+            writer = csv.DictWriter(csv_3, fieldnames=spalten)
+            neu = csv_3.tell() == 0
+            if neu:
+                writer.writeheader()
+            writer.writerow({"Aktion": aktion, **zeile})
+        return neu
 
-    def __init__(self):
+    def datum_zahl(self, datum):
         """
-        Initialisiert Hauptfenster und führt sofort Layout- und Inhalt aus.
-        Mainloop startet direkt nach GUI-Erstellung.
+        Wandelt Datum "TT.MM.JJJJ" in sortierbare Zahl JJJJMMTT um.
+        (deutlich schneller als datetime.strptime je Zeile)
         """
-        self.root = tk.Tk()
-        self.fenster()
-        self.container_inhalt()
-        self.container_interaktion()
-        self.buttons()
-        self.root.mainloop()
+        tag, monat, jahr = datum.split(".")
+        return int(jahr) * 10000 + int(monat) * 100 + int(tag)
 
-    def fenster(self):
+    def sortiere_modul_csv(self):
         """
-        Erstellt Fenster, setzt Titel aus Studentendaten.
-        Legt Rasterstruktur (Grid), Ränder und Containerbereiche fest.
+        Liest gesamte Modul-CSV ein, sortiert nach Prüfungsdatum (Ende) und schreibt sie neu.
+        Nur nötig, wenn Datei nicht bereits sortiert vorliegt.
         """
-        df = pd.read_csv("Student.csv")
-        name = df.at[0, "Name"]
-        studiengang = df.at[0, "Studiengang"]
-        abschluss = df.at[0, "Abschluss"]
-        titel = f"Dashboard Studium: {name} - {studiengang}, {abschluss}"
+        spalten = ["Modul", "ECTS", "Start", "Ende", "Note", "Tage"]
+        with open(self.datei_module, mode="r", encoding="utf-8") as csv_2:
+            einträge = list(csv.DictReader(csv_2))
 
-        self.root.title(titel)
-        self.root.geometry("1200x800")
+        # Prüfungsdaten einmal vektorisiert parsen, Sortierung als Array-Operation (stabil)
+        ende = Daten_Cache().datum_tage([zeile["Ende"] for zeile in einträge])
+        einträge = [einträge[position] for position in np.argsort(ende, kind="stable")]
 
-        # Fenster am Raster unterteilt für anpassbares Layout
-        for i in range(20):
-            self.root.grid_rowconfigure(i, weight=1)
-        for j in range(30):
-            self.root.grid_columnconfigure(j, weight=1)
+        with self.schreibe_atomar(self.datei_module) as csv_2:
+            writer = csv.DictWriter(csv_2, fieldnames=spalten)
+            writer.writeheader()
+            writer.writerows(einträge)
 
-        # Randfelder, feste Größe, farblos
-        self.leer_links = tk.Frame(self.root, width=30)
-        self.leer_rechts = tk.Frame(self.root, width=30)
-        self.leer_oben = tk.Frame(self.root, height=30)
+    def importiere_module(self, stapel):
+        """
+        Fügt viele Module in einem Durchgang ein (statt je Modul Einfügen mit Umschreiben).
+        stapel: geprüfte, nach Prüfungsdatum sortierte Modul_Tabellen (CSV_Controller.stapel).
+        - ein Stapel: wird direkt aus Speicher mit bestehender Modul-CSV gemischt
+        - mehrere Stapel: jeder wird als sortierter Lauf in temporäre Datei geschrieben,
+          danach Mischen aller Läufe (externes Merge-Sort, höchstens max_läufe Dateien
+          gleichzeitig offen) -> Speicherbedarf begrenzt auf einen Stapel
+        Unsortierte bestehende Modul-CSV wird ebenfalls in Läufe zerlegt.
+        Bei gleichem Prüfungsdatum stehen bestehende Zeilen vor neuen (wie Einzeleinfügen).
+        Ergebnis wird in temporäre Datei geschrieben und per os.replace übernommen.
+        Gibt Anzahl importierter Module zurück.
+        """
+        with Datei_Sperre(self.datei_module):
+            self.stelle_stapel_wieder_her()
+            if os.path.exists(self.datei_journal):
+                self.komprimiere_journal() # offene Journal-Einträge zuerst in Modul-CSV übernehmen
+
+            ordner = tempfile.mkdtemp(prefix="import_", dir=os.path.dirname(os.path.abspath(self.datei_module)))
+            try:
+                # Quellen in Reihenfolge Bestand -> Import (bei gleichem Datum Bestand zuerst)
+                läufe = []
+                if os.path.exists(self.datei_module) and os.path.getsize(self.datei_module) > 0:
+                    if self.ist_sortiert():
+                        läufe.append(self.datei_module)
+                    else:
+                        for zeilen in self.stapel_bestand():
+                            läufe.append(self.schreibe_lauf(ordner, f"bestand_{len(läufe)}", zeilen))
+
+                anzahl = 0
+                im_speicher = None # letzter Stapel bleibt im Speicher, falls er der einzige ist
+                for nummer, tabelle in enumerate(stapel):
+                    if im_speicher is not None:
+                        läufe.append(self.schreibe_lauf(ordner, f"import_{nummer}", im_speicher.zeilen()))
+                    im_speicher = tabelle
+                    anzahl += len(tabelle)
+                if anzahl == 0:
+                    return 0
+
+                quellen = [self.lese_zeilen(lauf) for lauf in läufe] + [list(im_speicher.zeilen())]
+                quellen = self.verdichte_läufe(ordner, quellen)
+
+                with self.schreibe_atomar(self.datei_module) as csv_neu:
+                    writer = csv.writer(csv_neu)
+                    writer.writerow(Modul_Tabelle.spalten)
+                    writer.writerows(heapq.merge(*quellen, key=self.ende_zahl))
+                return anzahl
+            finally:
+                shutil.rmtree(ordner, ignore_errors=True)
+
+    def ende_zahl(self, zeile):
+        """
+        Gibt Sortierschlüssel (JJJJMMTT) einer Zeile als Liste in Spaltenreihenfolge zurück.
+        """
+        return self.datum_zahl(zeile[3])
+
+    def ist_sortiert(self):
+        """
+        Prüft in einem Durchlauf (ohne alles zu laden), ob Modul-CSV nach Prüfungsdatum sortiert ist.
+        """
+        vorher = 0
+        for zeile in self.lese_zeilen(self.datei_module):
+            aktuell = self.ende_zahl(zeile)
+            if aktuell < vorher:
+                return False
+            vorher = aktuell
+        return True
+
+    def lese_zeilen(self, datei):
+        """
+        Liest CSV-Datei zeilenweise als Listen in Spaltenreihenfolge (Kopfzeile bestimmt Positionen).
+        """
+        with open(datei, mode="r", newline="", encoding="utf-8") as csv_datei:
+            reader = csv.reader(csv_datei)
+            kopf = next(reader, None)
+            if kopf is None:
+                return
+            positionen = [kopf.index(spalte) for spalte in Modul_Tabelle.spalten]
+            for zeile in reader:
+                if zeile:
+                    yield [zeile[position] for position in positionen]
+
+    def stapel_bestand(self):
+        """
+        Gibt unsortierte Modul-CSV in sortierten Stapeln (Listen von Zeilen) zurück.
+        """
+        zeilen = self.lese_zeilen(self.datei_module)
+        while True:
+            stapel = list(islice(zeilen, self.stapel_größe))
+            if not stapel:
+                return
+            stapel.sort(key=self.ende_zahl) # stabil -> Dateireihenfolge bei gleichem Datum bleibt
+            yield stapel
+
+    def schreibe_lauf(self, ordner, name, zeilen):
+        """
+        Schreibt sortierten Lauf als CSV (mit Kopfzeile) in temporären Ordner und gibt Dateinamen zurück.
+        """
+        datei = os.path.join(ordner, f"lauf_{name}.csv")
+        with open(datei, mode="w", newline="", encoding="utf-8") as csv_lauf:
+            writer = csv.writer(csv_lauf)
+            writer.writerow(Modul_Tabelle.spalten)
+            writer.writerows(zeilen)
+        return datei
+
+    def verdichte_läufe(self, ordner, quellen):
+        """
+        Mischt benachbarte Läufe in Gruppen zu je max_läufe, bis höchstens max_läufe Quellen
+        übrig sind (begrenzt gleichzeitig offene Dateien). Reihenfolge der Quellen bleibt erhalten.
+        """
+        nummer = 0
+        while len(quellen) > self.max_läufe:
+            neue_quellen = []
+            for position in range(0, len(quellen), self.max_läufe):
+                gruppe = quellen[position:position + self.max_läufe]
+                datei = self.schreibe_lauf(ordner, f"verdichtet_{nummer}", heapq.merge(*gruppe, key=self.ende_zahl))
+                neue_quellen.append(self.lese_zeilen(datei))
+                nummer += 1
+            quellen = neue_quellen
+        return quellen
+
+    def lösche_modul(self, suchwert):
+        """
+        Löscht alle Einträge aus Modul-CSV, deren Modulname exakt dem Suchwert entspricht.
+        Im Journal-Modus wird nur ein Löschvermerk (Tombstone) angehängt,
+        sonst Übernahme per Gruppen-Commit (übernehme_änderung).
+        """
+        if self.journal:
+            return self.schreibe_journal("-", {"Modul": suchwert})
+        return self.übernehme_änderung("-", {"Modul": suchwert})
+
+    def schreibe_journal(self, aktion, zeile):
+        """
+        Hängt Datensatz an Journal an: Aktion "+" (Modul hinzugefügt) oder
+        "-" (Löschvermerk für alle bisherigen Einträge mit diesem Modulnamen).
+        Gibt Versionen vor/nach dem Anhängen (unter Sperre gelesen) zurück.
+        Führt Zähler lebender/toter Einträge nach und startet Komprimierung im
+        Hintergrund (starte_komprimierung), sobald schwelle_komprimierung überschritten ist.
+        """
+        with Datei_Sperre(self.datei_module):
+            lebende, tote = self.journal_zähler()
+            vorher = self.version()
+            self.hänge_an(self.datei_journal, aktion, zeile)
+            versionen = (vorher, self.version())
+
+            if aktion == "+":
+                lebende[zeile["Modul"]] += 1
+            else:
+                tote += 1 + lebende.pop(zeile["Modul"], 0) # Löschvermerk selbst + gelöschte Einträge
+            self._journal_status[self.datei_journal] = (Daten_Cache().schlüssel(self.datei_journal), lebende, tote)
+
+        if tote > self.schwelle_komprimierung:
+            self.starte_komprimierung()
+        return versionen
+
+    def starte_komprimierung(self):
+        """
+        Startet komprimiere_journal in Daemon-Thread, höchstens einen je Journal gleichzeitig
+        (weitere Änderungen während laufender Komprimierung starten keinen neuen Thread).
+        Bei Programmende wird auf laufende Komprimierungen gewartet (warte_komprimierungen).
+        """
+        with self._komprimierung_sperre:
+            thread = self._komprimierungen.get(self.datei_journal)
+            if thread is not None and thread.is_alive():
+                return
+            if not self._komprimierungen:
+                atexit.register(CSV_Speicher.warte_komprimierungen)
+            thread = threading.Thread(target=self.komprimiere_journal, name="Komprimierung", daemon=True)
+            self._komprimierungen[self.datei_journal] = thread
+            thread.start()
+
+    @classmethod
+    def warte_komprimierungen(cls):
+        """
+        Wartet auf alle laufenden Komprimierungs-Threads.
+        """
+        with cls._komprimierung_sperre:
+            threads = list(cls._komprimierungen.values())
+        for thread in threads:
+            thread.join()
+
+    def journal_zähler(self):
+        """
+        Gibt (lebende Einträge je Modulname, Anzahl toter Einträge) für Modul-CSV + Journal zurück.
+        Wird einmal durch Abspielen aufgebaut und danach bei jedem Journal-Eintrag nachgeführt.
+        """
+        schlüssel = Daten_Cache().schlüssel(self.datei_journal) if os.path.exists(self.datei_journal) else None
+        eintrag = self._journal_status.get(self.datei_journal)
+        if eintrag is not None and eintrag[0] == schlüssel:
+            return eintrag[1], eintrag[2]
+
+        lebende = Counter()
+        tote = 0
+        if os.path.exists(self.datei_module):
+            with open(self.datei_module, mode="r", encoding="utf-8") as csv_2:
+                lebende.update(zeile["Modul"] for zeile in csv.DictReader(csv_2))
+        if schlüssel is not None:
+            with open(self.datei_journal, mode="r", encoding="utf-8") as csv_3:
+                for zeile in csv.DictReader(csv_3):
+                    if zeile["Aktion"] == "+":
+                        lebende[zeile["Modul"]] += 1
+                    else:
+                        tote += 1 + lebende.pop(zeile["Modul"], 0)
+        return lebende, tote
+
+    def komprimiere_journal(self):
+        """
+        Führt Journal in saubere, nach Prüfungsdatum sortierte Modul-CSV zurück
+        und entfernt Journal anschließend.
+        """
+        with Datei_Sperre(self.datei_module):
+            self.stelle_stapel_wieder_her()
+            if not os.path.exists(self.datei_journal):
+                return
+            self.wende_journal_an(self.datei_journal)
+            os.remove(self.datei_journal)
+            self._journal_status.pop(self.datei_journal, None)
+
+    def wende_journal_an(self, datei, zeit_ns=None):
+        """
+        Übernimmt Datensätze im Journal-Format (Journal, Stapel eines Gruppen-Commits) in Modul-CSV.
+        Modul-CSV ist bereits sortiert und wird nur einmal durchlaufen, überlebende
+        Einträge werden sortiert und beim Schreiben eingemischt. Ohne Löschungen und mit
+        Einträgen nicht vor der letzten Zeile wird nur angehängt (hänge_chronologisch_an).
+        Neue Modul-CSV wird in temporäre Datei geschrieben und per os.replace übernommen
+        (zeit_ns: mtime der neuen Modul-CSV). Gibt Anzahl Datensätze zurück.
+        Nur unter Sperre der Modul-CSV aufrufen.
+        """
+        spalten = ["Modul", "ECTS", "Start", "Ende", "Note", "Tage"]
+
+        # Journal abspielen: Löschvermerk entfernt alle vorherigen Einträge gleichen Namens
+        with open(datei, mode="r", encoding="utf-8") as csv_3:
+            einträge = list(csv.DictReader(csv_3))
+        letzte_löschung = {zeile["Modul"]: position for position, zeile in enumerate(einträge) if zeile["Aktion"] == "-"}
+        neue = [
+            {spalte: zeile[spalte] for spalte in spalten}
+            for position, zeile in enumerate(einträge)
+            if zeile["Aktion"] == "+" and position > letzte_löschung.get(zeile["Modul"], -1)
+        ]
+        neue.sort(key=lambda d: self.datum_zahl(d["Ende"]))
+        if not letzte_löschung and self.hänge_chronologisch_an(neue, zeit_ns):
+            return len(einträge)
+        if self.füge_schnell_ein(neue, list(letzte_löschung), zeit_ns):
+            return len(einträge)
+
+        sortiert = [True, 0] # [noch sortiert, letztes Datum] -> unsortierten Bestand erkennen
+        def prüfe(zeile):
+            datum = self.datum_zahl(zeile["Ende"])
+            sortiert[0] = sortiert[0] and datum >= sortiert[1]
+            sortiert[1] = datum
+            return zeile
+
+        with self.schreibe_atomar(self.datei_module, zeit_ns) as csv_neu:
+            writer = csv.DictWriter(csv_neu, fieldnames=spalten)
+            writer.writeheader()
+            if os.path.exists(self.datei_module):
+                with open(self.datei_module, mode="r", encoding="utf-8") as csv_2:
+                    bestand = (zeile for zeile in csv.DictReader(csv_2) if zeile["Modul"] not in letzte_löschung)
+                    # Bestand vor Journal bei gleichem Datum -> wie stabile Sortierung
+                    writer.writerows(map(prüfe, heapq.merge(bestand, neue, key=lambda d: self.datum_zahl(d["Ende"]))))
+            else:
+                writer.writerows(neue)
+        if not sortiert[0]: # Bestand war nicht sortiert -> einmalig komplett sortieren
+            self.sortiere_modul_csv()
+            if zeit_ns is not None:
+                os.utime(self.datei_module, ns=(zeit_ns, zeit_ns))
+        return len(einträge)
+
+    def hänge_chronologisch_an(self, neue, zeit_ns=None):
+        """
+        Häufiger Fall: keine neue Zeile liegt vor der letzten Zeile der (sortierten) Modul-CSV
+        -> nur anhängen + fsync statt Umschreiben, gelesen wird nur Kopf- und letzte Zeile.
+        Während des Anhängens steht vorherige Dateigröße in datei_anhang, damit
+        stelle_stapel_wieder_her abgebrochenes Anhängen rückgängig macht.
+        Gibt False zurück, wenn Datei dafür nicht geeignet ist (dann Umschreiben).
+        """
+        if not neue or not os.path.exists(self.datei_module):
+            return False
+        with open(self.datei_module, mode="rb") as csv_2:
+            kopfzeile = csv_2.readline()
+            größe = csv_2.seek(0, os.SEEK_END)
+            anfang = max(len(kopfzeile), größe - 4096)
+            csv_2.seek(anfang)
+            ende = csv_2.read()
+        if not kopfzeile.endswith(b"\n") or (ende and not ende.endswith(b"\n")):
+            return False
+        kopf = next(csv.reader([kopfzeile.decode("utf-8")]))
+        if sorted(kopf) != sorted(neue[0]):
+            return False
+        if ende:
+            zeilen = ende[:-1].split(b"\n")
+            if len(zeilen) == 1 and anfang > len(kopfzeile):
+                return False # letzte Zeile länger als gelesener Block
+            letzte = zeilen[-1].rstrip(b"\r")
+            felder = letzte.decode("utf-8").split(",")
+            if b'"' in letzte or len(felder) != len(kopf) or len(felder[kopf.index("Ende")]) != 10:
+                return False
+            if self.datum_zahl(neue[0]["Ende"]) < self.datum_zahl(felder[kopf.index("Ende")]):
+                return False
+
+        with open(self.datei_anhang, mode="w", encoding="utf-8") as marke:
+            marke.write(str(größe))
+        with open(self.datei_module, mode="a", newline="", encoding="utf-8") as csv_2:
+            csv.DictWriter(csv_2, fieldnames=kopf).writerows(neue)
+            csv_2.flush()
+            os.fsync(csv_2.fileno())
+        if zeit_ns is not None:
+            os.utime(self.datei_module, ns=(zeit_ns, zeit_ns))
+        os.remove(self.datei_anhang)
+        return True
+
+    def füge_schnell_ein(self, neue, gelöscht=(), zeit_ns=None):
+        """
+        Schneller Weg: Modul-CSV wird als Bytes gelesen, Prüfungsdaten aller Zeilen vektorisiert
+        bestimmt (ohne Anführungszeichen hat jede Zeile gleich viele Kommas), Einfügepositionen
+        per np.searchsorted. Zeilen, deren Feld "Modul" bytegenau einem Namen aus gelöscht
+        entspricht, entfallen. Neue Datei aus Byte-Abschnitten + neuen Zeilen (temporäre Datei
+        + os.replace). Gibt False zurück, wenn Datei dafür nicht geeignet ist (Anführungszeichen,
+        unsortiert, ...).
+        """
+        if not (neue or gelöscht) or not os.path.exists(self.datei_module):
+            return False
+        with open(self.datei_module, mode="rb") as csv_2:
+            daten = csv_2.read()
+        if b'"' in daten or not daten.endswith(b"\n"):
+            return False
+        kopf_ende = daten.index(b"\n") + 1
+        kopf = next(csv.reader([daten[:kopf_ende].decode("utf-8")]))
+        if sorted(kopf) != sorted(neue[0] if neue else Modul_Tabelle.spalten):
+            return False
+
+        # Zeilenenden und Kommas je Zeile -> Anfang des Felds "Ende" (immer "TT.MM.JJJJ")
+        zeichen = np.frombuffer(daten, dtype=np.uint8)
+        zeilenenden = np.flatnonzero(zeichen == ord("\n"))
+        anzahl = len(zeilenenden) - 1
+        kommas = np.flatnonzero(zeichen[kopf_ende:] == ord(",")) + kopf_ende
+        if len(kommas) != anzahl * (len(kopf) - 1):
+            return False
+        kommas = kommas.reshape(anzahl, len(kopf) - 1)
+        if anzahl and ((kommas[:, 0] <= zeilenenden[:-1]).any() or (kommas[:, -1] >= zeilenenden[1:]).any()):
+            return False
+
+        def feld(name):
+            """
+            Gibt Anfang und Ende (exklusiv) eines Felds in jeder Zeile als Byte-Positionen zurück.
+            """
+            spalte = kopf.index(name)
+            anfang = zeilenenden[:-1] + 1 if spalte == 0 else kommas[:, spalte - 1] + 1
+            ende = kommas[:, spalte] if spalte < len(kopf) - 1 else zeilenenden[1:] - (zeichen[zeilenenden[1:] - 1] == ord("\r"))
+            return anfang, ende
+
+        anfang, ende = feld("Ende")
+        if ((ende - anfang) != 10).any():
+            return False
+        ziffern = zeichen[anfang[:, None] + np.array([0, 1, 3, 4, 6, 7, 8, 9])].astype(np.int64) - ord("0")
+        bestand = ziffern @ np.array([10, 1, 1000, 100, 10000000, 1000000, 100000, 10000]) # JJJJMMTT
+        if (np.diff(bestand) < 0).any():
+            return False
+
+        # Löschen: Feld "Modul" je Name nur in Zeilen gleicher Länge bytegenau vergleichen
+        entfernt = np.zeros(anzahl, dtype=bool)
+        if gelöscht:
+            anfang, ende = feld("Modul")
+            längen = ende - anfang
+            for name in gelöscht:
+                suche = np.frombuffer(name.encode("utf-8"), dtype=np.uint8)
+                kandidaten = np.flatnonzero(längen == len(suche))
+                treffer = (zeichen[anfang[kandidaten, None] + np.arange(len(suche))] == suche).all(axis=1)
+                entfernt[kandidaten[treffer]] = True
+
+        # hinter gleichen Daten einfügen -> Bestand vor neuen Zeilen (wie stabile Sortierung)
+        # Ereignisse je Zeilenposition: (Zeile, 0, neue Zeile) fügt davor ein, (Zeile, 1, None) lässt sie weg
+        zeilenanfang = np.append(zeilenenden[:-1] + 1, len(daten))
+        einfügen = np.searchsorted(bestand, [self.datum_zahl(zeile["Ende"]) for zeile in neue], side="right")
+        ereignisse = heapq.merge(zip(einfügen.tolist(), [0] * len(neue), neue),
+                                 ((position, 1, None) for position in np.flatnonzero(entfernt).tolist()),
+                                 key=lambda ereignis: ereignis[:2])
+        puffer = io.StringIO()
+        writer = csv.DictWriter(puffer, fieldnames=kopf)
+        with self.schreibe_atomar(self.datei_module, zeit_ns, binär=True) as ausgabe:
+            vorher = 0
+            for position, _, zeile in ereignisse:
+                ausgabe.write(daten[vorher:zeilenanfang[position]])
+                if zeile is None:
+                    vorher = zeilenanfang[position + 1]
+                    continue
+                puffer.seek(0)
+                puffer.truncate()
+                writer.writerow(zeile)
+                ausgabe.write(puffer.getvalue().encode("utf-8"))
+                vorher = zeilenanfang[position]
+            ausgabe.write(daten[vorher:])
+        return True
+
+
+class SQLite_Speicher(Speicher):
+    """
+    Speicher-Backend auf Basis einer eingebetteten SQLite-Datenbank.
+    Tabelle "module" hat Index auf Modul (Löschen als Punktabfrage) und auf
+    Prüfungsdatum als Zahl JJJJMMTT (chronologisches Lesen direkt über Index).
+    Jeder Schreibvorgang läuft in eigener Transaktion und zählt Versionszähler in Tabelle "meta" hoch.
+    Datumswerte bleiben im CSV-Format TT.MM.JJJJ, damit Plots_Berechnungen unverändert rechnet.
+    """
+
+    def __init__(self, datei="Dashboard.sqlite"):
+        self.datei = datei
+        with self.verbinde() as verbindung:
+            verbindung.executescript("""
+                CREATE TABLE IF NOT EXISTS student (
+                    Name TEXT, Matrikelnummer TEXT, Studiengang TEXT,
+                    Abschluss TEXT, Startdatum TEXT, Enddatum TEXT
+                );
+                CREATE TABLE IF NOT EXISTS module (
+                    id INTEGER PRIMARY KEY,
+                    Modul TEXT NOT NULL, ECTS INTEGER, Start TEXT, Ende TEXT,
+                    Note REAL, Tage INTEGER, ende_zahl INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS module_modul ON module (Modul);
+                CREATE INDEX IF NOT EXISTS module_ende ON module (ende_zahl, id);
+                CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, wert INTEGER NOT NULL);
+                INSERT OR IGNORE INTO meta VALUES ('version', 0);
+            """)
+
+    def kennung(self):
+        return ("SQLite", os.path.abspath(self.datei))
+
+    def version(self):
+        """
+        Gibt Versionszähler zurück (mtime/Größe der Datei wären im WAL-Modus bzw. innerhalb
+        der Zeitstempel-Auflösung nicht eindeutig).
+        """
+        with self.verbinde() as verbindung:
+            return verbindung.execute("SELECT wert FROM meta WHERE name = 'version'").fetchone()[0]
+
+    def verbinde(self):
+        """
+        Öffnet neue Verbindung zur Datenbank (je Aufruf, dadurch threadsicher).
+        Als Context-Manager verwendet: commit bei Erfolg, rollback bei Fehler, danach schließen.
+        """
+        return SQLite_Verbindung(self.datei)
+
+    def datum_zahl(self, datum):
+        """
+        Wandelt Datum "TT.MM.JJJJ" in sortierbare Zahl JJJJMMTT um.
+        """
+        tag, monat, jahr = datum.split(".")
+        return int(jahr) * 10000 + int(monat) * 100 + int(tag)
+
+    def setze_student(self, neue_zeile):
+        """
+        Ersetzt Studentendaten (nur eine Zeile) in einer Transaktion.
+        """
+        spalten = ["Name", "Matrikelnummer", "Studiengang", "Abschluss", "Startdatum", "Enddatum"]
+        with self.verbinde() as verbindung:
+            self.beginne_schreiben(verbindung)
+            verbindung.execute("DELETE FROM student")
+            verbindung.execute("INSERT INTO student VALUES (?, ?, ?, ?, ?, ?)", [neue_zeile[spalte] for spalte in spalten])
+
+    def füge_modul_hinzu(self, neue_zeile):
+        """
+        Fügt Modulzeile ein, Sortierung übernimmt Index auf Prüfungsdatum.
+        """
+        with self.verbinde() as verbindung:
+            nachher = self.beginne_schreiben(verbindung)
+            verbindung.execute(
+                "INSERT INTO module (Modul, ECTS, Start, Ende, Note, Tage, ende_zahl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (neue_zeile["Modul"], neue_zeile["ECTS"], neue_zeile["Start"], neue_zeile["Ende"],
+                 neue_zeile["Note"], neue_zeile["Tage"], self.datum_zahl(neue_zeile["Ende"]))
+            )
+        return (nachher - 1, nachher)
+
+    def lösche_modul(self, suchwert):
+        """
+        Löscht alle Module mit exakt diesem Namen (Punktabfrage über Index).
+        """
+        with self.verbinde() as verbindung:
+            nachher = self.beginne_schreiben(verbindung)
+            verbindung.execute("DELETE FROM module WHERE Modul = ?", (suchwert,))
+        return (nachher - 1, nachher)
+
+    def beginne_schreiben(self, verbindung):
+        """
+        Beginnt Schreibtransaktion (BEGIN IMMEDIATE, sperrt andere Schreiber), zählt
+        Versionszähler hoch und gibt neue Version zurück (Rollback nimmt Zählung zurück).
+        """
+        verbindung.execute("BEGIN IMMEDIATE")
+        verbindung.execute("UPDATE meta SET wert = wert + 1 WHERE name = 'version'")
+        return verbindung.execute("SELECT wert FROM meta WHERE name = 'version'").fetchone()[0]
+
+    def lese_student(self):
+        """
+        Gibt Studentendaten als DataFrame mit Spalten wie Student.csv zurück.
+        """
+        with self.verbinde() as verbindung:
+            return pd.read_sql_query("SELECT Name, Matrikelnummer, Studiengang, Abschluss, Startdatum, Enddatum FROM student", verbindung)
+
+    def lese_module(self):
+        """
+        Gibt Module chronologisch (über Index module_ende) als DataFrame
+        mit Spalten wie Module_abgeschlossen.csv zurück.
+        """
+        with self.verbinde() as verbindung:
+            return pd.read_sql_query(
+                "SELECT Modul, ECTS, Start, Ende, Note, Tage FROM module ORDER BY ende_zahl, id",
+                verbindung
+            )
+
+    def migriere_aus_csv(self, quelle=None):
+        """
+        Einmalige Übernahme aller Daten aus CSV-Speicher (inkl. offener Journal-Einträge).
+        Ersetzt bestehenden Inhalt der Datenbank in einer einzigen Transaktion.
+        """
+        quelle = quelle or CSV_Speicher()
+        student = quelle.lese_student()
+        module = quelle.lese_module()
+
+        with self.verbinde() as verbindung:
+            self.beginne_schreiben(verbindung)
+            verbindung.execute("DELETE FROM student")
+            verbindung.execute("DELETE FROM module")
+            verbindung.executemany(
+                "INSERT INTO student VALUES (?, ?, ?, ?, ?, ?)",
+                student[["Name", "Matrikelnummer", "Studiengang", "Abschluss", "Startdatum", "Enddatum"]].astype(str).values.tolist()
+            )
+            verbindung.executemany(
+                "INSERT INTO module (Modul, ECTS, Start, Ende, Note, Tage, ende_zahl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (zeile.Modul, int(zeile.ECTS), zeile.Start, zeile.Ende, float(zeile.Note), int(zeile.Tage), self.datum_zahl(zeile.Ende))
+                    for zeile in module.itertuples(index=False)
+                )
+            )
+
+    def importiere_module(self, stapel):
+        """
+        Fügt Module aus geprüften Stapeln (Modul_Tabelle) per executemany in einer
+        einzigen Transaktion ein (Sortierung übernimmt Index auf ende_zahl).
+        """
+        anzahl = 0
+        with self.verbinde() as verbindung:
+            self.beginne_schreiben(verbindung)
+            for tabelle in stapel:
+                verbindung.executemany(
+                    "INSERT INTO module (Modul, ECTS, Start, Ende, Note, Tage, ende_zahl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((*zeile, self.datum_zahl(zeile[3])) for zeile in tabelle.zeilen())
+                )
+                anzahl += len(tabelle)
+        return anzahl
+
+
+class SQLite_Verbindung:
+    """
+    Context-Manager um sqlite3-Verbindung: Transaktion mit commit/rollback,
+    Verbindung wird danach immer geschlossen (sqlite3 selbst schließt nicht).
+    """
+
+    def __init__(self, datei):
+        self.verbindung = sqlite3.connect(datei)
+
+    def __enter__(self):
+        return self.verbindung
+
+    def __exit__(self, fehler_typ, fehler, traceback):
+        if fehler_typ is None:
+            self.verbindung.commit()
+        else:
+            self.verbindung.rollback()
+        self.verbindung.close()
+        return False
+
+
+class Kohorte_Speicher(Speicher):
+    """
+    Speicher-Backend für Kohorten-Modus: viele Studenten in Kohorte_Student.csv,
+    alle Module in Kohorte_Module.csv, beide über Spalte "Matrikelnummer" verknüpft.
+    Eine Instanz steht für einen Studenten der Kohorte (Lesen/Schreiben nur dessen Zeilen),
+    damit Plots_Berechnungen und GUI_Controller unverändert je Student arbeiten.
+    Auswertung der gesamten Kohorte in einem Durchlauf: Kohorte_Berechnungen.
+    """
+
+    spalten_student = ["Name", "Matrikelnummer", "Studiengang", "Abschluss", "Startdatum", "Enddatum"]
+    spalten_module = ["Matrikelnummer", "Modul", "ECTS", "Start", "Ende", "Note", "Tage"]
+
+    def __init__(self, matrikelnummer, datei_student="Kohorte_Student.csv", datei_module="Kohorte_Module.csv"):
+        self.matrikelnummer = matrikelnummer
+        self.datei_student = datei_student
+        self.datei_module = datei_module
+
+    def kennung(self):
+        return ("Kohorte", os.path.abspath(self.datei_module), self.matrikelnummer)
+
+    def version(self):
+        return self.datei_version(self.datei_student, self.datei_module)
+
+    def setze_student(self, neue_zeile):
+        """
+        Ersetzt Zeile mit gleicher Matrikelnummer oder hängt neuen Studenten an.
+        Lesen und atomares Neuschreiben unter Datei_Sperre (mehrere Prozesse je Kohorte).
+        """
+        with Datei_Sperre(self.datei_student):
+            einträge = []
+            if os.path.exists(self.datei_student):
+                with open(self.datei_student, mode="r", encoding="utf-8") as csv_1:
+                    einträge = [zeile for zeile in csv.DictReader(csv_1) if zeile["Matrikelnummer"] != neue_zeile["Matrikelnummer"]]
+            einträge.append(neue_zeile)
+
+            with self.schreibe_atomar(self.datei_student) as csv_1:
+                writer = csv.DictWriter(csv_1, fieldnames=self.spalten_student)
+                writer.writeheader()
+                writer.writerows(einträge)
+
+    def füge_modul_hinzu(self, neue_zeile):
+        """
+        Hängt Modulzeile mit Matrikelnummer an, Sortierung erfolgt beim Lesen je Student.
+        Anhängen unter Datei_Sperre -> kein Verlust durch gleichzeitiges Neuschreiben (lösche_modul).
+        """
+        with Datei_Sperre(self.datei_module):
+            vorher = self.version()
+            with open(self.datei_module, mode="a", newline="", encoding="utf-8") as csv_2:
+                writer = csv.DictWriter(csv_2, fieldnames=self.spalten_module)
+                if csv_2.tell() == 0:
+                    writer.writeheader()
+                writer.writerow({"Matrikelnummer": self.matrikelnummer, **neue_zeile})
+            return (vorher, self.version())
+
+    def lösche_modul(self, suchwert):
+        """
+        Löscht Module mit exakt diesem Namen, nur für Matrikelnummer dieser Instanz.
+        """
+        with Datei_Sperre(self.datei_module):
+            vorher = self.version()
+            with open(self.datei_module, mode="r", encoding="utf-8") as csv_2:
+                einträge = [
+                    zeile for zeile in csv.DictReader(csv_2)
+                    if zeile["Matrikelnummer"] != self.matrikelnummer or zeile["Modul"] != suchwert
+                ]
+
+            with self.schreibe_atomar(self.datei_module) as csv_2:
+                writer = csv.DictWriter(csv_2, fieldnames=self.spalten_module)
+                writer.writeheader()
+                writer.writerows(einträge)
+            return (vorher, self.version())
+
+    def importiere_module(self, stapel):
+        """
+        Fügt Module aus geprüften Stapeln (Modul_Tabelle) mit Matrikelnummer in einem Commit an:
+        Bestand + neue Zeilen in temporäre Datei, danach os.replace (unter Datei_Sperre).
+        Ungültiger Stapel (ValueError) oder Absturz lässt Kohorte_Module.csv unverändert.
+        """
+        anzahl = 0
+        with Datei_Sperre(self.datei_module), self.schreibe_atomar(self.datei_module) as csv_neu:
+            if os.path.exists(self.datei_module) and os.path.getsize(self.datei_module) > 0:
+                with open(self.datei_module, mode="r", newline="", encoding="utf-8") as csv_2:
+                    shutil.copyfileobj(csv_2, csv_neu)
+            else:
+                csv.writer(csv_neu).writerow(self.spalten_module)
+            writer = csv.writer(csv_neu)
+            for tabelle in stapel:
+                writer.writerows([self.matrikelnummer, *zeile] for zeile in tabelle.zeilen())
+                anzahl += len(tabelle)
+        return anzahl
+
+    def lese_student(self):
+        """
+        Gibt Zeile des Studenten als DataFrame (Index ab 0, wie Student.csv) zurück.
+        """
+        studenten = Daten_Cache().lese_csv(self.datei_student)
+        zeilen = Daten_Cache().lese_gruppen(self.datei_student, "Matrikelnummer").get(self.matrikelnummer, [])
+        return studenten.iloc[zeilen].reset_index(drop=True)
+
+    def lese_module(self):
+        """
+        Gibt Module des Studenten chronologisch nach Prüfungsdatum als DataFrame
+        mit Spalten wie Module_abgeschlossen.csv zurück.
+        """
+        module = Daten_Cache().lese_csv(self.datei_module)
+        zeilen = Daten_Cache().lese_gruppen(self.datei_module, "Matrikelnummer").get(self.matrikelnummer, [])
+        module = module.iloc[zeilen][self.spalten_module[1:]]
+        ende = Daten_Cache().datum_tage(module["Ende"])
+        return module.iloc[np.argsort(ende, kind="stable")].reset_index(drop=True)
+
+
+
+# ============================== CSV-Klassen ============================
+
+class CSV_Controller:
+    """
+    Verwaltet Speicherung von Studentendaten und abgeschlossenen Modulen.
+    Nutzt Entity-Klassen und erzeugt passende CSV-Struktur (Zeilen als Dictionary),
+    gespeichert wird über austauschbares Speicher-Backend (Standard: CSV-Dateien).
+    """
+
+    def __init__(self, journal=False, speicher=None):
+        """
+        speicher: Speicher-Backend (CSV_Speicher, SQLite_Speicher), Standard CSV_Speicher.
+        journal=True aktiviert Journal-Modus des Standard-CSV_Speicher.
+        """
+        self.speicher = speicher or CSV_Speicher(journal=journal)
+
+    def setze_student_csv(self, eingabe_name, eingabe_matrikelnummer, eingabe_studiengang, eingabe_abschluss, eingabe_datum_start):
+        """
+        Speichert Studentendaten mit nur einer Zeile.
+        Speichert Ausgabe der Entity-Klassen Student + Studiengang.
+        Überschreibt bei erneutem Aufruf den alten Eintrag.
+        """
+        self.student = Student(eingabe_name, eingabe_matrikelnummer)
+        self.studium = Studiengang(self.student, eingabe_studiengang, eingabe_abschluss, eingabe_datum_start)
+        self.speicher.setze_student(self.studium.daten)
+
+    def füge_modul_csv_hinzu(self, eingabe_name, eingabe_ects, eingabe_datum_start, eingabe_datum_prüfung, eingabe_note):
+        """
+        Fügt neuen Datensatz zu Modul und Prüfungsleistung hinzu.
+        Erzeugt Eintrag einer Zeile mit Entity-Klassen Modul + Prüfungsleistung.
+        Speicher hält Module chronologisch nach Prüfungsdatum geordnet.
+        (wichtig für spätere Diagramme)
+        """
+        self.modul = Modul(eingabe_name, eingabe_ects, eingabe_datum_start)
+        self.prüfungsleistung = Prüfungsleistung(self.modul, eingabe_datum_prüfung, eingabe_note)
+        versionen = self.speicher.füge_modul_hinzu(self.prüfungsleistung.daten)
+        if versionen is not False: # False: gemeinsam mit fremden Änderungen übernommen
+            Statistik_Engine.nach_hinzufügen(self.speicher, versionen, self.prüfungsleistung.daten)
+
+    def importiere_module_csv(self, quelle, stapel_größe=100000):
+        """
+        Importiert viele Module auf einmal (statt einzeln über füge_modul_csv_hinzu).
+        quelle: Dateiname oder Textstrom einer CSV mit Kopfzeile (Modul, ECTS, Start, Ende, Note)
+        oder beliebiges Iterable von Dictionarys mit diesen Schlüsseln.
+        Zeilen werden in Stapeln geprüft, Tage berechnet und sortiert (stapel),
+        Speicher mischt sie in einem Durchgang mit dem Bestand.
+        Gibt Anzahl importierter Module zurück. Ungültige Zeile -> ValueError,
+        Bestand bleibt dann unverändert (alle Stapel werden vor dem Schreiben geprüft).
+        """
+        if isinstance(quelle, (str, os.PathLike)):
+            with open(quelle, mode="r", newline="", encoding="utf-8") as datei:
+                return self.importiere_module_csv(datei, stapel_größe)
+        if hasattr(quelle, "read"):
+            quelle = csv.DictReader(quelle)
+        return self.speicher.importiere_module(self.stapel(quelle, stapel_größe))
+
+    def stapel(self, zeilen, stapel_größe):
+        """
+        Teilt Zeilen in Stapel, prüft jeden Stapel und berechnet Tage vektorisiert
+        (Modul_Tabelle.aus_zeilen) und gibt ihn nach Prüfungsdatum sortiert zurück.
+        """
+        zeilen = iter(zeilen)
+        erste_zeile = 1
+        while True:
+            stapel = list(islice(zeilen, stapel_größe))
+            if not stapel:
+                return
+            tabelle = Modul_Tabelle.aus_zeilen(stapel, erste_zeile)
+            erste_zeile += len(stapel)
+            yield tabelle.auswahl(tabelle.reihenfolge())
+
+    def lösche_modul_csv(self, suchwert):
+        """
+        Löscht alle Einträge, deren Modulname exakt dem Suchwert entspricht.
+        """
+        versionen = self.speicher.lösche_modul(suchwert)
+        if versionen is not False:
+            Statistik_Engine.nach_löschen(self.speicher, versionen, suchwert)
+
+
+
+# ============================== Daten-Klasse ===========================
+
+class Daten_Cache:
+    """
+    Gemeinsame Datenschicht für alle Leser der CSV-Dateien.
+    Jede Datei wird pro Prozess nur einmal geparst und als DataFrame vorgehalten.
+    Ein Eintrag gilt als veraltet, sobald sich Änderungszeit (mtime) oder Größe
+    der Datei ändern, dann wird neu eingelesen.
+    Speicher ist Klassenattribut, damit jede Instanz denselben Stand teilt.
+    Modul-CSV wird zusätzlich als binäre Spaltendatei neben der CSV abgelegt
+    (Spalten der Modul_Tabelle), die beim nächsten Start per mmap ohne Parsen geladen wird.
+    """
+
+    _speicher = {} # Dateiname -> (Schlüssel aus mtime + Größe, DataFrame)
+    spalten_aktiv = True # Spaltendatei nutzen und pflegen
+    spalten_kennung = b"DSPALT02" # Dateianfang der Spaltendatei (Formatversion)
+    text_spalten = {"Matrikelnummer": str} # immer als Text lesen (sonst "1001" -> int, führende Nullen gehen verloren)
+
+    def schlüssel(self, datei):
+        """
+        Gibt Versionsschlüssel einer Datei aus mtime (Nanosekunden) und Größe zurück.
+        """
+        status = os.stat(datei)
+        return (status.st_mtime_ns, status.st_size)
+
+    def lese_csv(self, datei):
+        """
+        Gibt DataFrame der Datei zurück, parst nur bei geänderter oder neuer Datei.
+        Rückgabe wird von mehreren Lesern geteilt und darf nicht verändert werden.
+        Spalten aus text_spalten bleiben Text (Schlüssel für lese_gruppen wie übergebene Matrikelnummer).
+        """
+        schlüssel = self.schlüssel(datei)
+        eintrag = self._speicher.get(datei)
+        if eintrag is None or eintrag[0] != schlüssel:
+            eintrag = (schlüssel, pd.read_csv(datei, dtype=self.text_spalten))
+            self._speicher[datei] = eintrag
+        return eintrag[1]
+
+    def lese_gruppen(self, datei, spalte):
+        """
+        Gibt Zeilenpositionen je Wert einer Spalte zurück (Dictionary Wert -> Array).
+        Wird wie lese_csv() nur einmal je Dateistand berechnet, danach ist
+        Zugriff auf Zeilen eines Schlüssels (z. B. Matrikelnummer) ohne Suche möglich.
+        """
+        daten = self.lese_csv(datei)
+        schlüssel = self._speicher[datei][0]
+        eintrag = self._speicher.get(("Gruppen", datei, spalte))
+        if eintrag is None or eintrag[0] != schlüssel:
+            eintrag = (schlüssel, daten.groupby(spalte, sort=False).indices)
+            self._speicher[("Gruppen", datei, spalte)] = eintrag
+        return eintrag[1]
+
+    def datum_tage(self, werte):
+        """
+        Wandelt Datumswerte "TT.MM.JJJJ" vektorisiert in datetime64[D]-Array um.
+        Liest Ziffern direkt aus Byte-Array (deutlich schneller als pd.to_datetime mit format),
+        bei abweichender Schreibweise Rückfall auf pd.to_datetime.
+        """
+        roh = np.asarray(werte, dtype="S11")
+        if roh.size == 0:
+            return np.array([], dtype="datetime64[D]")
+        if (np.char.str_len(roh) != 10).any():
+            return pd.to_datetime(pd.Series(werte), format="%d.%m.%Y").to_numpy().astype("datetime64[D]")
+
+        ziffern = roh.astype("S10").view(np.uint8).reshape(-1, 10).astype(np.int64) - ord("0")
+        tag = ziffern[:, 0] * 10 + ziffern[:, 1]
+        monat = ziffern[:, 3] * 10 + ziffern[:, 4]
+        jahr = ziffern[:, 6] * 1000 + ziffern[:, 7] * 100 + ziffern[:, 8] * 10 + ziffern[:, 9]
+        return ((jahr - 1970) * 12 + monat - 1).astype("datetime64[M]").astype("datetime64[D]") + (tag - 1)
+
+    def journal_datei(self, datei):
+        """
+        Gibt Namen der Journaldatei zu einer Modul-CSV zurück.
+        """
+        return os.path.splitext(datei)[0] + "_journal.csv"
+
+    def lese_module(self, datei):
+        """
+        Gibt aktuelle Modul-Ansicht als DataFrame zurück.
+        Ohne Journal ist das die Modul-CSV selbst, sonst Modul-CSV mit abgespieltem Journal:
+        - Löschvermerk entfernt alle vorherigen Einträge gleichen Modulnamens
+        - überlebende neue Einträge werden chronologisch nach Prüfungsdatum einsortiert
+        Ergebnis wird wie lese_csv() bis zur nächsten Dateiänderung vorgehalten.
+        """
+        journal = self.journal_datei(datei)
+        if not os.path.exists(journal):
+            return self.lese_csv(datei)
+
+        try:
+            schlüssel = (self.schlüssel(datei), self.schlüssel(journal))
+            eintrag = self._speicher.get(("Ansicht", datei))
+            if eintrag is not None and eintrag[0] == schlüssel:
+                return eintrag[1]
+
+            basis = self.lese_csv(datei)
+            einträge = self.lese_csv(journal)
+        except FileNotFoundError:
+            return self.lese_csv(datei) # Journal wurde zwischenzeitlich komprimiert
+        position = pd.Series(range(len(einträge)), index=einträge.index)
+        ist_neu = einträge["Aktion"] == "+"
+
+        # letzte Position eines Löschvermerks je Modulname
+        letzte_löschung = position[~ist_neu].groupby(einträge.loc[~ist_neu, "Modul"]).max()
+        neue = einträge[ist_neu & (einträge["Modul"].map(letzte_löschung).fillna(-1) < position)]
+
+        ansicht = pd.concat([basis[~basis["Modul"].isin(letzte_löschung.index)], neue[basis.columns]], ignore_index=True)
+        ansicht[["ECTS", "Tage"]] = ansicht[["ECTS", "Tage"]].astype(int)
+        ende = self.datum_tage(ansicht["Ende"])
+        ansicht = ansicht.iloc[np.argsort(ende, kind="stable")].reset_index(drop=True)
+
+        self._speicher[("Ansicht", datei)] = (schlüssel, ansicht)
+        return ansicht
+
+    def lese_tabelle(self, datei):
+        """
+        Gibt aktuelle Modul-Ansicht (lese_module) als Modul_Tabelle zurück.
+        Ohne Journal aus Spaltendatei (lade_spalten), CSV wird nur geparst, wenn
+        Spaltendatei fehlt oder veraltet ist, und Spaltendatei danach neu geschrieben.
+        Mit Journal einmal je DataFrame erstellt, solange sich Datei/Journal nicht ändern.
+        """
+        if self.spalten_aktiv and not os.path.exists(self.journal_datei(datei)):
+            schlüssel = self.schlüssel(datei)
+            eintrag = self._speicher.get(("Spalten", datei))
+            if eintrag is None or eintrag[0] != schlüssel:
+                tabelle = self.lade_spalten(datei, schlüssel)
+                if tabelle is None:
+                    tabelle = Modul_Tabelle.aus_dataframe(self.lese_csv(datei))
+                    schlüssel = self._speicher[datei][0] # Stand beim Parsen
+                    self.schreibe_spalten(datei, schlüssel, tabelle)
+                eintrag = (schlüssel, tabelle)
+                self._speicher[("Spalten", datei)] = eintrag
+            return eintrag[1]
+
+        module = self.lese_module(datei)
+        eintrag = self._speicher.get(("Tabelle", datei))
+        if eintrag is None or eintrag[0] is not module:
+            eintrag = (module, Modul_Tabelle.aus_dataframe(module))
+            self._speicher[("Tabelle", datei)] = eintrag
+        return eintrag[1]
+
+    def spalten_datei(self, datei):
+        """
+        Gibt Namen der binären Spaltendatei zu einer Modul-CSV zurück.
+        """
+        return os.path.splitext(datei)[0] + "_spalten.bin"
+
+    def datei_hash(self, datei):
+        """
+        Gibt SHA-256 (hex) des Dateiinhalts zurück, blockweise gelesen.
+        """
+        prüfsumme = hashlib.sha256()
+        with open(datei, "rb") as eingabe:
+            for block in iter(lambda: eingabe.read(1 << 20), b""):
+                prüfsumme.update(block)
+        return prüfsumme.hexdigest()
+
+    def lade_spalten(self, datei, schlüssel):
+        """
+        Gibt Modul_Tabelle aus Spaltendatei zurück, Spalten zeigen direkt in die
+        per mmap eingeblendete Datei (keine Kopie, nur lesbar). None, wenn Spaltendatei
+        fehlt, beschädigt oder veraltet ist. Gültig bei gleicher mtime und Größe der CSV;
+        weicht nur mtime ab (kopiert, touch), entscheidet Hash des Inhalts.
+        """
+        try:
+            with open(self.spalten_datei(datei), "rb") as eingabe:
+                abbild = mmap.mmap(eingabe.fileno(), 0, access=mmap.ACCESS_READ) # bleibt nach close gültig
+            länge = len(self.spalten_kennung)
+            if abbild[:länge] != self.spalten_kennung:
+                return None
+            kopf_länge = int.from_bytes(abbild[länge:länge + 4], "little")
+            kopf = json.loads(abbild[länge + 4:länge + 4 + kopf_länge])
+        except (OSError, ValueError):
+            return None
+
+        if (kopf["mtime_ns"], kopf["größe"]) != tuple(schlüssel):
+            if kopf["größe"] != schlüssel[1] or kopf["sha256"] != self.datei_hash(datei):
+                return None
+            ergebnis = self.lade_spalten_aus(abbild, kopf)
+            self.schreibe_spalten(datei, schlüssel, ergebnis, kopf["sha256"]) # neue mtime übernehmen
+            return ergebnis
+        return self.lade_spalten_aus(abbild, kopf)
+
+    def lade_spalten_aus(self, abbild, kopf):
+        """
+        Erstellt Modul_Tabelle aus Spalten-Beschreibung im Kopf (Position, dtype, Länge) über eingeblendetem Puffer.
+        Zahlenspalten zeigen direkt in den Puffer, Modulnamen werden aus UTF-8 + Grenzen dekodiert.
+        """
+        spalten = {
+            spalte: np.frombuffer(abbild, dtype=dtype, count=länge, offset=kopf["daten"] + position)
+            for spalte, (position, dtype, länge) in kopf["spalten"].items()
+        }
+        text, grenzen = spalten.pop("namen_utf8").tobytes(), spalten.pop("namen_grenzen").tolist()
+        zeichen = text.decode("utf-8")
+        tabelle = Modul_Tabelle.__new__(Modul_Tabelle)
+        tabelle.namen = np.empty(len(grenzen) - 1, dtype=object)
+        if len(zeichen) == len(text): # nur ASCII -> Byte-Grenzen sind Zeichengrenzen
+            tabelle.namen[:] = [zeichen[anfang:ende] for anfang, ende in zip(grenzen[:-1], grenzen[1:])]
+        else:
+            tabelle.namen[:] = [text[anfang:ende].decode("utf-8") for anfang, ende in zip(grenzen[:-1], grenzen[1:])]
+        for spalte, werte in spalten.items():
+            setattr(tabelle, spalte, werte)
+        return tabelle
+
+    def schreibe_spalten(self, datei, schlüssel, tabelle, prüfsumme=None):
+        """
+        Schreibt Spalten der Modul_Tabelle atomar als Spaltendatei (temporäre Datei + os.replace).
+        Aufbau: Kennung, Kopflänge (4 Bytes), JSON-Kopf mit Schlüssel/Hash der CSV und
+        Position je Spalte, danach Spalten als rohe Arrays (auf 64 Bytes ausgerichtet).
+        Modulnamen als aneinandergehängtes UTF-8 (uint8) + Grenzen (int64, Anzahl + 1)
+        statt Unicode-Array fester Breite (längster Name * 4 Bytes je Zeile).
+        Schreibfehler werden ignoriert (Spaltendatei ist nur Beschleunigung).
+        """
+        kodiert = [name.encode("utf-8") for name in tabelle.namen.tolist()]
+        grenzen = np.zeros(len(kodiert) + 1, dtype=np.int64)
+        np.cumsum([len(name) for name in kodiert], out=grenzen[1:])
+        spalten = {
+            "namen_utf8": np.frombuffer(b"".join(kodiert), dtype=np.uint8), "namen_grenzen": grenzen,
+            "ects": tabelle.ects, "start": tabelle.start, "ende": tabelle.ende,
+            "note_codes": tabelle.note_codes, "noten_werte": tabelle.noten_werte, "tage": tabelle.tage
+        }
+        beschreibung = {}
+        position = 0
+        for spalte, werte in spalten.items():
+            beschreibung[spalte] = (position, werte.dtype.str, len(werte))
+            position += -(-werte.nbytes // 64) * 64
+        kopf = {"mtime_ns": schlüssel[0], "größe": schlüssel[1], "sha256": prüfsumme or self.datei_hash(datei),
+                "spalten": beschreibung}
+        kopf_bytes = json.dumps(kopf, ensure_ascii=False).encode("utf-8")
+        anfang = len(self.spalten_kennung) + 4 + len(kopf_bytes)
+        kopf["daten"] = -(-(anfang + 32) // 64) * 64 # Platz für Eintrag "daten" selbst
+        kopf_bytes = json.dumps(kopf, ensure_ascii=False).encode("utf-8")
+
+        ziel = self.spalten_datei(datei)
+        temporär = f"{ziel}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporär, "wb") as ausgabe:
+                ausgabe.write(self.spalten_kennung + len(kopf_bytes).to_bytes(4, "little") + kopf_bytes)
+                for spalte, werte in spalten.items():
+                    ausgabe.seek(kopf["daten"] + beschreibung[spalte][0])
+                    ausgabe.write(np.ascontiguousarray(werte).tobytes())
+                ausgabe.truncate(kopf["daten"] + position) # auch leere letzte Spalte liegt innerhalb der Datei
+            os.replace(temporär, ziel) # Leser sehen alte oder neue Datei, nie halbe
+        except OSError:
+            if os.path.exists(temporär):
+                os.remove(temporär)
+
+    def verwerfe(self, datei=None):
+        """
+        Entfernt Eintrag einer Datei (oder alle Einträge) aus dem Speicher.
+        """
+        if datei is None:
+            self._speicher.clear()
+        else:
+            self._speicher.pop(datei, None)
+            self._speicher.pop(("Ansicht", datei), None)
+            self._speicher.pop(("Tabelle", datei), None)
+            self._speicher.pop(("Spalten", datei), None)
+            for schlüssel in [schlüssel for schlüssel in self._speicher if schlüssel[:2] == ("Gruppen", datei)]:
+                self._speicher.pop(schlüssel)
+
+
+class Render_Cache:
+    """
+    Inhaltsadressierter Cache gerasterter Diagramme (RGBA-Arrays).
+    Schlüssel ist Hash aus Methode, Eingabedaten (Plots_Berechnungen.panel_eingaben),
+    Pixelgröße und dpi -> gleiche Eingaben ergeben gleiches Bild, ohne neu zu zeichnen.
+    Im Speicher mit LRU-Verdrängung (Grenze in Bytes), optional zweite Stufe auf
+    Festplatte (verzeichnis, .npy je Schlüssel). Speicher und Zähler sind
+    Klassenattribute, damit alle Instanzen eines Prozesses denselben Stand teilen
+    (Zugriff über Sperre, da GUI-Thread und Hintergrund-Thread gleichzeitig nutzen).
+    """
+
+    _einträge = OrderedDict() # Schlüssel -> RGBA-Array, älteste zuerst
+    _sperre = threading.RLock()
+    _bytes = 0
+    max_bytes = 64 * 1024 * 1024
+    verzeichnis = None # z. B. "Render_Cache" aktiviert Festplatten-Stufe
+    zähler = {"treffer": 0, "treffer_platte": 0, "fehlschläge": 0}
+
+    def schlüssel(self, methode, eingaben, breite, höhe, dpi):
+        """
+        Gibt Hash (hex) über Methode, Eingabedaten, Pixelgröße und dpi zurück.
+        """
+        inhalt = repr((methode, eingaben, int(breite), int(höhe), float(dpi)))
+        return hashlib.sha256(inhalt.encode("utf-8")).hexdigest()
+
+    def hole(self, schlüssel):
+        """
+        Gibt gespeichertes Raster zurück (oder None) und zählt Treffer/Fehlschläge.
+        Treffer auf Festplatte werden in den Speicher übernommen.
+        """
+        with self._sperre:
+            raster = self._einträge.get(schlüssel)
+            if raster is not None:
+                self._einträge.move_to_end(schlüssel)
+                self.zähler["treffer"] += 1
+                return raster
+
+        if self.verzeichnis is not None:
+            datei = os.path.join(self.verzeichnis, schlüssel + ".npy")
+            if os.path.exists(datei):
+                raster = np.load(datei)
+                with self._sperre:
+                    self.zähler["treffer_platte"] += 1
+                self.speichere_im_speicher(schlüssel, raster)
+                return raster
+
+        with self._sperre:
+            self.zähler["fehlschläge"] += 1
+        return None
+
+    def lege_ab(self, schlüssel, raster):
+        """
+        Speichert Raster im Speicher und (falls aktiviert) atomar auf Festplatte.
+        """
+        self.speichere_im_speicher(schlüssel, raster)
+        if self.verzeichnis is not None:
+            os.makedirs(self.verzeichnis, exist_ok=True)
+            datei = os.path.join(self.verzeichnis, schlüssel + ".npy")
+            temporär = f"{datei}.{os.getpid()}.tmp"
+            with open(temporär, "wb") as npy:
+                np.save(npy, raster)
+            os.replace(temporär, datei) # parallele Prozesse sehen nie halbe Datei
+
+    def speichere_im_speicher(self, schlüssel, raster):
+        """
+        Legt Raster im Speicher ab und verdrängt älteste Einträge über max_bytes.
+        """
+        with self._sperre:
+            alt = self._einträge.pop(schlüssel, None)
+            if alt is not None:
+                Render_Cache._bytes -= alt.nbytes
+            self._einträge[schlüssel] = raster
+            Render_Cache._bytes += raster.nbytes
+            while Render_Cache._bytes > self.max_bytes and len(self._einträge) > 1:
+                verdrängt = self._einträge.popitem(last=False)[1]
+                Render_Cache._bytes -= verdrängt.nbytes
+
+    def rastere(self, fig):
+        """
+        Zeichnet Figure auf ihrem Agg-Canvas und gibt Kopie des RGBA-Puffers zurück.
+        """
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    def statistik(self):
+        """
+        Gibt Zähler (Treffer Speicher/Festplatte, Fehlschläge), Anzahl Einträge und Bytes zurück.
+        """
+        return {**self.zähler, "einträge": len(self._einträge), "bytes": Render_Cache._bytes}
+
+
+
+# ============================== Logik-Klasse ===========================
+
+class Statistik_Engine:
+    """
+    Laufende Statistik eines Datenbestands (je Speicher-Kennung eine Instanz).
+    Hält ECTS-Summe, Notensumme und -anzahl, Häufigkeit je Notenschritt,
+    Tagesumme und Anzahl je Semester sowie Notenverlauf mit Präfixsummen in Hundertsteln
+    (für gleitenden Durchschnitt). Wird einmal aus Daten aufgebaut und danach
+    bei jedem Hinzufügen/Löschen über CSV_Controller nachgeführt, statt alles
+    neu zu berechnen. Fremde Änderungen (Version passt nicht) führen zu Neuaufbau.
+    """
+
+    _instanzen = {} # Speicher-Kennung -> Statistik_Engine
+    noten_schritte = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0]
+
+    def __init__(self, student, tabelle):
+        """
+        Baut Statistik vollständig aus Student-DataFrame und Modul_Tabelle auf
+        (Summen, Häufigkeit und Semester als Array-Operationen über die Spalten).
+        """
+        self.studium_start = Daten_Cache().datum_tage(student["Startdatum"].iloc[:1])[0]
+        self.schritt_position = {round(note * 10): i for i, note in enumerate(self.noten_schritte)}
+
+        self.ects_summe = int(tabelle.ects.sum(dtype=np.int64))
+        self.noten_summe = int(tabelle.noten_hundertstel().sum()) # in Hundertsteln -> kein Rundungsdrift
+        self.noten_anzahl = len(tabelle)
+
+        # je Noten-Code zugehöriger Notenschritt (auf Zehntel gerundet, wie ändere_summen), -1 = keiner
+        schritt_je_code = np.array([self.schritt_position.get(round(wert * 10), -1) for wert in tabelle.noten_werte], dtype=np.int64)
+        schritte = schritt_je_code[tabelle.note_codes]
+        self.häufigkeit = np.bincount(schritte[schritte >= 0], minlength=len(self.noten_schritte)).tolist()
+
+        semester = (tabelle.start.astype(np.int64) - int(self.studium_start.astype(np.int64))) // 182 + 1
+        nummern, positionen = np.unique(semester, return_inverse=True)
+        summen = np.bincount(positionen, weights=tabelle.tage, minlength=len(nummern))
+        anzahlen = np.bincount(positionen, minlength=len(nummern))
+        self.semester = {int(nummer): [int(summe), int(anzahl)] for nummer, summe, anzahl in zip(nummern, summen, anzahlen)}
+
+        # chronologischer Verlauf: Prüfungsdatum (Tage seit 1970), Name, Note, Note in Hundertsteln
+        self.ende = tabelle.ende.astype(np.int64).tolist()
+        self.namen = tabelle.namen.tolist()
+        self.noten = tabelle.noten().tolist()
+        self.hundertstel = tabelle.noten_hundertstel().tolist()
+        self._präfix_summe = None # erst bei Bedarf aus hundertstel (präfix_summe)
+        self._prüfsumme_verlauf = None # (Präfixsummen, Hash) zuletzt berechnet
+
+        # je Modulname alle Einträge (Prüfungsdatum, Note, ECTS, Semester, Tage) für Löschen
+        self.einträge = {}
+        for name, datum, note, ects, nummer, tage in zip(self.namen, self.ende, self.noten, tabelle.ects.tolist(), semester.tolist(), tabelle.tage.tolist()):
+            self.einträge.setdefault(name, []).append((datum, note, ects, nummer, tage))
+        self.version = None
+
+    @classmethod
+    def für(cls, speicher):
+        """
+        Gibt aktuelle Statistik zum Speicher zurück, baut sie nur bei fremder
+        Änderung (oder beim ersten Zugriff) neu aus den Daten auf.
+        """
+        version = speicher.version()
+        engine = cls._instanzen.get(speicher.kennung())
+        if engine is None or engine.version != version:
+            engine = cls(speicher.lese_student(), speicher.lese_tabelle())
+            engine.version = version
+            cls._instanzen[speicher.kennung()] = engine
+        return engine
+
+    @classmethod
+    def nach_hinzufügen(cls, speicher, versionen, zeile):
+        """
+        Führt Statistik nach Hinzufügen nach, falls sie dem Stand vor dem Commit entsprach.
+        versionen: (vorher, nachher) vom Speicher unter seiner Sperre gelesen.
+        """
+        engine = cls.vor_commit(speicher, versionen)
+        if engine is not None:
+            engine.füge_hinzu(zeile)
+            engine.version = versionen[1]
+
+    @classmethod
+    def nach_löschen(cls, speicher, versionen, suchwert):
+        """
+        Führt Statistik nach Löschen nach, falls sie dem Stand vor dem Commit entsprach.
+        """
+        engine = cls.vor_commit(speicher, versionen)
+        if engine is not None:
+            engine.lösche(suchwert)
+            engine.version = versionen[1]
+
+    @classmethod
+    def vor_commit(cls, speicher, versionen):
+        """
+        Gibt Statistik zurück, wenn sie genau dem Stand vor dem Commit entspricht.
+        Sonst (fremder Commit dazwischen) wird sie verworfen -> nächstes für() baut neu auf.
+        """
+        engine = cls._instanzen.get(speicher.kennung())
+        if engine is not None and engine.version != versionen[0]:
+            del cls._instanzen[speicher.kennung()]
+            return None
+        return engine
+
+    def datum_tag(self, datum):
+        """
+        Wandelt Datum "TT.MM.JJJJ" in Tage seit 01.01.1970 um (wie Daten_Cache.datum_tage).
+        """
+        return (datetime.strptime(datum, "%d.%m.%Y") - datetime(1970, 1, 1)).days
+
+    def ändere_summen(self, note, ects, nummer, tage, richtung):
+        """
+        Ändert Summen, Häufigkeit und Semesterwerte um einen Eintrag (richtung +1 oder -1).
+        """
+        self.ects_summe += richtung * ects
+        self.noten_summe += richtung * round(note * 100)
+        self.noten_anzahl += richtung
+        position = self.schritt_position.get(round(note * 10))
+        if position is not None:
+            self.häufigkeit[position] += richtung
+
+        werte = self.semester.setdefault(nummer, [0, 0])
+        werte[0] += richtung * tage
+        werte[1] += richtung
+        if werte[1] == 0:
+            del self.semester[nummer]
+
+    @property
+    def präfix_summe(self):
+        """
+        Präfixsummen der Noten im Verlauf in Hundertsteln (int64, ohne Rundungsdrift).
+        Nach Änderungen erst beim nächsten Lesen neu per cumsum berechnet.
+        """
+        präfix = self._präfix_summe
+        if präfix is None:
+            präfix = self._präfix_summe = np.cumsum(np.array(self.hundertstel, dtype=np.int64))
+        return präfix
+
+    def prüfsumme_verlauf(self):
+        """
+        Gibt SHA-256 (hex) des Notenverlaufs zurück (über Bytes der Präfixsummen,
+        die den Verlauf eindeutig bestimmen) -> Schlüssel ohne Tupel aller Noten.
+        """
+        präfix = self.präfix_summe
+        if self._prüfsumme_verlauf is None or self._prüfsumme_verlauf[0] is not präfix:
+            self._prüfsumme_verlauf = (präfix, hashlib.sha256(präfix.tobytes()).hexdigest())
+        return self._prüfsumme_verlauf[1]
+
+    def füge_hinzu(self, zeile):
+        """
+        Nimmt neue Modulzeile auf: Summen in O(1), Position im Verlauf per Binärsuche
+        (hinter gleichem Prüfungsdatum, wie Sortierung im Speicher). Einfügen in die
+        Verlaufslisten verschiebt alle folgenden Einträge (O(n), memmove).
+        """
+        datum = self.datum_tag(zeile["Ende"])
+        note = float(zeile["Note"])
+        ects = int(zeile["ECTS"])
+        tage = int(zeile["Tage"])
+        nummer = (self.datum_tag(zeile["Start"]) - int(self.studium_start.astype(np.int64))) // 182 + 1
+
+        self.ändere_summen(note, ects, nummer, tage, 1)
+        self.einträge.setdefault(zeile["Modul"], []).append((datum, note, ects, nummer, tage))
+
+        position = bisect_right(self.ende, datum)
+        self.ende.insert(position, datum)
+        self.namen.insert(position, zeile["Modul"])
+        self.noten.insert(position, note)
+        self.hundertstel.insert(position, round(note * 100))
+        self._präfix_summe = None
+
+    def lösche(self, suchwert):
+        """
+        Entfernt alle Einträge mit exakt diesem Modulnamen
+        (je Eintrag Binärsuche und Entfernen aus Verlaufslisten in O(n), memmove).
+        """
+        for datum, note, ects, nummer, tage in self.einträge.pop(suchwert, []):
+            self.ändere_summen(note, ects, nummer, tage, -1)
+
+            # Position im Verlauf: Bereich gleichen Datums per Binärsuche, dort Name suchen
+            position = bisect_left(self.ende, datum)
+            while self.namen[position] != suchwert:
+                position += 1
+            del self.ende[position]
+            del self.namen[position]
+            del self.noten[position]
+            del self.hundertstel[position]
+            self._präfix_summe = None
+
+    def mittelwert_noten(self):
+        """
+        Gibt Mittelwert aller Noten zurück (NaN ohne Module).
+        """
+        return self.noten_summe / 100 / self.noten_anzahl if self.noten_anzahl else float("nan")
+
+    def durchschnitt_gleitend(self):
+        """
+        Gibt gleitenden (kumulativen) Durchschnitt im chronologischen Verlauf zurück.
+        """
+        präfix = self.präfix_summe
+        return präfix / 100 / np.arange(1, len(präfix) + 1)
+
+    def durchschnitt_fenster(self, fenster):
+        """
+        Gibt Durchschnitt der jeweils letzten fenster Noten je Position zurück
+        (aus Präfixsummen, vektorisiert; am Anfang über alle bisherigen Noten).
+        """
+        präfix = self.präfix_summe
+        ende = np.arange(len(präfix))
+        anfang = ende - fenster
+        summen = präfix - np.where(anfang >= 0, präfix[np.maximum(anfang, 0)], 0)
+        return summen / 100 / np.minimum(ende + 1, fenster)
+
+    def durchschnitt_semester(self):
+        """
+        Gibt (Semester, durchschnittliche Bearbeitungstage) aufsteigend nach Semester zurück.
+        """
+        nummern = sorted(self.semester)
+        return nummern, [self.semester[nummer][0] / self.semester[nummer][1] for nummer in nummern]
+
+    def verlauf(self):
+        """
+        Gibt (Positionen ab 1, Noten, gleitender Durchschnitt) im chronologischen Verlauf zurück.
+        """
+        return range(1, len(self.noten) + 1), self.noten, self.durchschnitt_gleitend()
+
+
+class Streaming_Statistik:
+    """
+    Statistik wie Statistik_Engine, aber in einem Durchlauf über Modul-CSV in Blöcken
+    (chunk_größe Zeilen) -> Speicherbedarf begrenzt durch Blockgröße, unabhängig von Dateigröße.
+    Für große Modul-Exporte (mehrere GB), die nicht als DataFrame geladen werden können.
+    Erwartet Modul-CSV chronologisch nach Prüfungsdatum (wie von CSV_Speicher geschrieben).
+
+    Einzelne Noten und gleitender Durchschnitt werden nur an höchstens punkte Positionen
+    gehalten: Abstand beginnt bei 1 und verdoppelt sich, sobald mehr Punkte anfallen
+    (jeder zweite Punkt entfällt) -> gleichmäßig verteilte Stichprobe in festem Speicher.
+    Letztes Modul ist immer enthalten.
+    """
+
+    noten_schritte = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0]
+
+    def __init__(self, datei_student="Student.csv", datei_module="Module_abgeschlossen.csv", chunk_größe=100000, punkte=1000):
+        student = pd.read_csv(datei_student, nrows=1, dtype=Daten_Cache.text_spalten)
+        self.studium_start = int(Daten_Cache().datum_tage(student["Startdatum"])[0].astype(np.int64))
+        self.punkte = punkte
+
+        self.ects_summe = 0
+        self.noten_summe = 0 # in Hundertsteln -> kein Rundungsdrift
+        self.noten_anzahl = 0
+        self.häufigkeit = [0] * len(self.noten_schritte)
+        self.semester = {}
+
+        self.positionen = np.array([], dtype=np.int64) # Position ab 1 im chronologischen Verlauf
+        self.noten = [] # Noten an diesen Positionen
+        self.durchschnitte = np.array([], dtype=float)
+        self.abstand = 1
+        self.letzter_punkt = None # (Position, Note, Durchschnitt) des letzten Moduls
+
+        blöcke = pd.read_csv(datei_module, usecols=["ECTS", "Start", "Note", "Tage"], chunksize=chunk_größe,
+                             dtype={"ECTS": np.int64, "Start": str, "Note": float, "Tage": np.int64})
+        for block in blöcke:
+            self.verarbeite(block)
+
+    def verarbeite(self, block):
+        """
+        Nimmt einen Block Module auf: Summen, Häufigkeit, Semester und Verlaufs-Stichprobe.
+        """
+        noten = block["Note"].to_numpy()
+        hundertstel = np.rint(noten * 100).astype(np.int64)
+        summe_vorher = self.noten_summe
+        anzahl_vorher = self.noten_anzahl
+
+        self.ects_summe += int(block["ECTS"].sum())
+        self.noten_summe += int(hundertstel.sum())
+        self.noten_anzahl += len(block)
+
+        # Häufigkeit: Note auf Zehntel gerundet muss Notenschritt entsprechen (wie Statistik_Engine)
+        schritte_zehntel = np.rint(np.array(self.noten_schritte) * 10).astype(np.int64)
+        zehntel = np.rint(noten * 10).astype(np.int64)
+        position = np.clip(np.searchsorted(schritte_zehntel, zehntel), 0, len(schritte_zehntel) - 1)
+        treffer = schritte_zehntel[position] == zehntel
+        for i, anzahl in enumerate(np.bincount(position[treffer], minlength=len(self.noten_schritte))):
+            self.häufigkeit[i] += int(anzahl)
+
+        # Semester: Summe Tage und Anzahl je Semester
+        start = Daten_Cache().datum_tage(block["Start"]).astype(np.int64)
+        semester = (start - self.studium_start) // 182 + 1
+        nummern, gruppen = np.unique(semester, return_inverse=True)
+        summen = np.bincount(gruppen, weights=block["Tage"].to_numpy(), minlength=len(nummern))
+        anzahlen = np.bincount(gruppen, minlength=len(nummern))
+        for nummer, summe, anzahl in zip(nummern.tolist(), summen.tolist(), anzahlen.tolist()):
+            werte = self.semester.setdefault(nummer, [0, 0])
+            werte[0] += int(summe)
+            werte[1] += anzahl
+
+        # gleitender Durchschnitt je Position, nur Stichprobe wird behalten
+        positionen = np.arange(anzahl_vorher + 1, self.noten_anzahl + 1)
+        durchschnitte = (summe_vorher + np.cumsum(hundertstel)) / 100 / positionen
+        self.letzter_punkt = (int(positionen[-1]), float(noten[-1]), float(durchschnitte[-1]))
+        auswahl = (positionen - 1) % self.abstand == 0
+        self.positionen = np.concatenate([self.positionen, positionen[auswahl]])
+        self.noten.extend(noten[auswahl].tolist())
+        self.durchschnitte = np.concatenate([self.durchschnitte, durchschnitte[auswahl]])
+        while len(self.positionen) > self.punkte:
+            self.abstand *= 2
+            behalten = (self.positionen - 1) % self.abstand == 0
+            self.positionen = self.positionen[behalten]
+            self.noten = [note for note, bleibt in zip(self.noten, behalten) if bleibt]
+            self.durchschnitte = self.durchschnitte[behalten]
+
+    def mittelwert_noten(self):
+        """
+        Gibt Mittelwert aller Noten zurück (NaN ohne Module).
+        """
+        return self.noten_summe / 100 / self.noten_anzahl if self.noten_anzahl else float("nan")
+
+    def durchschnitt_semester(self):
+        """
+        Gibt (Semester, durchschnittliche Bearbeitungstage) aufsteigend nach Semester zurück.
+        """
+        nummern = sorted(self.semester)
+        return nummern, [self.semester[nummer][0] / self.semester[nummer][1] for nummer in nummern]
+
+    def verlauf(self):
+        """
+        Gibt Stichprobe (Positionen ab 1, Noten, gleitender Durchschnitt) inkl. letztem Modul zurück.
+        """
+        positionen, noten, durchschnitte = self.positionen.tolist(), list(self.noten), self.durchschnitte.tolist()
+        if self.letzter_punkt is not None and (not positionen or positionen[-1] != self.letzter_punkt[0]):
+            positionen.append(self.letzter_punkt[0])
+            noten.append(self.letzter_punkt[1])
+            durchschnitte.append(self.letzter_punkt[2])
+        return positionen, noten, durchschnitte
+
+    def prüfsumme_verlauf(self):
+        """
+        Gibt SHA-256 (hex) der Stichprobe des Notenverlaufs zurück (höchstens punkte Einträge).
+        """
+        return hashlib.sha256(repr(self.verlauf()).encode("utf-8")).hexdigest()
+
+    def durchschnitt_fenster(self, fenster):
+        """
+        Nicht verfügbar: Stichprobe enthält nicht jede Note -> kein Durchschnitt über letzte fenster Noten.
+        """
+        return None
+
+
+class Ausdünnung:
+    """
+    Ausdünnung langer Verläufe auf etwa so viele Punkte, wie Pixel zur Verfügung stehen.
+    - lttb: Largest-Triangle-Three-Buckets, je Eimer der Punkt mit größter Dreiecksfläche
+      zum vorher gewählten Punkt und Mittel des nächsten Eimers -> Form bleibt erhalten
+    - min_max: je Eimer kleinster und größter Wert (in Reihenfolge) -> Ausreißer bleiben sichtbar
+    Erster und letzter Punkt bleiben immer erhalten.
+    """
+
+    verfahren = ("lttb", "min_max")
+
+    def lttb(self, x, y, ziel):
+        """
+        Gibt Positionen von ziel Punkten nach LTTB zurück (alle, wenn nicht mehr Punkte vorhanden).
+        """
+        anzahl = len(x)
+        if ziel >= anzahl or ziel < 3:
+            return np.arange(anzahl)
+        grenzen = np.linspace(1, anzahl - 1, ziel - 1).astype(np.int64) # ziel - 2 Eimer zwischen erstem und letztem Punkt
+        positionen = np.empty(ziel, dtype=np.int64)
+        positionen[0], positionen[-1] = 0, anzahl - 1
+        gewählt = 0
+        for eimer in range(ziel - 2):
+            anfang, ende = grenzen[eimer], grenzen[eimer + 1]
+            if eimer + 2 < len(grenzen):
+                mittel_x, mittel_y = x[ende:grenzen[eimer + 2]].mean(), y[ende:grenzen[eimer + 2]].mean()
+            else:
+                mittel_x, mittel_y = x[-1], y[-1]
+            fläche = np.abs((x[gewählt] - mittel_x) * (y[anfang:ende] - y[gewählt])
+                            - (x[gewählt] - x[anfang:ende]) * (mittel_y - y[gewählt]))
+            gewählt = anfang + int(np.argmax(fläche))
+            positionen[eimer + 1] = gewählt
+        return positionen
+
+    def min_max(self, y, ziel):
+        """
+        Gibt Positionen von Minimum und Maximum je Eimer zurück (ziel // 2 Eimer, vektorisiert).
+        """
+        anzahl = len(y)
+        eimer_anzahl = ziel // 2
+        if ziel >= anzahl or eimer_anzahl < 1:
+            return np.arange(anzahl)
+        grenzen = np.linspace(0, anzahl, eimer_anzahl + 1).astype(np.int64)[:-1]
+        eimer = np.repeat(np.arange(eimer_anzahl), np.diff(np.append(grenzen, anzahl)))
+        # erste Position je Eimer, an der Minimum bzw. Maximum erreicht wird
+        minimum = np.flatnonzero(y == np.minimum.reduceat(y, grenzen)[eimer])
+        maximum = np.flatnonzero(y == np.maximum.reduceat(y, grenzen)[eimer])
+        minimum = minimum[np.unique(eimer[minimum], return_index=True)[1]]
+        maximum = maximum[np.unique(eimer[maximum], return_index=True)[1]]
+        return np.unique(np.concatenate([[0], minimum, maximum, [anzahl - 1]]))
+
+    def bereich(self, x, y, links, rechts, ziel, verfahren="lttb"):
+        """
+        Gibt ausgedünnte (x, y) des sichtbaren Bereichs links bis rechts zurück
+        (x aufsteigend, je ein Punkt außerhalb, damit Linie bis zum Rand reicht).
+        Aufwand für Zeichnen hängt nur von ziel ab, nicht von Länge des Verlaufs.
+        """
+        anfang = max(int(np.searchsorted(x, links, side="left")) - 1, 0)
+        ende = min(int(np.searchsorted(x, rechts, side="right")) + 1, len(x))
+        x, y = x[anfang:ende], y[anfang:ende]
+        positionen = self.lttb(x, y, ziel) if verfahren == "lttb" else self.min_max(y, ziel)
+        return x[positionen], y[positionen]
+
+
+class Abschluss_Prognose:
+    """
+    Monte-Carlo-Prognose von Abschlussdatum und Endnote.
+    Je Trajektorie werden restliche Module aus den bisherigen Modulen des Studenten gezogen
+    (mit Zurücklegen, Tage/ECTS/Note einer Zeile gemeinsam), bis ects_gesamt erreicht sind.
+    Gezogene Tage werden mit bisherigem Tempo in Kalendertage umgerechnet
+    (Kalendertage von Studienstart bis letzter Prüfung je Bearbeitungstag -> erfasst
+    parallele Module und Pausen). Endnote = Mittel aller bisherigen und gezogenen Noten.
+    Alle Trajektorien (und alle Studenten einer Kohorte) sind eine Array-Berechnung
+    (Studenten x Trajektorien x Module), bei großen Kohorten in Blöcken bis max_elemente.
+    ECTS, Note (Hundertstel) und Tage einer Zeile sind in eine Ganzzahl gepackt
+    -> nur ein Zugriff und eine kumulierte Summe je gezogenem Modul. Gezogen und summiert
+    wird je Block in Teilen der Trajektorien bis teil_elemente (bleibt im Cache).
+    Module ohne ECTS zählen für Tempo und Note, werden aber nicht gezogen.
+    Ergebnisse werden je Datenbestand bis zur nächsten Änderung (oder bis zum nächsten Tag) vorgehalten.
+    """
+
+    _ergebnisse = {} # Kennung -> (Schlüssel aus Version, Tag und Parametern, Ergebnis)
+    ects_gesamt = 180
+    regelstudienzeit = 1095 # Tage
+    perzentile = (5, 25, 50, 75, 95)
+    max_elemente = 4000000 # Elemente je Block (Studenten x Trajektorien x Module)
+    teil_elemente = 1 << 16 # gepackte Elemente je Teil eines Blocks (512 KiB int64)
+
+    def __init__(self, trajektorien=100000, seed=42):
+        self.trajektorien = trajektorien
+        self.seed = seed
+
+    def heute(self):
+        return int(np.datetime64(datetime.today(), "D").astype(np.int64))
+
+    def vorgehalten(self, kennung, version, berechne):
+        """
+        Gibt vorgehaltenes Ergebnis zurück oder berechnet es (berechne()) bei neuer Version/neuem Tag.
+        """
+        schlüssel = (version, self.heute(), self.trajektorien, self.seed, self.ects_gesamt)
+        eintrag = self._ergebnisse.get(kennung)
+        if eintrag is None or eintrag[0] != schlüssel:
+            eintrag = (schlüssel, berechne())
+            self._ergebnisse[kennung] = eintrag
+        return eintrag[1]
+
+    def für(self, speicher):
+        """
+        Gibt Prognose eines Studenten (Speicher-Backend) zurück, None ohne Module mit ECTS.
+        """
+        return self.vorgehalten(speicher.kennung(), speicher.version(),
+                                lambda: self.prognose_student(speicher.lese_student(), speicher.lese_tabelle()))
+
+    def prognose_student(self, student, tabelle):
+        """
+        Gibt Prognose aus Student-DataFrame und Modul_Tabelle zurück: Perzentile von Abschlussdatum,
+        Endnote und Anzahl restlicher Module, Anteil innerhalb Regelstudienzeit und Verteilung je Monat.
+        """
+        studium_start = Daten_Cache().datum_tage(student["Startdatum"].iloc[:1]).astype(np.int64)
+        gruppe = np.zeros(len(tabelle), dtype=np.int64)
+        ergebnis = None
+        for _, abschluss, endnote, module, ects_rest in self.simuliere(
+                gruppe, tabelle.ects, tabelle.tage, tabelle.noten_hundertstel(), tabelle.ende, studium_start):
+            monate, anzahl = np.unique(abschluss.astype("datetime64[D]").astype("datetime64[M]"), return_counts=True)
+            ergebnis = {
+                "trajektorien": abschluss.shape[1],
+                "ects_rest": int(ects_rest[0]),
+                "abschluss": dict(zip(self.perzentile, tabelle.datum_texte(np.percentile(abschluss[0], self.perzentile).round()).tolist())),
+                "endnote": {p: round(float(wert), 2) for p, wert in zip(self.perzentile, np.percentile(endnote[0], self.perzentile))},
+                "endnote_mittel": round(float(endnote[0].mean()), 2),
+                "module_rest": {p: int(wert) for p, wert in zip(self.perzentile, np.percentile(module[0], self.perzentile).round())},
+                "regelstudienzeit": float((abschluss[0] <= studium_start[0] + self.regelstudienzeit).mean()),
+                "verteilung": [(monat.item().strftime("%m.%Y"), float(wert / abschluss.shape[1])) for monat, wert in zip(monate, anzahl)]
+            }
+        return ergebnis
+
+    def simuliere(self, gruppe, ects, tage, hundertstel, ende, studium_start):
+        """
+        Simuliert alle Studenten mit Modulen (gruppe = Student-Position je Modulzeile).
+        Gibt Blöcke (Studenten-Positionen, Abschluss, Endnote, restliche Module, restliche ECTS)
+        zurück, Arrays je Student x Trajektorie; Abschluss in Tagen seit 1970.
+        Studenten mit erreichten ects_gesamt haben Abschluss = letzte Prüfung.
+        """
+        anzahl_studenten = len(studium_start)
+        gruppe = np.asarray(gruppe, dtype=np.int64)
+        ects = np.asarray(ects, dtype=np.int64)
+        tage = np.maximum(np.asarray(tage, dtype=np.int64), 0)
+        hundertstel = np.asarray(hundertstel, dtype=np.int64)
+        ende = np.asarray(ende, dtype=np.int64)
+        studium_start = np.asarray(studium_start, dtype=np.int64)
+
+        # bisheriger Stand je Student
+        ects_rest = np.maximum(self.ects_gesamt - np.bincount(gruppe, weights=ects, minlength=anzahl_studenten).astype(np.int64), 0)
+        noten_summe = np.bincount(gruppe, weights=hundertstel, minlength=anzahl_studenten)
+        noten_anzahl = np.bincount(gruppe, minlength=anzahl_studenten)
+        tage_summe = np.bincount(gruppe, weights=tage, minlength=anzahl_studenten)
+        letzte_prüfung = studium_start.copy()
+        np.maximum.at(letzte_prüfung, gruppe, ende)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            tempo = np.where(tage_summe > 0, (letzte_prüfung - studium_start) / tage_summe, 1.0)
+        tempo = np.where(tempo > 0, tempo, 1.0)
+        beginn = np.maximum(letzte_prüfung, self.heute()) # restliche Module ab heute
+
+        # Ziehungsbestand: Module mit ECTS, nach Student sortiert (Position + Anzahl je Student)
+        bestand = np.flatnonzero(ects > 0)
+        bestand = bestand[np.argsort(gruppe[bestand], kind="stable")]
+        bestand_anzahl = np.bincount(gruppe[bestand], minlength=anzahl_studenten)
+        bestand_anfang = np.cumsum(bestand_anzahl) - bestand_anzahl
+        kleinste_ects = np.ones(anzahl_studenten, dtype=np.int64)
+        größte_ects = np.ones(anzahl_studenten, dtype=np.int64)
+        belegt = bestand_anzahl > 0
+        if belegt.any():
+            kleinste_ects[belegt] = np.minimum.reduceat(ects[bestand], bestand_anfang[belegt])
+            größte_ects[belegt] = np.maximum.reduceat(ects[bestand], bestand_anfang[belegt])
+        spalten = -(-ects_rest // kleinste_ects) # höchstens nötige Module
+        einheitlich = kleinste_ects == größte_ects # alle Module gleich viele ECTS -> genau spalten Module nötig
+
+        # ECTS | Hundertstel | Tage gepackt, Bitbreite reicht für Summe über alle Spalten.
+        # ECTS entfallen, wenn alle Studenten einheitlich sind (Modulanzahl steht fest).
+        # Passt alles in 32 Bit, halber Speicher je gezogenem Modul (uint32 statt int64).
+        breite_max = int(spalten.max()) if anzahl_studenten else 0
+        gezählt = ects if not einheitlich[belegt].all() else np.zeros_like(ects)
+        bits = [max(int(werte.max(initial=0)) * breite_max, 1).bit_length() for werte in (gezählt, hundertstel, tage)]
+        if sum(bits) > 63:
+            raise ValueError("Werte zu groß für Prognose (ECTS, Note oder Tage)")
+        gepackt_typ = np.uint32 if sum(bits) <= 32 else np.int64
+        gepackt = (gezählt | (hundertstel << bits[0]) | (tage << (bits[0] + bits[1])))[bestand].astype(gepackt_typ)
+        maske_ects = (1 << bits[0]) - 1
+        maske_noten = (1 << bits[1]) - 1
+
+        fertig = np.flatnonzero(belegt & (ects_rest == 0))
+        if len(fertig):
+            form = (len(fertig), self.trajektorien)
+            yield (fertig, np.broadcast_to(letzte_prüfung[fertig, None], form),
+                   np.broadcast_to((noten_summe[fertig] / noten_anzahl[fertig] / 100)[:, None], form),
+                   np.zeros(form, dtype=np.int64), ects_rest[fertig])
+
+        # Studenten nach Anzahl Spalten sortiert -> Blöcke mit ähnlicher Breite
+        offen = np.flatnonzero(belegt & (ects_rest > 0))
+        offen = offen[np.argsort(spalten[offen], kind="stable")]
+        zufall = np.random.default_rng(self.seed)
+        position = 0
+        while position < len(offen):
+            kosten = np.arange(1, len(offen) - position + 1) * self.trajektorien * spalten[offen[position:]]
+            block = offen[position:position + max(1, int(np.searchsorted(kosten, self.max_elemente, side="right")))]
+            position += len(block)
+            breite = int(spalten[block].max())
+
+            # gezogene Modulzeilen (Studenten x Trajektorien x Module), kumuliert entlang der Module,
+            # je Teil der Trajektorien (schritt) -> gepackter Block bleibt klein statt voller Breite im Speicher
+            anzahl = bestand_anzahl[block]
+            typ = np.uint16 if anzahl.max() < 1 << 16 else np.int64
+            schritt = max(1, self.teil_elemente // (len(block) * breite))
+            summe = np.empty((len(block), self.trajektorien), dtype=np.int64)
+            module = np.empty((len(block), self.trajektorien), dtype=np.int64)
+            fest = bool(einheitlich[block].all())
+            if fest:
+                module[:] = spalten[block, None]
+                # Spalten über spalten des Studenten entfallen (bei gleicher Breite aller Studenten keine Maske)
+                gültig = True if (spalten[block] == breite).all() else np.arange(breite) < spalten[block, None, None]
+            for von in range(0, self.trajektorien, schritt):
+                bis = min(von + schritt, self.trajektorien)
+                form = (len(block), bis - von, breite)
+                if len(block) == 1: # ein Student: skalare Grenze (deutlich schneller als je Student)
+                    anfang = bestand_anfang[block[0]]
+                    summen = gepackt[anfang:anfang + anzahl[0]][zufall.integers(0, anzahl[0], size=form, dtype=typ)]
+                else:
+                    summen = gepackt[bestand_anfang[block, None, None] + zufall.integers(0, anzahl[:, None, None], size=form, dtype=typ)]
+                if fest: # Modulanzahl steht fest -> Summe statt kumulierter Summe, kein Vergleich je Modul
+                    summe[:, von:bis] = summen.sum(axis=2, dtype=gepackt_typ, where=gültig)
+                    continue
+                np.cumsum(summen, axis=2, out=summen)
+                erreicht = (summen & maske_ects) >= ects_rest[block, None, None]
+                letztes = erreicht.argmax(axis=2)[..., None] # Position des Moduls, mit dem ects_gesamt erreicht ist
+                summe[:, von:bis] = np.take_along_axis(summen, letztes, axis=2)[..., 0]
+                module[:, von:bis] = letztes[..., 0] + 1
+            tage_rest = summe >> (bits[0] + bits[1])
+            noten_rest = (summe >> bits[0]) & maske_noten
+
+            abschluss = beginn[block, None] + np.ceil(tage_rest * tempo[block, None]).astype(np.int64)
+            endnote = (noten_summe[block, None] + noten_rest) / (noten_anzahl[block, None] + module) / 100
+            yield block, abschluss, endnote, module, ects_rest[block]
+
+
+class Plots_Berechnungen:
+    """
+    Berechnungs- und Visualisierungsklasse.
+    Verarbeitet CSV-Daten, erstellt statistische Auswertungen, Diagramme und Tabelle.
+    Nutzt pandas, numpy und matplotlib (via Figure, für später flexible Anpassbarkeit in GUI).
+    """
+
+    # Größe (Zoll) und Auflösung je Diagramm/Tabelle, genutzt von GUI und Bericht_Renderer
+    figur_formate = {
+        "plot_zeit_ects": ((8, 1.5), 90),
+        "plot_verteilung_noten": ((4, 4), 90),
+        "plot_verlauf_noten": ((4, 4), 90),
+        "plot_dauer_modul_semester": ((2, 7), 90),
+        "tabelle_module": ((3, 3), 100)
+    }
+    verlauf_fenster = () # Fenstergrößen (Module) gleitender Durchschnitte im Notenverlauf, z. B. (5, 20)
+    verlauf_ausdünnung = "lttb" # Verfahren aus Ausdünnung.verfahren für lange Verläufe
+
+    def __init__(self, speicher=None, streaming=False, chunk_größe=100000):
+        # Spalten kommen über Speicher-Backend (Standard CSV_Speicher -> gemeinsamer Daten_Cache)
+        # DataFrames werden nur gelesen, nie verändert
+        # Kennzahlen kommen aus laufender Statistik_Engine (keine Neuberechnung über alle Module)
+        # streaming=True: Kennzahlen blockweise aus Modul-CSV (Streaming_Statistik), ohne Modul-DataFrame
+        self.speicher = speicher or CSV_Speicher()
+        self.read_student_csv = self.speicher.lese_student()
+        self.streaming = streaming
+        if streaming:
+            if not isinstance(self.speicher, CSV_Speicher):
+                raise ValueError("Streaming-Modus benötigt CSV_Speicher")
+            self.statistik = Streaming_Statistik(self.speicher.datei_student, self.speicher.datei_module, chunk_größe)
+        else:
+            self.statistik = Statistik_Engine.für(self.speicher)
+        self.module = None
+        self.tabelle = None
+        
+        self.tage_vergangen = (datetime.today() - pd.to_datetime(self.read_student_csv.at[0, "Startdatum"], dayfirst=True)).days # berechnet vergangene Tage seit Studienstart
+        self.ects_summe = self.statistik.ects_summe # bisher gesammelte ECTS-Punkte
+        self.noten_schritte = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0] # legt Notenschitte in Diagrammachsen fest
+
+    @property
+    def read_module_csv(self):
+        """
+        Modul-DataFrame mit allen Spalten der Modul-CSV, erst bei Bedarf gelesen
+        (Tabelle nutzt tabelle_ansicht).
+        Im Streaming-Modus nicht verfügbar (würde gesamte Datei laden).
+        """
+        if self.streaming:
+            raise ValueError("Modul-Tabelle im Streaming-Modus nicht verfügbar")
+        if self.module is None:
+            self.module = self.speicher.lese_module()
+        return self.module
+
+    @property
+    def modul_tabelle(self):
+        """
+        Modul_Tabelle des Speichers (CSV_Speicher: per mmap aus Spaltendatei, ohne Modul-CSV
+        zu parsen), einmal je Instanz geholt -> Tabelle und Schlüssel zeigen denselben Stand.
+        Im Streaming-Modus nicht verfügbar.
+        """
+        if self.streaming:
+            raise ValueError("Modul-Tabelle im Streaming-Modus nicht verfügbar")
+        if self.tabelle is None:
+            self.tabelle = self.speicher.lese_tabelle()
+        return self.tabelle
+
+    @property
+    def tabelle_ansicht(self):
+        """
+        Spalten Modul, Tage, Note aus modul_tabelle (für Tabelle der GUI und tabelle_module).
+        """
+        return self.modul_tabelle.ansicht()
+
+    def bereite_figur(self, fig, figsize, dpi):
+        """
+        Gibt Figure zum Zeichnen zurück.
+        Ohne übergebene Figure wird neue erstellt, sonst wird vorhandene geleert
+        und wiederverwendet (Canvas in GUI bleibt bestehen).
+        """
+        if fig is None:
+            from matplotlib.figure import Figure # erst bei erster Figure importiert (schneller Start)
+            return Figure(figsize=figsize, dpi=dpi)
+        fig.clear()
+        return fig
+
+    def render_schlüssel(self, methode, fig, eingaben=None):
+        """
+        Gibt Schlüssel für Render_Cache aus Eingabedaten und aktueller Pixelgröße/dpi der Figure zurück.
+        eingaben: bereits bestimmte panel_eingaben(methode), sonst hier bestimmt.
+        """
+        if eingaben is None:
+            eingaben = self.panel_eingaben(methode)
+        return Render_Cache().schlüssel(methode, eingaben, round(fig.bbox.width), round(fig.bbox.height), fig.dpi)
+
+    def zeige_raster(self, fig, raster):
+        """
+        Ersetzt Inhalt der Figure durch gespeichertes Raster (Kopie der Pixel statt Neuzeichnen).
+        """
+        fig.clear()
+        fig.figimage(raster, xo=0, yo=0, resize=False, origin="upper")
+        return fig
+
+    def panel_eingaben(self, methode):
+        """
+        Gibt für jede Plot-/Tabellen-Methode einen vergleichbaren Schlüssel
+        ihrer Eingabedaten zurück. Gleicher Schlüssel -> gleiche Darstellung,
+        Panel muss bei Aktualisierung nicht neu gezeichnet werden.
+        Lange Reihen (Notenverlauf, Modultabelle) gehen als Prüfsumme ein, nicht als Tupel.
+        """
+        if methode == "plot_zeit_ects":
+            return (self.tage_vergangen, self.ects_summe)
+        if methode == "plot_verteilung_noten":
+            return tuple(self.statistik.häufigkeit)
+        if methode == "plot_verlauf_noten":
+            return (self.statistik.noten_anzahl, self.statistik.prüfsumme_verlauf(), tuple(self.verlauf_fenster), self.verlauf_ausdünnung)
+        if methode == "plot_dauer_modul_semester":
+            return tuple(map(tuple, self.statistik.durchschnitt_semester()))
+        if methode == "tabelle_module":
+            return self.modul_tabelle.prüfsumme()
+        raise ValueError(f"Unbekannte Methode: {methode}")
+
+    def zahl_mittelwert_noten(self):
+        """
+        Gibt Mittelwert aller Noten (aus Statistik_Engine) gerundet auf 2 Nachkommastellen zurück.
+        """
+        mittelwert = self.statistik.mittelwert_noten()
+        return round(mittelwert, 2)
+
+    def zahl_abweichung_zeitplan(self):
+        """
+        Berechnet:
+        - vergangene Tage seit Studienbeginn prozentual von Studiendauer 
+        - erreichte ECTS-Punkten prozentual von gesamten ECTS-Punkten
+        
+        Vergleicht beide prozentualen Werte und gibt Abweichung zum Zeitplan
+        in Tagen der Gesamtstudiendauer aus.
+        Gibt positive oder negative Abweichung in Tagen als Text zurück.
+        """
+        self.fortschritt_zeit_prozentual = 100 / 1095 * self.tage_vergangen
+        self.fortschritt_ects_prozentual = 100 / 180 * self.ects_summe
+        
+        abweichung = int(np.floor((self.fortschritt_ects_prozentual - self.fortschritt_zeit_prozentual) / 100 * 1095))
+
+        if abweichung >= 0:
+            return f"{abweichung} Tage vor dem Zeitplan" # f-Str nötig bei Ausgabe Variablen
+        else:
+            return f"{abweichung} Tage hinter dem Zeitplan"
+
+    def prognose_abschluss(self, trajektorien=100000):
+        """
+        Gibt Monte-Carlo-Prognose von Abschlussdatum und Endnote zurück (Abschluss_Prognose,
+        vorgehalten bis zur nächsten Datenänderung), None ohne Module mit ECTS.
+        Im Streaming-Modus nicht verfügbar (braucht alle Module).
+        """
+        if self.streaming:
+            raise ValueError("Prognose im Streaming-Modus nicht verfügbar")
+        return Abschluss_Prognose(trajektorien).für(self.speicher)
+
+    def zahl_prognose_abschluss(self):
+        """
+        Gibt Prognose als Text zurück: Median und 90-%-Band von Abschlussdatum und Endnote.
+        """
+        prognose = self.prognose_abschluss()
+        if prognose is None:
+            return "Keine Prognose ohne abgeschlossene Module"
+        abschluss, endnote = prognose["abschluss"], prognose["endnote"]
+        return (f"Abschluss voraussichtlich {abschluss[50][3:]} (90 %: {abschluss[5][3:]} bis {abschluss[95][3:]}), "
+                f"Endnote {endnote[50]:.2f} ({endnote[5]:.2f} bis {endnote[95]:.2f})")
+
+    def plot_zeit_ects(self, fig=None):
+        """
+        Erstellt horizontales Balkendiagramm mit:
+        - vergangenen Tage seit Studienbeginn prozentual von Studiendauer 
+        - erreichten ECTS-Punkten prozentual von gesamten ECTS-Punkten
+        """
+        tage_insgesamt = 1095
+        ects_gesamt = 180
+
+        werte = np.clip([
+            (self.tage_vergangen / tage_insgesamt) * 100,
+            (self.ects_summe / ects_gesamt) * 100
+        ], 0, 100)
+
+        labels = ["Zeit vergangen", "ECTS erreicht"]
+
+        fig = self.bereite_figur(fig, *self.figur_formate["plot_zeit_ects"])
+        ax = fig.add_subplot(111)
+        ax.barh(labels, werte, color="black", alpha=0.8)
+        ax.set_xlim(0, 100)
+        ax.set_xlabel("Fortschritt in %")
+        ax.invert_yaxis()
+        fig.tight_layout()
+
+        for i, v in enumerate(werte):
+            ax.text(v + 1, i, f"{v:.1f}%", va="center") # zeigt Prozentwerte an
+
+        return fig
+
+    def plot_verteilung_noten(self, fig=None):
+        """
+        Erstellt Histogramm der erreichten Noten (Häufigkeitsverteilung).
+        """
+        from matplotlib import ticker
+
+        häufigkeit = pd.Series(self.statistik.häufigkeit, index=self.noten_schritte) # Anzahl je Notenschritt aus Statistik_Engine
+
+        fig = self.bereite_figur(fig, *self.figur_formate["plot_verteilung_noten"])
+        ax = fig.add_subplot(111)
+        ax.bar(häufigkeit.index.astype(str), häufigkeit.values, color="#468FD7")
+        ax.set_xlabel("Note")
+        ax.set_ylabel("Häufigkeit")
+        ax.set_xticklabels(häufigkeit.index.astype(str), rotation=45)
+        ax.yaxis.set_major_locator(ticker.MaxNLocator(integer=True))
+        ax.grid(axis="y")
+        fig.tight_layout()
+
+        return fig
+
+    def plot_verlauf_noten(self, fig=None):
+        """
+        Erstellt Liniendiagramm mit chronologischem Notenverlauf.
+        Zeigt tatsächliche Noten, gleitenden Durchschnitt und Durchschnitte über
+        die letzten verlauf_fenster Module.
+        Mehr Punkte als Pixel in Achsenbreite werden ausgedünnt (Ausdünnung), bei Zoom
+        und Verschieben (xlim_changed) nur der sichtbare Bereich neu -> Zeichenaufwand
+        hängt von Pixelbreite ab, nicht von Anzahl Module.
+        """
+        from matplotlib import ticker
+
+        # chronologisch, aus Statistik_Engine (Präfixsummen) bzw. Stichprobe der Streaming_Statistik
+        index, noten, durchschnitt_gleitend = self.statistik.verlauf()
+        x = np.asarray(index, dtype=float)
+        reihen = [
+            (np.asarray(noten, dtype=float), {"marker": "o", "label": "Tatsächliche Note", "color": "black"}),
+            (np.asarray(durchschnitt_gleitend, dtype=float), {"linewidth": 4, "alpha": 0.3, "label": "Gleitender Durchschnitt", "color": "#468FD7"})
+        ]
+        farben = ["#D7468F", "#46A36B", "#D7A046", "#7B46D7"]
+        for nummer, fenster in enumerate(self.verlauf_fenster):
+            werte = self.statistik.durchschnitt_fenster(fenster)
+            if werte is not None:
+                reihen.append((werte, {"linewidth": 1.5, "label": f"Durchschnitt letzte {fenster}", "color": farben[nummer % len(farben)]}))
+
+        fig = self.bereite_figur(fig, *self.figur_formate["plot_verlauf_noten"])
+        ax = fig.add_subplot(111)
+        ziel = max(3, round(ax.bbox.width)) # etwa ein Punkt je Pixel der Achsenbreite
+        ausdünnung = Ausdünnung()
+        linien = []
+        for werte, stil in reihen:
+            linie, = ax.plot(*ausdünnung.bereich(x, werte, -np.inf, np.inf, ziel, self.verlauf_ausdünnung), **stil)
+            linien.append((linie, werte))
+        if len(x) > ziel:
+            linien[0][0].set_marker("") # Marker nur, solange jedes Modul einzeln zu sehen ist
+            # Grenzen aus vollständigen Daten (Ausdünnung kann einzelne Extremwerte auslassen)
+            ax.update_datalim([(x[0], min(werte.min() for werte, _ in reihen)), (x[-1], max(werte.max() for werte, _ in reihen))])
+
+        def bei_bereich(achse):
+            links, rechts = achse.get_xlim()
+            for linie, werte in linien:
+                linie.set_data(*ausdünnung.bereich(x, werte, min(links, rechts), max(links, rechts), ziel, self.verlauf_ausdünnung))
+            linien[0][0].set_marker("o" if len(linien[0][0].get_xdata()) < ziel else "")
+
+        ax.set_xlabel("Modul (chronologisch)")
+        ax.set_ylabel("Note")
+        ax.xaxis.set_major_locator(ticker.MaxNLocator(integer=True))
+        ax.set_yticks(self.noten_schritte)
+        ax.invert_yaxis()
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
+        ax.get_xlim() # Grenzen jetzt festlegen, Rückruf erst für spätere Änderungen (Zoom/Verschieben)
+        ax.callbacks.connect("xlim_changed", bei_bereich)
+
+        return fig
+
+    def plot_dauer_modul_semester(self, fig=None):
+        """
+        Erstellt Balkendiagramm durchschnittlicher Bearbeitungstage für ein 
+        Modul je Semester.
+
+        Semester wird aus Differenz Tage zum Studienstart (alle 182 Tage) berechnet.
+        Jedem Modul wird anhand seines Startdatums das jeweilige Semester zugeordnet.
+        Summe und Anzahl je Semester führt Statistik_Engine laufend mit.
+        """ 
+        semester, werte = self.statistik.durchschnitt_semester()
+        durchschnitt = pd.Series(werte, index=pd.Index(semester, name="Semester"), dtype=float)
+
+        fig = self.bereite_figur(fig, *self.figur_formate["plot_dauer_modul_semester"])
+        ax = fig.add_subplot(111)
+        ax.bar(durchschnitt.index, durchschnitt.values, color="#468FD7", width=0.6)
+        ax.set_xlabel("Semester")
+        ax.set_ylabel("Durchschn. Bearbeitungstage pro Modul je Semester")
+        ax.set_xticks(durchschnitt.index)
+        ax.grid(axis="y")
+        fig.tight_layout()
+
+        return fig
+
+    def tabelle_module(self, fig=None):
+        """
+        Erstellt Tabelle mit Modulen, Noten und Bearbeitungstagen.
+        Zeigt nur relevante Spalten aus Modul-CSV.
+        """
+        module_csv_kurz = self.tabelle_ansicht
+
+        fig = self.bereite_figur(fig, *self.figur_formate["tabelle_module"])
+        ax = fig.add_subplot(111)
+        ax.axis('off')
+
+        table = ax.table(
+            cellText=module_csv_kurz.values,
+            colLabels=module_csv_kurz.columns,
+            loc='center',
+            cellLoc='center'
+        )
+
+        # passt Spaltenbreite automatisch an und segt Schriftgröße fest
+        table.auto_set_column_width(col=list(range(len(module_csv_kurz.columns))))
+        table.auto_set_font_size(False)
+        table.set_fontsize(9)
+        fig.tight_layout()
+
+        return fig
+
+
+class Kohorte_Berechnungen:
+    """
+    Berechnungsklasse für Kohorten-Modus (Kohorte_Student.csv + Kohorte_Module.csv).
+    Berechnet Kennzahlen aus Plots_Berechnungen für alle Studenten in einem Durchlauf
+    sowie Perzentile der Kohorte. Ergebnisse sind DataFrames mit Matrikelnummer als Index.
+
+    Gruppierung je Matrikelnummer erfolgt einmalig über Ganzzahl-Codes (Position des
+    Studenten), Summen/Anzahlen je Gruppe dann per np.bincount statt groupby über Strings
+    -> keine Schleife über Studenten, Laufzeit linear in Anzahl Module.
+    """
+
+    def __init__(self, datei_student="Kohorte_Student.csv", datei_module="Kohorte_Module.csv"):
+        self.dateien = (datei_student, datei_module)
+        # DataFrames aus gemeinsamem Daten_Cache -> werden nur gelesen, nie verändert
+        self.read_student_csv = Daten_Cache().lese_csv(datei_student)
+        self.read_module_csv = Daten_Cache().lese_csv(datei_module)
+        self.noten_schritte = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0]
+
+        self.matrikelnummern = pd.Index(self.read_student_csv["Matrikelnummer"], name="Matrikelnummer")
+        self.studium_start = Daten_Cache().datum_tage(self.read_student_csv["Startdatum"])
+        self.tage_vergangen = (np.datetime64(datetime.today(), "D") - self.studium_start).astype(np.int64)
+
+        # Student je Modulzeile als Position in matrikelnummern, Module unbekannter Studenten entfallen
+        codes = self.matrikelnummern.get_indexer(self.read_module_csv["Matrikelnummer"])
+        self.bekannt = codes >= 0
+        self.codes = codes[self.bekannt]
+
+    def spalte(self, name):
+        """
+        Gibt Modulspalte als NumPy-Array zurück (nur Zeilen bekannter Studenten).
+        """
+        return self.read_module_csv[name].to_numpy()[self.bekannt]
+
+    def kennzahlen(self):
+        """
+        Gibt je Student ECTS-Summe, Notenschnitt (2 Nachkommastellen) und
+        Abweichung zum Zeitplan in Tagen zurück (gleiche Rechnung wie
+        Plots_Berechnungen.zahl_abweichung_zeitplan, positiv = vor dem Zeitplan).
+        Studenten ohne Module haben ECTS 0 und keinen Notenschnitt (NaN).
+        """
+        anzahl_studenten = len(self.matrikelnummern)
+        ects_summe = np.bincount(self.codes, weights=self.spalte("ECTS"), minlength=anzahl_studenten)
+        anzahl_noten = np.bincount(self.codes, minlength=anzahl_studenten)
+        summe_noten = np.bincount(self.codes, weights=self.spalte("Note"), minlength=anzahl_studenten)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mittelwert = np.round(summe_noten / anzahl_noten, 2)
+
+        fortschritt_zeit_prozentual = 100 / 1095 * self.tage_vergangen
+        fortschritt_ects_prozentual = 100 / 180 * ects_summe
+        abweichung = np.floor((fortschritt_ects_prozentual - fortschritt_zeit_prozentual) / 100 * 1095).astype(int)
+
+        return pd.DataFrame({
+            "ECTS": ects_summe.astype(int),
+            "Notenschnitt": mittelwert,
+            "Abweichung_Tage": abweichung
+        }, index=self.matrikelnummern)
+
+    def verteilung_noten(self):
+        """
+        Gibt Häufigkeit je Notenschritt und Student zurück (Zeilen Studenten, Spalten Notenschritte).
+        Noten außerhalb der Notenschritte werden wie in plot_verteilung_noten nicht gezählt.
+        """
+        schritte = np.rint(np.array(self.noten_schritte) * 10)
+        noten = np.rint(self.spalte("Note") * 10)
+        position = np.searchsorted(schritte, noten).clip(0, len(schritte) - 1)
+        gültig = schritte[position] == noten
+
+        anzahl_schritte = len(schritte)
+        häufigkeit = np.bincount(
+            self.codes[gültig] * anzahl_schritte + position[gültig],
+            minlength=len(self.matrikelnummern) * anzahl_schritte
+        ).reshape(-1, anzahl_schritte)
+        return pd.DataFrame(häufigkeit, index=self.matrikelnummern, columns=pd.Index(self.noten_schritte, name="Note"))
+
+    def dauer_modul_semester(self):
+        """
+        Gibt durchschnittliche Bearbeitungstage je Modul, Semester und Student zurück
+        (Zeilen Studenten, Spalten Semester). Semester wie in plot_dauer_modul_semester
+        aus Tagen zwischen Studienstart des Studenten und Modulstart (alle 182 Tage).
+        """
+        start = Daten_Cache().datum_tage(self.spalte("Start"))
+        semester = ((start - self.studium_start[self.codes]).astype(np.int64) // 182) + 1
+        if semester.size == 0:
+            return pd.DataFrame(index=self.matrikelnummern, columns=pd.Index([], name="Semester"), dtype=float)
+
+        erstes = semester.min()
+        anzahl_semester = semester.max() - erstes + 1
+        schlüssel = self.codes * anzahl_semester + (semester - erstes)
+        größe = len(self.matrikelnummern) * anzahl_semester
+        summe = np.bincount(schlüssel, weights=self.spalte("Tage"), minlength=größe).reshape(-1, anzahl_semester)
+        anzahl = np.bincount(schlüssel, minlength=größe).reshape(-1, anzahl_semester)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            durchschnitt = summe / anzahl
+
+        belegt = anzahl.any(axis=0) # nur Semester, in denen Module begonnen wurden
+        return pd.DataFrame(
+            durchschnitt[:, belegt],
+            index=self.matrikelnummern,
+            columns=pd.Index(np.arange(erstes, erstes + anzahl_semester)[belegt], name="Semester")
+        )
+
+    def perzentile(self, quantile=(0.1, 0.25, 0.5, 0.75, 0.9)):
+        """
+        Gibt Perzentile der Kohorte für ECTS, Notenschnitt und Abweichung zum Zeitplan zurück.
+        """
+        return self.kennzahlen().quantile(list(quantile))
+
+    def prognose_abschluss(self, trajektorien=2000):
+        """
+        Gibt Monte-Carlo-Prognose je Student zurück (Abschluss_Prognose, alle Studenten in
+        einer Array-Berechnung): Abschlussdatum und Endnote als 5./50./95. Perzentil.
+        Studenten ohne Module mit ECTS haben keine Prognose (leer/NaN).
+        """
+        prognose = Abschluss_Prognose(trajektorien)
+        return prognose.vorgehalten(("Kohorte",) + self.dateien, Speicher.datei_version(*self.dateien),
+                                    lambda: self.berechne_prognose(prognose))
+
+    def berechne_prognose(self, prognose):
+        """
+        Berechnet Prognose-DataFrame mit Abschluss_Prognose (ohne Vorhalten).
+        """
+        perzentile = (5, 50, 95)
+        abschluss = np.full((len(self.matrikelnummern), len(perzentile)), np.nan)
+        endnote = np.full_like(abschluss, np.nan)
+        hundertstel = np.rint(self.spalte("Note").astype(float) * 100).astype(np.int64)
+        ende = Daten_Cache().datum_tage(self.spalte("Ende")).astype(np.int64)
+        for block, abschluss_block, endnote_block, _, _ in prognose.simuliere(
+                self.codes, self.spalte("ECTS"), self.spalte("Tage"), hundertstel, ende,
+                self.studium_start.astype(np.int64)):
+            abschluss[block] = np.percentile(abschluss_block, perzentile, axis=1).T.round()
+            endnote[block] = np.percentile(endnote_block, perzentile, axis=1).T.round(2)
+
+        ergebnis = pd.DataFrame(index=self.matrikelnummern)
+        for position, p in enumerate(perzentile):
+            tage = pd.to_datetime(abschluss[:, position], unit="D")
+            ergebnis[f"Abschluss_P{p}"] = tage.strftime("%d.%m.%Y").where(tage.notna(), "")
+        for position, p in enumerate(perzentile):
+            ergebnis[f"Endnote_P{p}"] = endnote[:, position]
+        return ergebnis
+
+
+
+# ============================== GUI-Klasse ============================== 
+
+class GUI_Controller:
+    """
+    Controller-Klasse für grafische Benutzeroberfläche (GUI).
+    Organisiert Aufbau, Inhalte, Interaktion und Button-Logik mit tkinter.
+    """
+
+    def __init__(self, speicher=None, messung=False):
+        """
+        Initialisiert Hauptfenster und führt sofort Layout- und Inhalt aus.
+        Fenster mit Kennzahlen und Eingabefeldern wird zuerst gezeichnet,
+        Diagramme folgen danach im laufenden Mainloop (container_diagramme).
+        speicher: Speicher-Backend für Lesen und Schreiben (Standard CSV_Speicher).
+        messung=True gibt Startzeiten aus und schließt Fenster nach Aufbau der Diagramme.
+        """
+        self.speicher = speicher or CSV_Speicher()
+        self.messung = messung
+
+        # Hintergrund-Arbeit: Schreiben und Vorbereiten der Diagramme außerhalb des Tk-Threads
+        # ein Thread -> Änderungen werden in Eingabereihenfolge geschrieben
+        self.arbeiter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Dashboard_Arbeiter")
+        self.änderungen = [] # wartende Änderungen ("hinzufügen"/"löschen", Argumente)
+        self.sperre_änderungen = threading.Lock()
+        self.daten_sperre = threading.Lock() # gehalten, solange Arbeiter schreibt/berechnet
+        self.auftrag_läuft = False
+        self.ergebnisse = queue.Queue() # Arbeiter -> Tk-Thread, abgeholt über root.after
+        self.abfrage_aktiv = False
+        self.größe_offen = set() # Panels, deren Größe sich während Arbeit geändert hat
+
+        self.root = tk.Tk()
+        self.fenster()
+        self.container_inhalt()
+        self.container_interaktion()
+        self.buttons()
+        self.overlay = Mess_Overlay(self.root) # Messübersicht, ein-/ausblenden mit F12
+
+        self.root.update() # erste Anzeige: Titel, Kennzahlen, Eingabefelder
+        self.zeit_erste_anzeige = time.perf_counter() - IMPORT_START
+        self.root.after(0, lambda: self.container_diagramme())
+        self.root.mainloop()
+        self.arbeiter.shutdown(wait=True) # begonnene Schreibvorgänge nach Schließen noch abschließen
+
+    def fenster(self):
+        """
+        Erstellt Fenster, setzt Titel aus Studentendaten.
+        Legt Rasterstruktur (Grid), Ränder und Containerbereiche fest.
+        """
+        df = self.speicher.lese_student()
+        name = df.at[0, "Name"]
+        studiengang = df.at[0, "Studiengang"]
+        abschluss = df.at[0, "Abschluss"]
+        titel = f"Dashboard Studium: {name} - {studiengang}, {abschluss}"
+
+        self.root.title(titel)
+        self.root.geometry("1200x800")
+
+        # Fenster am Raster unterteilt für anpassbares Layout
+        for i in range(20):
+            self.root.grid_rowconfigure(i, weight=1)
+        for j in range(30):
+            self.root.grid_columnconfigure(j, weight=1)
+
+        # Randfelder, feste Größe, farblos
+        self.leer_links = tk.Frame(self.root, width=30)
+        self.leer_rechts = tk.Frame(self.root, width=30)
+        self.leer_oben = tk.Frame(self.root, height=30)
         self.leer_unten = tk.Frame(self.root, height=30)
 
         self.leer_links.grid(row=1, column=0, rowspan=19, columnspan=1)
@@ -446,41 +3002,365 @@ class GUI_Controller:
         self.container_links_unten_3 = tk.Frame(self.root, bg="white")
         self.container_unten = tk.Frame(self.root, bg="white")
 
-        self.container_oben.grid(row=1, column=8, rowspan=2, columnspan=22, sticky="nsew")
-        self.container_mitte.grid(row=3, column=8, rowspan=8, columnspan=17, sticky="nsew")
-        self.container_rechts.grid(row=3, column=25, rowspan=17, columnspan=5, sticky="nsew")
-        self.container_links.grid(row=3, column=1, rowspan=10, columnspan=7, sticky="nsew")
-        self.container_links_oben.grid(row=1, column=1, rowspan=2, columnspan=7, sticky="nsew")
-        self.container_links_unten_1.grid(row=13, column=1, rowspan=4, columnspan=2, sticky="nsew")
-        self.container_links_unten_2.grid(row=13, column=3, rowspan=4, columnspan=5, sticky="nsew")
-        self.container_links_unten_3.grid(row=17, column=1, rowspan=3, columnspan=7, sticky="nsew")
-        self.container_unten.grid(row=11, column=8, rowspan=9, columnspan=17, sticky="nsew")
+        self.container_oben.grid(row=1, column=8, rowspan=2, columnspan=22, sticky="nsew")
+        self.container_mitte.grid(row=3, column=8, rowspan=8, columnspan=17, sticky="nsew")
+        self.container_rechts.grid(row=3, column=25, rowspan=17, columnspan=5, sticky="nsew")
+        self.container_links.grid(row=3, column=1, rowspan=10, columnspan=7, sticky="nsew")
+        self.container_links_oben.grid(row=1, column=1, rowspan=2, columnspan=7, sticky="nsew")
+        self.container_links_unten_1.grid(row=13, column=1, rowspan=4, columnspan=2, sticky="nsew")
+        self.container_links_unten_2.grid(row=13, column=3, rowspan=4, columnspan=5, sticky="nsew")
+        self.container_links_unten_3.grid(row=17, column=1, rowspan=3, columnspan=7, sticky="nsew")
+        self.container_unten.grid(row=11, column=8, rowspan=9, columnspan=17, sticky="nsew")
+
+    def zeige_inhalt(self, fig, container):
+        """
+        Bindet Diagramm/Tabelle in jeweiligen Container ein. 
+        (erleichtert folgend Einbindung)
+        Gibt Canvas zurück, damit Figure später im selben Container aktualisiert werden kann.
+        """
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        canvas = FigureCanvasTkAgg(fig, master=container)
+        canvas.get_tk_widget().pack(expand=True, fill="both")
+        return canvas
+
+    def container_inhalt(self):
+        """
+        Platziert Texte aus Plots_Berechnungen in Containern und legt Zuordnung
+        der Diagramme/Tabelle zu Containern fest (gezeichnet in container_diagramme).
+        Merkt sich Labels für übernehme_inhalt().
+        """
+        plots = Plots_Berechnungen(self.speicher)
+
+        # Texte
+        text_notenschnitt = f"Dein Notenschnitt: {plots.zahl_mittelwert_noten()}"
+        text_zeitplan = f"Du bist {plots.zahl_abweichung_zeitplan()}."
+        self.label_notenschnitt = tk.Label(self.container_links_oben, text=text_notenschnitt, bg="white")
+        self.label_notenschnitt.pack(pady=20)
+        self.label_zeitplan = tk.Label(self.container_links_oben, text=text_zeitplan, bg="white")
+        self.label_zeitplan.pack(pady=0)
+        
+        # Diagramme -> Zuordnung Methode aus Plots_Berechnungen zu Container
+        # Tabelle links als Virtuelle_Tabelle (kein matplotlib, nur sichtbare Zeilen)
+        self.panels = {
+            "plot_zeit_ects": self.container_oben,
+            "plot_verteilung_noten": self.container_mitte,
+            "plot_verlauf_noten": self.container_unten,
+            "plot_dauer_modul_semester": self.container_rechts
+        }
+        self.canvases = {}
+        self.panel_schlüssel = {}
+        self.panel_größen = {} # Pixelgröße/dpi je Panel, für Raster im Hintergrund-Thread
+        self.render_schlüssel = {} # angezeigter Render_Cache-Schlüssel je Panel
+        self.ausstehend = {} # Panel -> Schlüssel, dessen Raster nach dem Zeichnen abgelegt wird
+        self.tabelle = Virtuelle_Tabelle(self.container_links)
+
+    def container_diagramme(self):
+        """
+        Zeichnet Diagramme/Tabelle aus Plots_Berechnungen in ihre Container.
+        Eine Instanz für alle Inhalte, Daten kommen einmalig aus Daten_Cache.
+        Merkt sich Canvas und Eingabeschlüssel je Panel für übernehme_inhalt().
+        """
+        plots = Plots_Berechnungen(self.speicher)
+        self.tabelle.setze_daten(plots.tabelle_ansicht)
+        for methode, container in self.panels.items():
+            fig = plots.bereite_figur(None, *plots.figur_formate[methode])
+            canvas = self.zeige_inhalt(fig, container)
+            canvas.mpl_connect("draw_event", lambda event, m=methode: self.bei_zeichnen(m))
+            canvas.mpl_connect("resize_event", lambda event, m=methode: self.bei_größe(m))
+            self.canvases[methode] = canvas
+            self.zeichne_panel(plots, methode)
+            self.panel_schlüssel[methode] = plots.panel_eingaben(methode)
+
+        # Notenverlauf: Mausrad zoomt, Ziehen verschiebt, Doppelklick zeigt wieder alles
+        canvas = self.canvases["plot_verlauf_noten"]
+        self.verschieben = None # (Pixel x beim Drücken, xlim beim Drücken) während Ziehen
+        canvas.mpl_connect("scroll_event", lambda event: self.bei_zoom(event))
+        canvas.mpl_connect("button_press_event", lambda event: self.bei_maus_drücken(event))
+        canvas.mpl_connect("motion_notify_event", lambda event: self.bei_maus_bewegen(event))
+        canvas.mpl_connect("button_release_event", lambda event: setattr(self, "verschieben", None))
+
+        if self.messung:
+            self.root.update()
+            zeit_diagramme = time.perf_counter() - IMPORT_START
+            print(f"Import Dashboard: {IMPORT_DAUER * 1000:.1f} ms")
+            print(f"Erste Anzeige (Kennzahlen): {self.zeit_erste_anzeige * 1000:.1f} ms")
+            print(f"Diagramme fertig: {zeit_diagramme * 1000:.1f} ms")
+            self.root.destroy()
+
+    def plane_änderung(self, art, *argumente):
+        """
+        Reiht Änderung (Hinzufügen/Löschen) für Hintergrund-Thread ein und kehrt sofort zurück.
+        Läuft bereits ein Auftrag, wird Änderung beim nächsten Durchlauf mit allen
+        bis dahin eingegangenen Änderungen zusammen verarbeitet (nur eine Aktualisierung).
+        """
+        # Pixelgröße/dpi je Panel im Tk-Thread festhalten, Arbeiter rastert passend dazu
+        self.panel_größen = {
+            methode: (round(canvas.figure.bbox.width), round(canvas.figure.bbox.height), canvas.figure.dpi)
+            for methode, canvas in self.canvases.items()
+        }
+        with self.sperre_änderungen:
+            self.änderungen.append((art, argumente))
+            self.overlay.starte_profil() # nur falls im Overlay angefordert
+            if not self.auftrag_läuft:
+                self.auftrag_läuft = True
+                self.arbeiter.submit(self.arbeite)
+            offen = len(self.änderungen)
+        self.zeige_beschäftigt(offen)
+        if not self.abfrage_aktiv:
+            self.abfrage_aktiv = True
+            self.root.after(50, self.prüfe_ergebnisse)
+
+    def arbeite(self):
+        """
+        Läuft im Hintergrund-Thread: übernimmt alle wartenden Änderungen auf einmal,
+        schreibt sie über CSV_Controller und bereitet danach einmalig neue Inhalte vor.
+        Wiederholt, bis keine Änderung mehr wartet. Ergebnis geht in Warteschlange ergebnisse.
+        """
+        while True:
+            with self.sperre_änderungen:
+                stapel, self.änderungen = self.änderungen, []
+                if not stapel:
+                    self.auftrag_läuft = False
+                    return
+
+            fehler = []
+            try:
+                with self.daten_sperre:
+                    controller = CSV_Controller(speicher=self.speicher)
+                    for art, argumente in stapel:
+                        try:
+                            if art == "hinzufügen":
+                                controller.füge_modul_csv_hinzu(*argumente)
+                            else:
+                                controller.lösche_modul_csv(*argumente)
+                        except (ValueError, OSError) as ausnahme:
+                            fehler.append(f"{argumente[0]}: {ausnahme}")
+                    inhalt = self.bereite_inhalt(dict(self.panel_größen))
+            except Exception as ausnahme: # Arbeiter darf nie still sterben -> Fehler an GUI melden
+                fehler.append(f"Aktualisierung fehlgeschlagen: {ausnahme}")
+                inhalt = None
+            self.ergebnisse.put((fehler, inhalt))
+
+    def bereite_inhalt(self, größen):
+        """
+        Läuft im Hintergrund-Thread: berechnet Texte, Tabellendaten und Raster aller Panels,
+        deren Eingaben sich geändert haben. Raster entstehen auf eigener Agg-Figure in
+        Pixelgröße des Panels (über Render_Cache), Tk-Thread muss sie nur noch anzeigen.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        plots = Plots_Berechnungen(self.speicher)
+        inhalt = {
+            "plots": plots,
+            "notenschnitt": f"Dein Notenschnitt: {plots.zahl_mittelwert_noten()}",
+            "zeitplan": f"Du bist {plots.zahl_abweichung_zeitplan()}.",
+            "module": plots.tabelle_ansicht,
+            "panels": {}
+        }
+        for methode, (breite, höhe, dpi) in größen.items():
+            eingaben = plots.panel_eingaben(methode)
+            if eingaben == self.panel_schlüssel.get(methode):
+                continue # Eingaben unverändert -> Panel bleibt wie es ist
+            fig = Figure(figsize=(breite / dpi, höhe / dpi), dpi=dpi)
+            FigureCanvasAgg(fig)
+            schlüssel = plots.render_schlüssel(methode, fig, eingaben)
+            raster = Render_Cache().hole(schlüssel)
+            if raster is None:
+                getattr(plots, methode)(fig)
+                raster = Render_Cache().rastere(fig)
+                Render_Cache().lege_ab(schlüssel, raster)
+            inhalt["panels"][methode] = (eingaben, schlüssel, raster)
+        return inhalt
+
+    def prüfe_ergebnisse(self):
+        """
+        Läuft im Tk-Thread (über root.after): übernimmt fertige Ergebnisse des Arbeiters,
+        zeigt Fehler an und fragt erneut ab, solange noch Arbeit offen ist.
+        """
+        while True:
+            try:
+                fehler, inhalt = self.ergebnisse.get_nowait()
+            except queue.Empty:
+                break
+            if inhalt is not None:
+                self.übernehme_inhalt(inhalt)
+            if fehler:
+                messagebox.showerror("Speichern fehlgeschlagen", "\n".join(fehler))
+
+        with self.sperre_änderungen:
+            offen = len(self.änderungen) + (1 if self.auftrag_läuft else 0)
+        if offen or not self.ergebnisse.empty():
+            self.zeige_beschäftigt(offen)
+            self.root.after(50, self.prüfe_ergebnisse)
+        else:
+            self.abfrage_aktiv = False
+            self.zeige_beschäftigt(0)
+            self.overlay.beende_profil()
+            for methode in list(self.größe_offen):
+                self.bei_größe(methode) # während Arbeit aufgeschobene Größenänderungen
+            self.größe_offen.clear()
+
+    def übernehme_inhalt(self, inhalt):
+        """
+        Zeigt vorbereitete Inhalte im bestehenden Fenster an (Tk-Thread).
+        Texte nur bei Änderung, Tabelle nur bei neuem DataFrame, Panels als fertiges Raster.
+        Passt Raster nicht mehr zur Panelgröße (Fenster zwischenzeitlich verändert),
+        wird Panel direkt gezeichnet (unter daten_sperre, sonst nach Abschluss des Arbeiters).
+        """
+        plots = inhalt["plots"]
+        if self.label_notenschnitt.cget("text") != inhalt["notenschnitt"]:
+            self.label_notenschnitt.config(text=inhalt["notenschnitt"])
+        if self.label_zeitplan.cget("text") != inhalt["zeitplan"]:
+            self.label_zeitplan.config(text=inhalt["zeitplan"])
+
+        # Daten_Cache liefert bei unveränderter Datei dasselbe DataFrame -> Tabelle bleibt
+        if inhalt["module"] is not self.tabelle.daten:
+            self.tabelle.setze_daten(inhalt["module"])
+
+        for methode, (eingaben, schlüssel, raster) in inhalt["panels"].items():
+            canvas = self.canvases[methode]
+            fig = canvas.figure
+            if raster.shape[:2] == (round(fig.bbox.height), round(fig.bbox.width)):
+                plots.zeige_raster(fig, raster)
+                self.render_schlüssel[methode] = schlüssel
+                canvas.draw_idle()
+            elif self.daten_sperre.acquire(blocking=False):
+                try:
+                    self.zeichne_panel(plots, methode)
+                finally:
+                    self.daten_sperre.release()
+            else:
+                self.größe_offen.add(methode) # Arbeiter ändert Statistik gerade -> nachholen
+            self.panel_schlüssel[methode] = eingaben
+
+    def zeige_beschäftigt(self, offen):
+        """
+        Zeigt Fortschrittsbalken und Anzahl offener Änderungen, solange Arbeiter beschäftigt ist.
+        """
+        if offen:
+            self.label_status.config(text=f"Speichert ... ({offen} offen)")
+            if not self.fortschritt.winfo_ismapped():
+                self.fortschritt.pack(pady=2)
+                self.fortschritt.start(15)
+        else:
+            self.label_status.config(text="")
+            self.fortschritt.stop()
+            self.fortschritt.pack_forget()
+
+    def zeichne_panel(self, plots, methode):
+        """
+        Zeichnet Panel über Render_Cache: bei Treffer (gleiche Eingaben, Größe, dpi)
+        wird gespeichertes Raster kopiert, sonst normal gezeichnet und Raster nach
+        dem Zeichnen (bei_zeichnen) abgelegt.
+        Nur unter daten_sperre aufrufen (liest gemeinsame Statistik_Engine, die Arbeiter ändert).
+        """
+        canvas = self.canvases[methode]
+        fig = canvas.figure
+        schlüssel = plots.render_schlüssel(methode, fig)
+        raster = Render_Cache().hole(schlüssel)
+        if raster is not None and raster.shape[:2] == (round(fig.bbox.height), round(fig.bbox.width)):
+            plots.zeige_raster(fig, raster)
+        else:
+            getattr(plots, methode)(fig)
+            self.ausstehend[methode] = schlüssel
+        self.render_schlüssel[methode] = schlüssel
+        canvas.draw_idle()
+
+    def bei_zeichnen(self, methode):
+        """
+        Legt nach echtem Zeichnen eines Panels dessen Pixelpuffer im Render_Cache ab.
+        """
+        schlüssel = self.ausstehend.pop(methode, None)
+        if schlüssel is None:
+            return
+        canvas = self.canvases[methode]
+        fig = canvas.figure
+        raster = np.asarray(canvas.buffer_rgba())
+        if raster.shape[:2] == (round(fig.bbox.height), round(fig.bbox.width)):
+            Render_Cache().lege_ab(schlüssel, raster.copy())
+
+    def bei_größe(self, methode):
+        """
+        Zeichnet Panel nach Größenänderung für neue Pixelgröße (Cache oder neu),
+        da gespeichertes Raster nur für genau eine Größe gilt.
+        """
+        if methode not in self.render_schlüssel:
+            return
+        if not self.daten_sperre.acquire(blocking=False):
+            self.größe_offen.add(methode) # Arbeiter schreibt gerade -> nach Abschluss nachholen
+            return
+        try: # Sperre bis Ende des Zeichnens: Statistik_Engine wird vom Arbeiter in place geändert
+            plots = Plots_Berechnungen(self.speicher)
+            if plots.render_schlüssel(methode, self.canvases[methode].figure) != self.render_schlüssel[methode]:
+                self.zeichne_panel(plots, methode)
+        finally:
+            self.daten_sperre.release()
 
-    def zeige_inhalt(self, fig, container):
+    def verlauf_achse(self):
         """
-        Bindet Diagramm/Tabelle in jeweiligen Container ein. 
-        (erleichtert folgend Einbindung)
+        Gibt Achse des Notenverlaufs zum Zoomen/Verschieben zurück (None, solange Arbeiter schreibt).
+        Zeigt Panel nur ein Raster aus Render_Cache, wird Diagramm zuerst echt gezeichnet.
+        Gezoomte Ansicht wird nicht im Render_Cache abgelegt.
         """
-        canvas = FigureCanvasTkAgg(fig, master=container)
-        canvas.get_tk_widget().pack(expand=True, fill="both")
+        methode = "plot_verlauf_noten"
+        fig = self.canvases[methode].figure
+        self.ausstehend.pop(methode, None)
+        if not fig.axes:
+            if not self.daten_sperre.acquire(blocking=False):
+                return None
+            try:
+                Plots_Berechnungen(self.speicher).plot_verlauf_noten(fig)
+            finally:
+                self.daten_sperre.release()
+        self.render_schlüssel[methode] = None # Ansicht entspricht keinem Cache-Eintrag mehr
+        return fig.axes[0]
 
-    def container_inhalt(self):
+    def bei_zoom(self, event):
         """
-        Platziert Methoden für Texte/Diagramme/Tabelle aus Plots_Berechnungen 
-        in Containern.
+        Zoomt Notenverlauf mit Mausrad um Mausposition, Linien werden für sichtbaren Bereich neu ausgedünnt.
         """
-        # Texte
-        text_notenschnitt = f"Dein Notenschnitt: {Plots_Berechnungen().zahl_mittelwert_noten()}"
-        text_zeitplan = f"Du bist {Plots_Berechnungen().zahl_abweichung_zeitplan()}."
-        tk.Label(self.container_links_oben, text=text_notenschnitt, bg="white").pack(pady=20)
-        tk.Label(self.container_links_oben, text=text_zeitplan, bg="white").pack(pady=0)
-        
-        # Diagramme/Tabelle
-        self.zeige_inhalt(Plots_Berechnungen().plot_zeit_ects(), self.container_oben)
-        self.zeige_inhalt(Plots_Berechnungen().plot_verteilung_noten(), self.container_mitte)
-        self.zeige_inhalt(Plots_Berechnungen().plot_verlauf_noten(), self.container_unten)
-        self.zeige_inhalt(Plots_Berechnungen().plot_dauer_modul_semester(), self.container_rechts)
-        self.zeige_inhalt(Plots_Berechnungen().tabelle_module(), self.container_links)        
+        ax = self.verlauf_achse()
+        if ax is None:
+            return
+        links, rechts = ax.get_xlim()
+        mitte = event.xdata if event.inaxes is ax and event.xdata is not None else (links + rechts) / 2
+        faktor = 0.8 if event.button == "up" else 1.25
+        if faktor < 1 and rechts - links < 4:
+            return # mindestens wenige Module sichtbar
+        ax.set_xlim(mitte - (mitte - links) * faktor, mitte + (rechts - mitte) * faktor)
+        self.canvases["plot_verlauf_noten"].draw_idle()
+
+    def bei_maus_drücken(self, event):
+        """
+        Beginnt Verschieben des Notenverlaufs (linke Maustaste), Doppelklick zeigt gesamten Verlauf.
+        """
+        if event.button != 1:
+            return
+        if event.dblclick:
+            self.verschieben = None
+            self.render_schlüssel["plot_verlauf_noten"] = None # gezoomte Ansicht -> immer neu zeichnen
+            self.bei_größe("plot_verlauf_noten") # schreibt Arbeiter gerade, nach Abschluss
+            return
+        ax = self.verlauf_achse()
+        if ax is not None:
+            self.verschieben = (event.x, ax.get_xlim())
+
+    def bei_maus_bewegen(self, event):
+        """
+        Verschiebt Notenverlauf beim Ziehen um Mausweg (in Pixeln gemessen).
+        """
+        if self.verschieben is None or event.x is None:
+            return
+        fig = self.canvases["plot_verlauf_noten"].figure
+        if not fig.axes:
+            self.verschieben = None # Inhalt zwischenzeitlich ersetzt
+            return
+        ax = fig.axes[0]
+        start_x, (links, rechts) = self.verschieben
+        verschiebung = (event.x - start_x) * (rechts - links) / ax.bbox.width
+        ax.set_xlim(links - verschiebung, rechts - verschiebung)
+        self.canvases["plot_verlauf_noten"].draw_idle()
 
     def container_interaktion(self):
         """
@@ -509,19 +3389,17 @@ class GUI_Controller:
         """
         Erstellt Hinzufügen-Funktion:
         Eingabe wird nur gespeichert, wenn alle Felder befüllt.
-        Ruft CSV_Controller().füge_modul_csv_hinzu() für neuen Eintrag in CSV auf, 
-        schließt und aktualisiert GUI.
+        Reiht CSV_Controller().füge_modul_csv_hinzu() für Hintergrund-Thread ein,
+        Inhalte im bestehenden Fenster werden danach aktualisiert.
         """
         if self.eingabe_note.get():
-            CSV_Controller().füge_modul_csv_hinzu(
-                self.eingabe_modul.get(),
-                5,
-                self.eingabe_beginn.get(),
-                self.eingabe_prüfung.get(),
-                float(self.eingabe_note.get())
-            )
-            self.root.destroy() # schließt GUI
-            GUI_Controller() # öffnet GUI wieder (ermöglicht Aktualisierung Inhalte)
+            try:
+                note = float(self.eingabe_note.get())
+            except ValueError:
+                messagebox.showwarning("Eingabefehler", "Bitte gib die Note als Zahl mit Punkt ein (z. B. 1.3).")
+                return
+            # Schreiben und Aktualisieren im Hintergrund -> Fenster bleibt bedienbar
+            self.plane_änderung("hinzufügen", self.eingabe_modul.get(), 5, self.eingabe_beginn.get(), self.eingabe_prüfung.get(), note)
         else:
             messagebox.showwarning("Eingabefehler", "Bitte befülle alle vier Felder.")
 
@@ -529,13 +3407,11 @@ class GUI_Controller:
         """
         Erstellt Löschen-Funktion:
         Gewünschtes Modul wird entfernt, wenn korrektes Feld befüllt ist.
-        Ruft CSV_Controller().lösche_modul_csv() auf und löscht gewünschte Zeile,
-        schließt und aktualisiert GUI.
+        Reiht CSV_Controller().lösche_modul_csv() für Hintergrund-Thread ein,
+        Inhalte im bestehenden Fenster werden danach aktualisiert.
         """
         if self.eingabe_modul.get():
-            CSV_Controller().lösche_modul_csv(self.eingabe_modul.get())
-            self.root.destroy() # schließt GUI
-            GUI_Controller() # öffnet GUI wieder (ermöglicht Aktualisierung Inhalte)
+            self.plane_änderung("löschen", self.eingabe_modul.get())
         else:
             messagebox.showwarning("Eingabefehler", "Bitte gib bei \"Modul (Bezeichnung):\" ein Modul ein, das du löschen möchtest.")
 
@@ -543,17 +3419,1049 @@ class GUI_Controller:
         """
         Erstellt Buttons für Interaktion und verknüpft Hinzufügen-/Löschen-Funktion.
         """
-        tk.Button(self.container_links_unten_3, text="Modul hinzufügen", command=self.funktion_button_hinzufügen, bg="white").pack()
-        tk.Button(self.container_links_unten_3, text="Modul löschen", command=self.funktion_button_löschen, bg="white").pack(pady=12)
+        # Callbacks über lambda -> Methode wird erst beim Klick nachgeschlagen (später aktivierte Instrumentierung misst mit)
+        tk.Button(self.container_links_unten_3, text="Modul hinzufügen", command=lambda: self.funktion_button_hinzufügen(), bg="white").pack()
+        tk.Button(self.container_links_unten_3, text="Modul löschen", command=lambda: self.funktion_button_löschen(), bg="white").pack(pady=12)
+
+        # Beschäftigt-Anzeige (nur sichtbar, solange Änderungen im Hintergrund laufen)
+        self.label_status = tk.Label(self.container_links_unten_3, text="", bg="white")
+        self.label_status.pack()
+        self.fortschritt = ttk.Progressbar(self.container_links_unten_3, mode="indeterminate", length=120)
+
+
+
+
+class Virtuelle_Tabelle:
+    """
+    Scrollbare Modultabelle (Modul, Tage, Note) für die GUI.
+    Legt nur so viele Textzeilen auf einem tk.Canvas an, wie sichtbar sind, und
+    beschriftet sie beim Scrollen neu -> Aufwand hängt nicht von Zeilenanzahl ab.
+    Zeilen werden direkt aus dem geladenen DataFrame gelesen (keine Kopie),
+    Sortierung und Filter arbeiten nur auf einem Array von Zeilenpositionen.
+    """
+
+    spalten = ["Modul", "Tage", "Note"]
+    spalten_breite = [0.6, 0.2, 0.2] # Anteil an Tabellenbreite
+    zeilen_höhe = 20
+
+    def __init__(self, container):
+        self.daten = None
+        self.auswahl = np.arange(0) # Zeilenpositionen nach Filter und Sortierung
+        self.erste = 0 # erste sichtbare Position in auswahl
+        self.zeilen = [] # Canvas-Textelemente je sichtbarer Zeile (eins je Spalte)
+        self.sortierung = None # (Spalte, absteigend) oder None = chronologisch
+
+        self.rahmen = tk.Frame(container, bg="white")
+        self.rahmen.pack(expand=True, fill="both")
+
+        # Filter nach Modulname
+        leiste = tk.Frame(self.rahmen, bg="white")
+        leiste.pack(fill="x")
+        tk.Label(leiste, text="Filter Modul:", bg="white").pack(side="left", padx=5)
+        self.filter = tk.StringVar()
+        self.filter.trace_add("write", lambda *argumente: self.aktualisiere_auswahl())
+        tk.Entry(leiste, textvariable=self.filter).pack(side="left", fill="x", expand=True, padx=5)
+
+        # Spaltenköpfe: Klick auf Tage/Note sortiert (erneuter Klick kehrt um), Modul = chronologisch
+        köpfe = tk.Frame(self.rahmen, bg="white")
+        köpfe.pack(fill="x")
+        self.köpfe = {}
+        for spalte, breite in zip(self.spalten, self.spalten_breite):
+            kopf = tk.Button(köpfe, text=spalte, bg="white", relief="flat", command=lambda spalte=spalte: self.sortiere(spalte))
+            kopf.place(relx=sum(self.spalten_breite[:self.spalten.index(spalte)]), relwidth=breite, relheight=1)
+            self.köpfe[spalte] = kopf
+        köpfe.configure(height=self.zeilen_höhe + 6)
+
+        # Callbacks über lambda -> Methoden erst beim Aufruf nachgeschlagen (Instrumentierung kann sie später umhüllen)
+        self.scrollbar = tk.Scrollbar(self.rahmen, orient="vertical", command=lambda *argumente: self.scrolle(*argumente))
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas = tk.Canvas(self.rahmen, bg="white", highlightthickness=0)
+        self.canvas.pack(side="left", expand=True, fill="both")
+        self.canvas.bind("<Configure>", lambda event: self.bei_größe(event))
+        self.canvas.bind("<MouseWheel>", lambda event: self.verschiebe(-1 if event.delta > 0 else 1, "units")) # Windows/macOS
+        self.canvas.bind("<Button-4>", lambda event: self.verschiebe(-1, "units")) # Linux
+        self.canvas.bind("<Button-5>", lambda event: self.verschiebe(1, "units"))
+
+    def setze_daten(self, daten):
+        """
+        Übernimmt (neues) Modul-DataFrame, Filter und Sortierung bleiben erhalten.
+        """
+        self.daten = daten
+        self.aktualisiere_auswahl()
+
+    def aktualisiere_auswahl(self):
+        """
+        Bestimmt Zeilenpositionen aus Filter (Teilstring, ohne Groß/Klein) und Sortierung.
+        """
+        if self.daten is None:
+            return
+        suchtext = self.filter.get().strip()
+        if suchtext:
+            treffer = self.daten["Modul"].str.contains(suchtext, case=False, regex=False, na=False)
+            auswahl = np.flatnonzero(treffer.to_numpy())
+        else:
+            auswahl = np.arange(len(self.daten))
+
+        if self.sortierung is not None:
+            spalte, absteigend = self.sortierung
+            werte = self.daten[spalte].to_numpy()[auswahl]
+            auswahl = auswahl[np.argsort(-werte if absteigend else werte, kind="stable")]
+
+        self.auswahl = auswahl
+        self.erste = max(0, min(self.erste, len(auswahl) - len(self.zeilen)))
+        self.zeichne()
+
+    def sortiere(self, spalte):
+        """
+        Sortiert nach Tage oder Note (aufsteigend, bei erneutem Klick absteigend),
+        Klick auf Modul stellt chronologische Reihenfolge wieder her.
+        """
+        if spalte == "Modul":
+            self.sortierung = None
+        elif self.sortierung is not None and self.sortierung[0] == spalte:
+            self.sortierung = (spalte, not self.sortierung[1])
+        else:
+            self.sortierung = (spalte, False)
+
+        for name, kopf in self.köpfe.items():
+            pfeil = ""
+            if self.sortierung is not None and self.sortierung[0] == name:
+                pfeil = " \u25bc" if self.sortierung[1] else " \u25b2"
+            kopf.configure(text=name + pfeil)
+        self.erste = 0
+        self.aktualisiere_auswahl()
+
+    def bei_größe(self, event):
+        """
+        Passt Anzahl der Textzeilen an sichtbare Höhe an und ordnet Spalten neu an.
+        """
+        anzahl = event.height // self.zeilen_höhe + 1
+        while len(self.zeilen) > anzahl:
+            for element in self.zeilen.pop():
+                self.canvas.delete(element)
+        while len(self.zeilen) < anzahl:
+            y = len(self.zeilen) * self.zeilen_höhe + self.zeilen_höhe // 2
+            self.zeilen.append([
+                self.canvas.create_text(0, y, anchor="w" if spalte == "Modul" else "center", font=("TkDefaultFont", 9))
+                for spalte in self.spalten
+            ])
+
+        for nummer, elemente in enumerate(self.zeilen):
+            y = nummer * self.zeilen_höhe + self.zeilen_höhe // 2
+            links = 0
+            for element, spalte, breite in zip(elemente, self.spalten, self.spalten_breite):
+                x = links * event.width + 5 if spalte == "Modul" else (links + breite / 2) * event.width
+                self.canvas.coords(element, x, y)
+                links += breite
+        self.erste = max(0, min(self.erste, len(self.auswahl) - len(self.zeilen)))
+        self.zeichne()
+
+    def scrolle(self, aktion, wert, einheit=None):
+        """
+        Befehl der Scrollbar: "moveto" (Anteil) oder "scroll" (Zeilen/Seiten).
+        """
+        if aktion == "moveto":
+            self.erste = int(float(wert) * len(self.auswahl))
+            self.verschiebe(0, "units")
+        else:
+            self.verschiebe(int(wert), einheit)
+
+    def verschiebe(self, schritte, einheit):
+        """
+        Verschiebt erste sichtbare Zeile um Zeilen ("units") oder Seiten ("pages").
+        """
+        if einheit == "pages":
+            schritte *= max(1, len(self.zeilen) - 1)
+        self.erste = max(0, min(self.erste + schritte, len(self.auswahl) - len(self.zeilen) + 1))
+        self.zeichne()
+
+    def zeichne(self):
+        """
+        Beschriftet nur sichtbare Zeilen neu und setzt Position der Scrollbar.
+        """
+        anzahl = len(self.auswahl)
+        for nummer, elemente in enumerate(self.zeilen):
+            position = self.erste + nummer
+            if self.daten is not None and position < anzahl:
+                zeile = self.auswahl[position]
+                for element, spalte in zip(elemente, self.spalten):
+                    self.canvas.itemconfigure(element, text=str(self.daten[spalte].array[zeile]))
+            else:
+                for element in elemente:
+                    self.canvas.itemconfigure(element, text="")
+
+        if anzahl:
+            self.scrollbar.set(self.erste / anzahl, min(1.0, (self.erste + len(self.zeilen)) / anzahl))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+
+class Mess_Overlay:
+    """
+    Einblendbare Messübersicht oben rechts im Fenster (F12).
+    Zeigt je Operation Anzahl, p50, p90, Maximum und Zeilen aus Instrumentierung,
+    erneuert alle intervall_ms. Eingeblendet wird Instrumentierung aktiviert,
+    ausgeblendet wieder deaktiviert (außer sie war schon beim Start aktiv, --instrumentierung).
+    Export als JSON/Chrome-Trace, Stichproben-Profil für die nächste Aktualisierung.
+    """
+
+    intervall_ms = 500
+    zeilen_anzahl = 15
+
+    def __init__(self, root):
+        self.root = root
+        self.instrumentierung = Instrumentierung()
+        self.dauerhaft = Instrumentierung.aktiv # beim Start aktiviert -> bleibt beim Ausblenden aktiv
+        self.sichtbar = False
+        self.nächste = None # root.after-Kennung der nächsten Erneuerung
+        self.profil_angefordert = False
+        self.profiler = None
+
+        self.rahmen = tk.Frame(root, bg="black", bd=1, relief="solid")
+        self.text = tk.Label(self.rahmen, text="", font=("Courier", 9), justify="left", anchor="nw", bg="black", fg="white")
+        self.text.pack(fill="both", expand=True, padx=4, pady=4)
+        leiste = tk.Frame(self.rahmen, bg="black")
+        leiste.pack(fill="x")
+        tk.Button(leiste, text="JSON", command=self.exportiere_json).pack(side="left")
+        tk.Button(leiste, text="Trace", command=self.exportiere_trace).pack(side="left")
+        tk.Button(leiste, text="Profil", command=self.fordere_profil_an).pack(side="left")
+        tk.Button(leiste, text="Zurücksetzen", command=self.zurücksetzen).pack(side="left")
+        root.bind("<F12>", self.umschalten)
+
+    def umschalten(self, event=None):
+        if self.sichtbar:
+            self.sichtbar = False
+            self.rahmen.place_forget()
+            if self.nächste is not None:
+                self.root.after_cancel(self.nächste)
+                self.nächste = None
+            if not self.dauerhaft:
+                self.instrumentierung.deaktiviere()
+        else:
+            self.instrumentierung.aktiviere()
+            self.sichtbar = True
+            self.rahmen.place(relx=1.0, rely=0.0, anchor="ne")
+            self.rahmen.lift()
+            self.erneuere()
+
+    def erneuere(self):
+        """
+        Schreibt Tabelle der Operationen mit größter Gesamtzeit neu.
+        """
+        zeilen = [f"{'Operation':<42}{'n':>7}{'p50 ms':>9}{'p90 ms':>9}{'max ms':>9}{'Zeilen':>9}"]
+        for operation, werte in self.instrumentierung.übersicht(self.zeilen_anzahl).items():
+            zeilen.append(f"{operation[-42:]:<42}{werte['anzahl']:>7}{werte['p50_ms']:>9.2f}{werte['p90_ms']:>9.2f}"
+                          f"{werte['max_ms']:>9.2f}{'' if werte['zeilen_max'] is None else werte['zeilen_max']:>9}")
+        if self.profil_angefordert or self.profiler is not None:
+            zeilen.append("Profil: " + ("läuft" if self.profiler is not None else "bei nächster Aktualisierung"))
+        self.text.config(text="\n".join(zeilen))
+        self.nächste = self.root.after(self.intervall_ms, self.erneuere)
+
+    def exportiere_json(self):
+        datei = self.instrumentierung.exportiere_json(f"Messung_{datetime.now():%Y%m%d_%H%M%S}.json")
+        messagebox.showinfo("Messung exportiert", os.path.abspath(datei))
+
+    def exportiere_trace(self):
+        datei = self.instrumentierung.exportiere_trace(f"Trace_{datetime.now():%Y%m%d_%H%M%S}.json")
+        messagebox.showinfo("Trace exportiert", f"{os.path.abspath(datei)}\n(chrome://tracing oder ui.perfetto.dev)")
+
+    def zurücksetzen(self):
+        self.instrumentierung.zurücksetzen()
+
+    def fordere_profil_an(self):
+        self.profil_angefordert = True
+
+    def starte_profil(self):
+        """
+        Startet angeforderten Profiler (von GUI_Controller.plane_änderung zu Beginn einer Aktualisierung).
+        """
+        if self.profil_angefordert and self.profiler is None:
+            self.profil_angefordert = False
+            self.profiler = Stichproben_Profiler().starte()
+
+    def beende_profil(self):
+        """
+        Beendet laufenden Profiler nach Ende der Aktualisierung, speichert Stapel und zeigt häufigste Funktionen.
+        """
+        if self.profiler is None:
+            return
+        profiler, self.profiler = self.profiler.beende(), None
+        datei = profiler.speichere(f"Profil_{datetime.now():%Y%m%d_%H%M%S}.txt")
+        häufigste = "\n".join(f"{anzahl:>5}  {funktion}" for funktion, anzahl in profiler.häufigste())
+        messagebox.showinfo("Profil der Aktualisierung", f"{os.path.abspath(datei)}\n\n{häufigste}")
+
+
+
+# ============================== Bericht-Klasse =========================
+
+class Bericht_Renderer:
+    """
+    Erstellt Berichte ohne GUI (kein Display nötig, matplotlib-Backend Agg).
+    Rendert die fünf Diagramme/Tabelle aus Plots_Berechnungen je Student als PNG/SVG/PDF.
+    Studenten werden auf Prozesspool verteilt, jeder Worker nutzt eine einzige Figure
+    für alle Diagramme (wird je Diagramm geleert, in Größe angepasst und neu gezeichnet).
+    """
+
+    methoden = ["plot_zeit_ects", "plot_verteilung_noten", "plot_verlauf_noten", "plot_dauer_modul_semester", "tabelle_module"]
+    _figur = None # Figure des aktuellen Worker-Prozesses
+
+    def __init__(self, ausgabe="Berichte", formate=("png",), prozesse=None,
+                 datei_student="Kohorte_Student.csv", datei_module="Kohorte_Module.csv"):
+        self.ausgabe = ausgabe
+        self.formate = list(formate)
+        self.prozesse = prozesse or os.cpu_count()
+        self.dateien = (datei_student, datei_module)
+
+    def rendere(self, matrikelnummern=None):
+        """
+        Rendert Berichte für Liste von Matrikelnummern aus Kohorten-Dateien.
+        Ohne Liste wird einzelner Student aus Student.csv/Module_abgeschlossen.csv gerendert.
+        Gibt Liste aller erzeugten Dateien zurück.
+        """
+        os.makedirs(self.ausgabe, exist_ok=True)
+        aufträge = [(matrikelnummer, self.ausgabe, self.formate, self.dateien) for matrikelnummer in (matrikelnummern or [None])]
+        paketgröße = max(1, len(aufträge) // (self.prozesse * 4)) # wenige große Pakete -> weniger Prozess-Kommunikation
+
+        self.cache_statistik = {"treffer": 0, "treffer_platte": 0, "fehlschläge": 0}
+
+        with ProcessPoolExecutor(max_workers=self.prozesse, initializer=Bericht_Renderer.starte_worker,
+                                 initargs=(Render_Cache.verzeichnis, Plots_Berechnungen.verlauf_fenster,
+                                           Plots_Berechnungen.verlauf_ausdünnung, Instrumentierung.aktiv)) as pool:
+            erstellt = []
+            for dateien, zähler, messung in pool.map(Bericht_Renderer.rendere_student, aufträge, chunksize=paketgröße):
+                erstellt.extend(dateien)
+                for name, wert in zähler.items():
+                    self.cache_statistik[name] += wert
+                if messung is not None:
+                    Instrumentierung().übernehme(*messung)
+            return erstellt
+
+    @staticmethod
+    def starte_worker(cache_verzeichnis=None, verlauf_fenster=None, verlauf_ausdünnung=None, instrumentierung=False):
+        """
+        Legt je Worker-Prozess einmalig die wiederverwendete Figure mit Agg-Canvas an
+        und übernimmt Festplatten-Stufe des Render_Cache und Einstellungen des Notenverlaufs
+        aus Hauptprozess (None = unverändert). instrumentierung=True misst auch im Worker
+        (geerbte Messungen des Hauptprozesses bei fork werden verworfen).
+        """
+        if instrumentierung:
+            Instrumentierung().zurücksetzen()
+            Instrumentierung().aktiviere()
+        Render_Cache.verzeichnis = cache_verzeichnis
+        if verlauf_fenster is not None:
+            Plots_Berechnungen.verlauf_fenster = tuple(verlauf_fenster)
+        if verlauf_ausdünnung is not None:
+            Plots_Berechnungen.verlauf_ausdünnung = verlauf_ausdünnung
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        Bericht_Renderer._figur = Figure()
+        FigureCanvasAgg(Bericht_Renderer._figur)
+
+    @staticmethod
+    def rendere_student(auftrag):
+        """
+        Rendert alle Diagramme eines Studenten in Worker-Figure und speichert sie
+        in allen gewünschten Formaten. Dateiname: <Matrikelnummer>_<Methode>.<Format>
+        PNG nutzt Render_Cache: bei gleichen Eingaben wird gespeichertes Raster direkt
+        geschrieben, SVG/PDF werden immer als Vektorgrafik gezeichnet.
+        Gibt (erstellte Dateien, Cache-Zähler dieses Auftrags, Messungen oder None) zurück.
+        """
+        from matplotlib import image
+        matrikelnummer, ausgabe, formate, dateien = auftrag
+        if Bericht_Renderer._figur is None:
+            Bericht_Renderer.starte_worker()
+        fig = Bericht_Renderer._figur
+
+        speicher = Kohorte_Speicher(matrikelnummer, *dateien) if matrikelnummer is not None else CSV_Speicher()
+        plots = Plots_Berechnungen(speicher)
+        name = plots.read_student_csv.at[0, "Matrikelnummer"]
+
+        zähler_vorher = dict(Render_Cache.zähler)
+        erstellt = []
+        for methode in Bericht_Renderer.methoden:
+            figsize, dpi = plots.figur_formate[methode]
+            fig.set_size_inches(*figsize, forward=False)
+            fig.set_dpi(dpi)
+            gezeichnet = False
+
+            if "png" in formate:
+                schlüssel = plots.render_schlüssel(methode, fig)
+                raster = Render_Cache().hole(schlüssel)
+                if raster is None:
+                    getattr(plots, methode)(fig)
+                    gezeichnet = True
+                    raster = Render_Cache().rastere(fig)
+                    Render_Cache().lege_ab(schlüssel, raster)
+
+            for format in formate:
+                datei = os.path.join(ausgabe, f"{name}_{methode}.{format}")
+                if format == "png":
+                    image.imsave(datei, raster, format="png", dpi=dpi)
+                else:
+                    if not gezeichnet:
+                        getattr(plots, methode)(fig)
+                        gezeichnet = True
+                    fig.savefig(datei, format=format, dpi=dpi) # ohne dpi nutzt savefig dpi bei Erstellung der Figure
+                erstellt.append(datei)
+
+        zähler = {name: wert - zähler_vorher[name] for name, wert in Render_Cache.zähler.items()}
+        return erstellt, zähler, Instrumentierung().entnehme() if Instrumentierung.aktiv else None
+
+
+
+# ============================== Server-Klasse ==========================
+
+class Dashboard_Server:
+    """
+    Lokaler HTTP-Dienst (nur lesend) für viele gleichzeitige Betrachter, asyncio ohne Zusatzpakete.
+    - /kennzahlen: Zahlen aus Plots_Berechnungen als JSON
+    - /prognose: Monte-Carlo-Prognose von Abschluss und Endnote als JSON
+    - /diagramm/<methode>.png|.svg: Diagramme/Tabelle wie im Bericht
+    - /: Übersichtsseite, /status: Zähler des Dienstes
+    ETag je Antwort aus Pfad, Datenversion des Speichers (mtime + Größe der Dateien),
+    Tag und Einstellungen -> unveränderte Panels antworten mit 304 ohne Berechnung.
+    Fertige Antworten werden je ETag vorgehalten (LRU), gleichzeitige gleiche Anfragen
+    warten auf dieselbe Berechnung. Berechnet wird in einem Hintergrund-Thread
+    (pandas/matplotlib blockieren), Ereignisschleife bleibt frei.
+    """
+
+    formate = {"png": "image/png", "svg": "image/svg+xml"}
+    max_einträge = 64 # vorgehaltene Antworten
+    zeitlimit = 30 # Sekunden ohne Anfrage, bis Verbindung geschlossen wird
+
+    def __init__(self, speicher=None, host="127.0.0.1", port=8050):
+        self.speicher = speicher or CSV_Speicher()
+        self.host = host
+        self.port = port # 0 = freier Port, nach öffne() tatsächlicher Port
+        self.ergebnisse = OrderedDict() # ETag -> Antwort (Bytes), älteste zuerst
+        self.laufend = {} # ETag -> Future der laufenden Berechnung
+        self.arbeiter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Dashboard_Server")
+        self.zähler = {"anfragen": 0, "nicht_geändert": 0, "treffer": 0, "zusammengefasst": 0, "berechnet": 0}
+        self.server = None
+
+    def etag(self, pfad):
+        """
+        Gibt ETag zu Pfad aus Datenversion, Tag (Tage seit Studienstart) und Einstellungen des Notenverlaufs zurück.
+        """
+        inhalt = repr((pfad, self.speicher.kennung(), self.speicher.version(), datetime.today().date(),
+                       Plots_Berechnungen.verlauf_fenster, Plots_Berechnungen.verlauf_ausdünnung))
+        return '"' + hashlib.sha256(inhalt.encode("utf-8")).hexdigest()[:32] + '"'
+
+    def route(self, pfad):
+        """
+        Gibt (Inhaltstyp, Erzeuger) zum Pfad zurück, None für unbekannten Pfad.
+        """
+        if pfad == "/":
+            return "text/html; charset=utf-8", self.erzeuge_übersicht
+        if pfad == "/kennzahlen":
+            return "application/json; charset=utf-8", self.erzeuge_kennzahlen
+        if pfad == "/prognose":
+            return "application/json; charset=utf-8", self.erzeuge_prognose
+        if pfad.startswith("/diagramm/"):
+            methode, _, format = pfad[len("/diagramm/"):].rpartition(".")
+            if methode in Bericht_Renderer.methoden and format in self.formate:
+                return self.formate[format], lambda: self.erzeuge_diagramm(methode, format)
+        return None
+
+    def erzeuge_übersicht(self):
+        bilder = "\n".join(f'<h2>{methode}</h2><img src="/diagramm/{methode}.png" alt="{methode}">' for methode in Bericht_Renderer.methoden)
+        return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Dashboard Studium</title></head>'
+                f'<body><h1>Dashboard Studium</h1><p><a href="/kennzahlen">Kennzahlen (JSON)</a> '
+                f'<a href="/prognose">Prognose (JSON)</a></p>\n{bilder}</body></html>').encode("utf-8")
+
+    def erzeuge_kennzahlen(self):
+        """
+        Gibt Kennzahlen aus Plots_Berechnungen als JSON (Bytes) zurück.
+        """
+        plots = Plots_Berechnungen(self.speicher)
+        mittelwert = plots.zahl_mittelwert_noten()
+        semester, tage = plots.statistik.durchschnitt_semester()
+        kennzahlen = {
+            "name": str(plots.read_student_csv.at[0, "Name"]),
+            "notenschnitt": None if mittelwert != mittelwert else mittelwert, # NaN ohne Module
+            "zeitplan": plots.zahl_abweichung_zeitplan(),
+            "ects_summe": int(plots.ects_summe),
+            "tage_vergangen": int(plots.tage_vergangen),
+            "module": int(plots.statistik.noten_anzahl),
+            "häufigkeit": {str(note): int(anzahl) for note, anzahl in zip(plots.noten_schritte, plots.statistik.häufigkeit)},
+            "tage_je_semester": {str(nummer): float(wert) for nummer, wert in zip(semester, tage)}
+        }
+        return json.dumps(kennzahlen, ensure_ascii=False).encode("utf-8")
+
+    def erzeuge_prognose(self):
+        """
+        Gibt Prognose aus Plots_Berechnungen.prognose_abschluss als JSON (Bytes) zurück, null ohne Module.
+        """
+        prognose = Plots_Berechnungen(self.speicher).prognose_abschluss()
+        return json.dumps(prognose, ensure_ascii=False).encode("utf-8")
+
+    def erzeuge_diagramm(self, methode, format):
+        """
+        Zeichnet Diagramm/Tabelle auf eigener Agg-Figure und gibt PNG/SVG (Bytes) zurück.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        plots = Plots_Berechnungen(self.speicher)
+        figsize, dpi = plots.figur_formate[methode]
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        getattr(plots, methode)(fig)
+        puffer = io.BytesIO()
+        fig.savefig(puffer, format=format, dpi=dpi)
+        return puffer.getvalue()
+
+    def berechne(self, pfad, etag, erzeuger):
+        """
+        Läuft im Hintergrund-Thread: erzeugt Antwort und prüft, ob Daten währenddessen gleich blieben.
+        Gibt (Bytes, gültig) zurück, nur gültige Antworten werden vorgehalten.
+        """
+        körper = erzeuger()
+        return körper, self.etag(pfad) == etag
+
+    async def ergebnis(self, pfad, etag, erzeuger):
+        """
+        Gibt Antwort zu ETag zurück: vorgehalten, aus laufender gleicher Berechnung oder neu berechnet.
+        """
+        körper = self.ergebnisse.get(etag)
+        if körper is not None:
+            self.ergebnisse.move_to_end(etag)
+            self.zähler["treffer"] += 1
+            return körper
+
+        zukunft = self.laufend.get(etag)
+        if zukunft is None:
+            zukunft = asyncio.get_running_loop().run_in_executor(self.arbeiter, self.berechne, pfad, etag, erzeuger)
+            zukunft.add_done_callback(lambda fertig: self.übernehme(etag, fertig))
+            self.laufend[etag] = zukunft
+            self.zähler["berechnet"] += 1
+        else:
+            self.zähler["zusammengefasst"] += 1
+        körper, _ = await asyncio.shield(zukunft) # Abbruch einer Verbindung beendet Berechnung für andere nicht
+        return körper
+
+    def übernehme(self, etag, zukunft):
+        """
+        Hält fertige, gültige Antwort vor (verdrängt älteste über max_einträge).
+        """
+        self.laufend.pop(etag, None)
+        if zukunft.cancelled() or zukunft.exception() is not None:
+            return
+        körper, gültig = zukunft.result()
+        if gültig:
+            self.ergebnisse[etag] = körper
+            while len(self.ergebnisse) > self.max_einträge:
+                self.ergebnisse.popitem(last=False)
+
+    async def beantworte(self, methode, ziel, kopf):
+        """
+        Gibt (Status, Kopfzeilen, Inhalt) für eine Anfrage zurück.
+        """
+        self.zähler["anfragen"] += 1
+        if methode not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD"}, b"Nur GET und HEAD"
+        pfad = urllib.parse.urlsplit(ziel).path
+        if pfad == "/status":
+            return 200, {"Content-Type": "application/json", "Cache-Control": "no-store"}, json.dumps(self.zähler).encode("utf-8")
+        route = self.route(pfad)
+        if route is None:
+            return 404, {}, b"Nicht gefunden"
+        inhaltstyp, erzeuger = route
+
+        etag = self.etag(pfad)
+        bekannt = [wert.strip().removeprefix("W/") for wert in kopf.get("if-none-match", "").split(",")]
+        if etag in bekannt or "*" in bekannt:
+            self.zähler["nicht_geändert"] += 1
+            return 304, {"ETag": etag, "Cache-Control": "no-cache"}, b""
+        try:
+            körper = await self.ergebnis(pfad, etag, erzeuger)
+        except Exception as ausnahme: # Fehler beim Rechnen/Zeichnen -> 500 statt Verbindungsabbruch
+            return 500, {}, f"Fehler: {ausnahme}".encode("utf-8")
+        return 200, {"Content-Type": inhaltstyp, "ETag": etag, "Cache-Control": "no-cache"}, körper
+
+    async def bearbeite(self, reader, writer):
+        """
+        Bearbeitet eine Verbindung (HTTP/1.1 mit Keep-Alive, mehrere Anfragen nacheinander).
+        """
+        try:
+            while True:
+                zeile = await asyncio.wait_for(reader.readline(), self.zeitlimit)
+                if not zeile:
+                    break
+                kopf = {}
+                while True:
+                    kopfzeile = await asyncio.wait_for(reader.readline(), self.zeitlimit)
+                    if kopfzeile in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, wert = kopfzeile.decode("latin-1").partition(":")
+                    kopf[name.strip().lower()] = wert.strip()
+
+                teile = zeile.decode("latin-1").split()
+                if len(teile) != 3:
+                    status, kopfzeilen, körper = 400, {}, b"Fehlerhafte Anfrage"
+                else:
+                    status, kopfzeilen, körper = await self.beantworte(*teile[:2], kopf)
+                schließen = (len(teile) != 3 or teile[2] != "HTTP/1.1" or kopf.get("connection", "").lower() == "close"
+                             or status == 405) # Inhalt einer abgelehnten Anfrage wird nicht gelesen
+
+                kopfzeilen["Content-Length"] = str(len(körper))
+                kopfzeilen["Connection"] = "close" if schließen else "keep-alive"
+                antwort = f"HTTP/1.1 {status} {self.status_text(status)}\r\n"
+                antwort += "".join(f"{name}: {wert}\r\n" for name, wert in kopfzeilen.items()) + "\r\n"
+                writer.write(antwort.encode("latin-1") + (b"" if len(teile) == 3 and teile[0] == "HEAD" else körper))
+                await writer.drain()
+                if schließen:
+                    break
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def status_text(self, status):
+        return {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+                405: "Method Not Allowed", 500: "Internal Server Error"}[status]
+
+    async def öffne(self):
+        """
+        Startet Server (Port 0 -> freier Port, in self.port übernommen).
+        """
+        self.server = await asyncio.start_server(self.bearbeite, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def schließe(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.arbeiter.shutdown(wait=True)
+
+    async def laufe(self):
+        """
+        Startet Server und bedient Anfragen bis zum Abbruch (Strg+C).
+        """
+        await self.öffne()
+        print(f"Dashboard unter http://{self.host}:{self.port}/ (Beenden mit Strg+C)")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.schließe()
+
+
+
+# ============================== Mess-Klasse ============================
+
+class Latenz_Histogramm:
+    """
+    Latenzen einer Operation in logarithmischen Eimern (4 je Verdopplung, max. 25 % Abweichung).
+    Speicher fest je Operation, Perzentile werden aus Eimern geschätzt (Obergrenze des Eimers).
+    """
+    __slots__ = ("anzahl", "summe_ns", "min_ns", "max_ns", "eimer", "zeilen_letzte", "zeilen_max")
+
+    def __init__(self):
+        self.anzahl = 0
+        self.summe_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.eimer = Counter() # Eimer-Nummer -> Anzahl
+        self.zeilen_letzte = None
+        self.zeilen_max = None
+
+    def eimer_nummer(self, dauer_ns):
+        """
+        Gibt Eimer zu Dauer zurück: Stelle des höchsten Bits und zwei folgende Bits.
+        """
+        if dauer_ns < 8: # kleinste Dauern exakt
+            return dauer_ns
+        stellen = dauer_ns.bit_length()
+        return (stellen - 1) * 4 + ((dauer_ns >> (stellen - 3)) & 3)
+
+    def obergrenze_ns(self, nummer):
+        """
+        Gibt größte Dauer (ns) zurück, die noch in Eimer nummer fällt.
+        """
+        if nummer < 8:
+            return nummer
+        stellen, rest = divmod(nummer, 4)
+        return ((4 + rest + 1) << (stellen - 2)) - 1
+
+    def erfasse(self, dauer_ns, zeilen):
+        self.anzahl += 1
+        self.summe_ns += dauer_ns
+        self.min_ns = dauer_ns if self.min_ns is None else min(self.min_ns, dauer_ns)
+        self.max_ns = max(self.max_ns, dauer_ns)
+        self.eimer[self.eimer_nummer(dauer_ns)] += 1
+        if zeilen is not None:
+            self.zeilen_letzte = zeilen
+            self.zeilen_max = zeilen if self.zeilen_max is None else max(self.zeilen_max, zeilen)
+
+    def vereinige(self, anderes):
+        """
+        Übernimmt Messungen eines anderen Histogramms (z. B. aus Worker-Prozess).
+        """
+        self.anzahl += anderes.anzahl
+        self.summe_ns += anderes.summe_ns
+        if anderes.min_ns is not None:
+            self.min_ns = anderes.min_ns if self.min_ns is None else min(self.min_ns, anderes.min_ns)
+        self.max_ns = max(self.max_ns, anderes.max_ns)
+        self.eimer.update(anderes.eimer)
+        if anderes.zeilen_max is not None:
+            self.zeilen_letzte = anderes.zeilen_letzte
+            self.zeilen_max = anderes.zeilen_max if self.zeilen_max is None else max(self.zeilen_max, anderes.zeilen_max)
+
+    def perzentil_ns(self, anteil):
+        """
+        Gibt geschätztes Perzentil (anteil 0-1) in ns zurück.
+        """
+        ziel = anteil * self.anzahl
+        gezählt = 0
+        for nummer in sorted(self.eimer):
+            gezählt += self.eimer[nummer]
+            if gezählt >= ziel:
+                return min(self.obergrenze_ns(nummer), self.max_ns)
+        return self.max_ns
 
+    def als_dict(self):
+        """
+        Gibt Kennzahlen (ms) und Eimer (Obergrenze in µs, Anzahl) als Dictionary zurück.
+        """
+        return {
+            "anzahl": self.anzahl,
+            "summe_ms": self.summe_ns / 1e6,
+            "mittel_ms": self.summe_ns / self.anzahl / 1e6 if self.anzahl else 0.0,
+            "min_ms": (self.min_ns or 0) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+            "p50_ms": self.perzentil_ns(0.5) / 1e6,
+            "p90_ms": self.perzentil_ns(0.9) / 1e6,
+            "p99_ms": self.perzentil_ns(0.99) / 1e6,
+            "zeilen_letzte": self.zeilen_letzte,
+            "zeilen_max": self.zeilen_max,
+            "eimer": [[round(self.obergrenze_ns(nummer) / 1000, 3), self.eimer[nummer]] for nummer in sorted(self.eimer)]
+        }
+
+
+class Instrumentierung:
+    """
+    Zeitmessung der Methoden von CSV_Controller, Plots_Berechnungen, GUI_Controller
+    und der Klassen darunter (Speicher, Caches, Statistik) sowie Figure.tight_layout.
+    aktiviere() ersetzt Methoden durch messende Hüllen, deaktiviere() stellt Originale
+    wieder her -> ausgeschaltet entsteht kein zusätzlicher Aufwand.
+    Jede Messung landet in Latenz_Histogramm je Operation (mit Zeilenanzahl, sofern
+    erkennbar) und als Ereignis für Chrome-Trace (chrome://tracing, Perfetto).
+    Zustand ist klassenweit (alle Threads, alle Instanzen). Worker-Prozesse (Bericht_Renderer)
+    messen selbst und geben Messungen per entnehme() zurück, Hauptprozess führt sie mit übernehme() zusammen.
+    """
+
+    klassen = ["CSV_Controller", "Plots_Berechnungen", "GUI_Controller", "Virtuelle_Tabelle", "CSV_Speicher",
+               "SQLite_Speicher", "Kohorte_Speicher", "Daten_Cache", "Render_Cache", "Statistik_Engine",
+               "Streaming_Statistik", "Modul_Tabelle"]
+    aktiv = False
+    _originale = {} # (Klasse, Attribut) -> ursprünglicher Klassenwert
+    _histogramme = {} # Operation -> Latenz_Histogramm
+    _ereignisse = deque(maxlen=200000) # (Operation, Start ns, Dauer ns, Prozess, Thread, Zeilen), älteste fallen weg
+    _sperre = threading.Lock()
+    _nullpunkt = time.perf_counter_ns()
+
+    def aktiviere(self):
+        """
+        Umhüllt alle gewöhnlichen Methoden der Klassen (auch static-/classmethods) mit Zeitmessung.
+        __init__ wird mitgemessen (Laden/Berechnen beim Erstellen), übrige Dunder-Methoden,
+        Properties und Generatoren bleiben unverändert.
+        """
+        if Instrumentierung.aktiv:
+            return
+        for name in self.klassen:
+            klasse = globals()[name]
+            for attribut, wert in list(vars(klasse).items()):
+                if attribut.startswith("__") and attribut != "__init__":
+                    continue
+                funktion = wert.__func__ if isinstance(wert, (staticmethod, classmethod)) else wert
+                if not inspect.isfunction(funktion) or inspect.isgeneratorfunction(funktion):
+                    continue
+                hülle = self.umhülle(f"{name}.{attribut}", funktion)
+                if isinstance(wert, staticmethod):
+                    hülle = staticmethod(hülle)
+                elif isinstance(wert, classmethod):
+                    hülle = classmethod(hülle)
+                self._originale[(klasse, attribut)] = wert
+                setattr(klasse, attribut, hülle)
+
+        from matplotlib.figure import Figure
+        self._originale[(Figure, "tight_layout")] = Figure.__dict__["tight_layout"]
+        Figure.tight_layout = self.umhülle("Figure.tight_layout", Figure.__dict__["tight_layout"])
+        Instrumentierung.aktiv = True
+
+    def deaktiviere(self):
+        """
+        Stellt alle ursprünglichen Methoden wieder her (Messwerte bleiben erhalten).
+        """
+        for (klasse, attribut), wert in self._originale.items():
+            setattr(klasse, attribut, wert)
+        self._originale.clear()
+        Instrumentierung.aktiv = False
+
+    def umhülle(self, operation, funktion):
+        """
+        Gibt Hülle zurück, die Laufzeit und Zeilenanzahl jedes Aufrufs erfasst (auch bei Ausnahme).
+        """
+        erfasse = self.erfasse
+        zeilen = self.zeilen
+
+        @functools.wraps(funktion)
+        def gemessen(*argumente, **schlüsselwörter):
+            start = time.perf_counter_ns()
+            try:
+                ergebnis = funktion(*argumente, **schlüsselwörter)
+            except BaseException:
+                erfasse(operation, start, time.perf_counter_ns(), None)
+                raise
+            erfasse(operation, start, time.perf_counter_ns(), zeilen(argumente, ergebnis))
+            return ergebnis
+        return gemessen
+
+    def zeilen(self, argumente, ergebnis):
+        """
+        Gibt Zeilenanzahl zur Messung zurück: Länge eines Ergebnisses mit Zeilen
+        (DataFrame, Array, Modul_Tabelle), sonst Anzahl Module der Statistik der Instanz.
+        """
+        if type(ergebnis).__name__ in ("DataFrame", "Series", "ndarray", "Modul_Tabelle"):
+            return len(ergebnis)
+        if argumente:
+            statistik = getattr(argumente[0], "statistik", None)
+            if statistik is not None:
+                return getattr(statistik, "noten_anzahl", None)
+        return None
+
+    def erfasse(self, operation, start_ns, ende_ns, zeilen):
+        with self._sperre:
+            histogramm = self._histogramme.get(operation)
+            if histogramm is None:
+                histogramm = self._histogramme[operation] = Latenz_Histogramm()
+            histogramm.erfasse(ende_ns - start_ns, zeilen)
+            self._ereignisse.append((operation, start_ns, ende_ns - start_ns, os.getpid(), threading.get_ident(), zeilen))
+
+    def zurücksetzen(self):
+        with self._sperre:
+            self._histogramme.clear()
+            self._ereignisse.clear()
+
+    def entnehme(self):
+        """
+        Gibt (Histogramme je Operation, Ereignisse) seit letzter Entnahme zurück und leert beide
+        (Worker-Prozess -> Hauptprozess, per pickle übertragbar).
+        """
+        with self._sperre:
+            messung = (dict(self._histogramme), list(self._ereignisse))
+            self._histogramme.clear()
+            self._ereignisse.clear()
+        return messung
+
+    def übernehme(self, histogramme, ereignisse):
+        """
+        Führt Messungen eines anderen Prozesses (entnehme) mit eigenen zusammen.
+        """
+        with self._sperre:
+            for operation, histogramm in histogramme.items():
+                self._histogramme.setdefault(operation, Latenz_Histogramm()).vereinige(histogramm)
+            self._ereignisse.extend(ereignisse)
+
+    def übersicht(self, anzahl=None):
+        """
+        Gibt Kennzahlen je Operation zurück, absteigend nach Gesamtzeit (optional nur die ersten anzahl).
+        """
+        with self._sperre:
+            werte = {operation: histogramm.als_dict() for operation, histogramm in self._histogramme.items()}
+        reihenfolge = sorted(werte, key=lambda operation: werte[operation]["summe_ms"], reverse=True)
+        return {operation: werte[operation] for operation in reihenfolge[:anzahl]}
+
+    def exportiere_json(self, datei):
+        """
+        Schreibt Histogramme aller Operationen als JSON.
+        """
+        with open(datei, "w", encoding="utf-8") as ausgabe:
+            json.dump({"zeitpunkt": datetime.now().isoformat(timespec="seconds"), "operationen": self.übersicht()},
+                      ausgabe, ensure_ascii=False, indent=2)
+        return datei
+
+    def exportiere_trace(self, datei):
+        """
+        Schreibt Ereignisse im Chrome-Trace-Format (vollständige Ereignisse "X", Zeiten in µs).
+        """
+        with self._sperre:
+            ereignisse = list(self._ereignisse)
+        trace = {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {"name": operation, "cat": operation.split(".")[0], "ph": "X", "pid": prozess, "tid": thread,
+                 "ts": (start - self._nullpunkt) / 1000, "dur": dauer / 1000, "args": {} if zeilen is None else {"zeilen": zeilen}}
+                for operation, start, dauer, prozess, thread, zeilen in ereignisse
+            ]
+        }
+        with open(datei, "w", encoding="utf-8") as ausgabe:
+            json.dump(trace, ausgabe, ensure_ascii=False)
+        return datei
+
+
+class Stichproben_Profiler:
+    """
+    Stichproben-Profiler für einen begrenzten Zeitraum (z. B. eine Aktualisierung der GUI).
+    Eigener Thread liest alle intervall Sekunden die Aufrufstapel aller anderen Threads
+    (sys._current_frames) und zählt sie -> kein Eingriff in gemessenen Code.
+    Ergebnis: zusammengefasste Stapel ("a;b;c Anzahl", Format für Flamegraph-Werkzeuge)
+    und Funktionen mit den meisten eigenen Stichproben.
+    """
+
+    def __init__(self, intervall=0.002):
+        self.intervall = intervall
+        self.stapel = Counter()
+        self.stopp = threading.Event()
+        self.thread = threading.Thread(target=self.sammle, name="Stichproben_Profiler", daemon=True)
+
+    def starte(self):
+        self.thread.start()
+        return self
+
+    def sammle(self):
+        eigener = threading.get_ident()
+        namen = {}
+        while not self.stopp.wait(self.intervall):
+            for thread, frame in sys._current_frames().items():
+                if thread == eigener:
+                    continue
+                if thread not in namen:
+                    namen = {t.ident: t.name for t in threading.enumerate()}
+                aufrufe = []
+                while frame is not None:
+                    aufrufe.append(f"{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                aufrufe.append(namen.get(thread, str(thread)))
+                self.stapel[";".join(reversed(aufrufe))] += 1
+
+    def beende(self):
+        self.stopp.set()
+        self.thread.join()
+        return self
+
+    def häufigste(self, anzahl=15):
+        """
+        Gibt Funktionen mit den meisten Stichproben als innerster Aufruf zurück (eigene Zeit).
+        """
+        eigene = Counter()
+        for stapel, stichproben in self.stapel.items():
+            eigene[stapel.rsplit(";", 1)[-1]] += stichproben
+        return eigene.most_common(anzahl)
+
+    def speichere(self, datei):
+        """
+        Schreibt zusammengefasste Stapel (eine Zeile je Stapel mit Anzahl).
+        """
+        with open(datei, "w", encoding="utf-8") as ausgabe:
+            for stapel, stichproben in self.stapel.most_common():
+                ausgabe.write(f"{stapel} {stichproben}\n")
+        return datei
 
 
 
 # ===#===#===#===#===#===#===#== Ausführung ==#===#===#===#===#===#===#==
 
-# Ausführung der GUI
-GUI_Controller()
+IMPORT_DAUER = time.perf_counter() - IMPORT_START # Modul ist ohne Nebenwirkungen importierbar
+
+
+def main(argumente=None):
+    """
+    Einstiegspunkt: öffnet GUI oder rendert Berichte ohne GUI (--bericht).
+    --startzeit misst Importzeit, Zeit bis erste Anzeige und bis Diagramme fertig sind.
+    --importiere übernimmt viele Module aus einer CSV-Datei in einem Durchgang.
+    --streaming gibt Kennzahlen großer Modul-CSV aus, blockweise gelesen.
+    --server stellt Kennzahlen und Diagramme lokal über HTTP bereit (nur lesend).
+    --prognose gibt Monte-Carlo-Prognose von Abschluss und Endnote aus (mit --kohorte als CSV je Student).
+    --instrumentierung/--trace messen Laufzeiten aller Methoden (Übersicht bzw. Chrome-Trace am Ende),
+    bei --bericht einschließlich der Worker-Prozesse.
+    """
+    parser = argparse.ArgumentParser(description="Dashboard Studium (GUI oder Berichte ohne GUI)")
+    parser.add_argument("--bericht", action="store_true", help="Berichte ohne GUI rendern statt GUI zu öffnen")
+    parser.add_argument("--matrikelnummern", nargs="*", help="Studenten aus Kohorten-Dateien (ohne Angabe: Student.csv)")
+    parser.add_argument("--kohorte", action="store_true", help="alle Studenten aus Kohorten-Datei rendern")
+    parser.add_argument("--ausgabe", default="Berichte", help="Zielordner der Berichte")
+    parser.add_argument("--format", nargs="+", default=["png"], choices=["png", "svg", "pdf"], help="Dateiformate")
+    parser.add_argument("--prozesse", type=int, default=None, help="Anzahl Worker-Prozesse (Standard: CPU-Kerne)")
+    parser.add_argument("--startzeit", action="store_true", help="Startzeiten messen, GUI danach schließen")
+    parser.add_argument("--render-cache", default=None, help="Ordner für Festplatten-Stufe des Render_Cache")
+    parser.add_argument("--importiere", default=None, help="Module aus CSV-Datei (Modul, ECTS, Start, Ende, Note) importieren")
+    parser.add_argument("--streaming", action="store_true", help="Kennzahlen blockweise berechnen und ausgeben (große Modul-CSV)")
+    parser.add_argument("--chunk-größe", type=int, default=100000, help="Zeilen je Block im Streaming-Modus")
+    parser.add_argument("--server", action="store_true", help="Kennzahlen und Diagramme über lokalen HTTP-Dienst bereitstellen")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse des HTTP-Dienstes")
+    parser.add_argument("--port", type=int, default=8050, help="Port des HTTP-Dienstes")
+    parser.add_argument("--verlauf-fenster", type=int, nargs="*", default=[], help="gleitende Durchschnitte über so viele Module im Notenverlauf")
+    parser.add_argument("--ausdünnung", default="lttb", choices=Ausdünnung.verfahren, help="Ausdünnung langer Notenverläufe")
+    parser.add_argument("--prognose", action="store_true", help="Abschluss und Endnote per Monte-Carlo-Simulation prognostizieren")
+    parser.add_argument("--trajektorien", type=int, default=None, help="Trajektorien je Student (Standard: 100000, Kohorte 2000)")
+    parser.add_argument("--instrumentierung", action="store_true", help="Laufzeiten messen (auch Worker-Prozesse bei --bericht), Übersicht am Ende ausgeben")
+    parser.add_argument("--trace", default=None, help="Laufzeiten messen und als Chrome-Trace (JSON) in Datei schreiben")
+    argumente = parser.parse_args(argumente)
+    Render_Cache.verzeichnis = argumente.render_cache
+    Plots_Berechnungen.verlauf_fenster = tuple(argumente.verlauf_fenster)
+    Plots_Berechnungen.verlauf_ausdünnung = argumente.ausdünnung
+    instrumentierung = Instrumentierung()
+    if argumente.instrumentierung or argumente.trace:
+        instrumentierung.aktiviere()
+
+    if argumente.importiere:
+        anzahl = CSV_Controller().importiere_module_csv(argumente.importiere)
+        print(f"{anzahl} Module importiert.")
+    elif argumente.streaming:
+        plots = Plots_Berechnungen(streaming=True, chunk_größe=argumente.chunk_größe)
+        semester, tage = plots.statistik.durchschnitt_semester()
+        print(f"Module: {plots.statistik.noten_anzahl}, ECTS: {plots.ects_summe}")
+        print(f"Dein Notenschnitt: {plots.zahl_mittelwert_noten()}")
+        print(f"Du bist {plots.zahl_abweichung_zeitplan()}.")
+        print("Häufigkeit: " + ", ".join(f"{note}: {anzahl}" for note, anzahl in zip(plots.noten_schritte, plots.statistik.häufigkeit)))
+        print("Tage je Semester: " + ", ".join(f"{nummer}: {wert:.1f}" for nummer, wert in zip(semester, tage)))
+    elif argumente.prognose and argumente.kohorte:
+        prognose = Kohorte_Berechnungen().prognose_abschluss(argumente.trajektorien or 2000)
+        os.makedirs(argumente.ausgabe, exist_ok=True)
+        datei = os.path.join(argumente.ausgabe, "Prognose_Kohorte.csv")
+        prognose.to_csv(datei)
+        print(f"Prognose für {len(prognose)} Studenten in {datei} erstellt.")
+        print(f"Mit Prognose: {prognose['Endnote_P50'].notna().sum()}, Median Endnote: {prognose['Endnote_P50'].median():.2f}")
+    elif argumente.prognose:
+        prognose = Plots_Berechnungen().prognose_abschluss(argumente.trajektorien or 100000)
+        if prognose is None:
+            print("Keine Prognose ohne abgeschlossene Module.")
+        else:
+            print(f"Trajektorien: {prognose['trajektorien']}, restliche ECTS: {prognose['ects_rest']}")
+            print("Abschluss: " + ", ".join(f"P{p}: {datum}" for p, datum in prognose["abschluss"].items()))
+            print("Endnote: " + ", ".join(f"P{p}: {note:.2f}" for p, note in prognose["endnote"].items()))
+            print(f"In Regelstudienzeit: {prognose['regelstudienzeit']:.1%}")
+    elif argumente.server:
+        try:
+            asyncio.run(Dashboard_Server(host=argumente.host, port=argumente.port).laufe())
+        except KeyboardInterrupt:
+            pass
+    elif argumente.bericht:
+        renderer = Bericht_Renderer(argumente.ausgabe, argumente.format, argumente.prozesse)
+        matrikelnummern = argumente.matrikelnummern
+        if argumente.kohorte:
+            matrikelnummern = Daten_Cache().lese_csv(renderer.dateien[0])["Matrikelnummer"].tolist()
+        dateien = renderer.rendere(matrikelnummern)
+        print(f"{len(dateien)} Dateien in {argumente.ausgabe} erstellt.")
+        print(f"Render_Cache: {renderer.cache_statistik}")
+    elif argumente.startzeit:
+        GUI_Controller(messung=True)
+    else:
+        # Ausführung der GUI
+        GUI_Controller()
+
+        # Eingaben für Student.csv hier tätigen -> ausreichend für konzeptionellen Zweck
+        # Kann theoretisch ebenfalls in GUI eingebunden werden.
+        CSV_Controller().setze_student_csv("Phillip Riemer", "UI123456", "Angewandte KI", "Bachelor of Science", "12.01.2025")
+
+    if argumente.trace:
+        instrumentierung.exportiere_trace(argumente.trace)
+    if argumente.instrumentierung:
+        for operation, werte in instrumentierung.übersicht(25).items():
+            print(f"{operation:<45} n={werte['anzahl']:<7} p50={werte['p50_ms']:.2f} ms  p90={werte['p90_ms']:.2f} ms  "
+                  f"max={werte['max_ms']:.2f} ms  Summe={werte['summe_ms']:.1f} ms")
+
 
-# Eingaben für Student.csv hier tätigen -> ausreichend für konzeptionellen Zweck
-# Kann theoretisch ebenfalls in GUI eingebunden werden.
-CSV_Controller().setze_student_csv("Phillip Riemer", "UI123456", "Angewandte KI", "Bachelor of Science", "12.01.2025")
+if __name__ == "__main__":
+    main()
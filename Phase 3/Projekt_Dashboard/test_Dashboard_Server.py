@@ -0,0 +1,94 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import Benchmark
+import Dashboard
+
+
+class Test_Dashboard_Server(unittest.TestCase):
+    """
+    Startet Dashboard_Server auf freiem Port (0) über synthetischen Daten und prüft
+    ETag/304 sowie Zusammenfassen gleichzeitiger gleicher Anfragen zu einer Berechnung.
+    """
+
+    def setUp(self):
+        self.ordner = tempfile.TemporaryDirectory()
+        self.vorher = os.getcwd()
+        os.chdir(self.ordner.name)
+        Benchmark.Daten_Generator(self.ordner.name, seed=1).erzeuge_einzeln(50)
+        Dashboard.Statistik_Engine._instanzen.clear()
+
+    def tearDown(self):
+        os.chdir(self.vorher)
+        self.ordner.cleanup()
+
+    async def anfrage(self, port, pfad, kopf=None):
+        """
+        Sendet eine GET-Anfrage (Connection: close) und gibt (Status, Kopfzeilen, Inhalt) zurück.
+        """
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        zeilen = [f"GET {pfad} HTTP/1.1", "Host: localhost", "Connection: close"]
+        zeilen += [f"{name}: {wert}" for name, wert in (kopf or {}).items()]
+        writer.write(("\r\n".join(zeilen) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        antwort = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+
+        kopfteil, _, körper = antwort.partition(b"\r\n\r\n")
+        statuszeile, *kopfzeilen = kopfteil.decode("latin-1").split("\r\n")
+        kopfzeilen = dict((name.strip().lower(), wert.strip()) for name, _, wert in (zeile.partition(":") for zeile in kopfzeilen))
+        return int(statuszeile.split()[1]), kopfzeilen, körper
+
+    async def mit_server(self, prüfung):
+        """
+        Führt prüfung(server) mit gestartetem Server aus und schließt ihn danach.
+        """
+        server = await Dashboard.Dashboard_Server(Dashboard.CSV_Speicher(), port=0).öffne()
+        try:
+            self.assertNotEqual(server.port, 0)
+            await prüfung(server)
+        finally:
+            await server.schließe()
+
+    def test_etag_und_nicht_geändert(self):
+        async def prüfung(server):
+            status, kopf, körper = await self.anfrage(server.port, "/kennzahlen")
+            self.assertEqual(status, 200)
+            self.assertIn("etag", kopf)
+            self.assertTrue(körper)
+
+            status, kopf_2, körper = await self.anfrage(server.port, "/kennzahlen", {"If-None-Match": kopf["etag"]})
+            self.assertEqual(status, 304)
+            self.assertEqual(kopf_2["etag"], kopf["etag"])
+            self.assertEqual(körper, b"")
+            self.assertEqual(server.zähler["berechnet"], 1)
+            self.assertEqual(server.zähler["nicht_geändert"], 1)
+        asyncio.run(self.mit_server(prüfung))
+
+    def test_gleichzeitige_anfragen_einmal_berechnet(self):
+        async def prüfung(server):
+            aufrufe = []
+            erzeuge = server.erzeuge_kennzahlen
+            def langsam():
+                aufrufe.append(threading.get_ident())
+                time.sleep(0.3) # alle Anfragen treffen während der Berechnung ein
+                return erzeuge()
+            server.erzeuge_kennzahlen = langsam
+
+            antworten = await asyncio.gather(*(self.anfrage(server.port, "/kennzahlen") for _ in range(8)))
+            self.assertEqual([status for status, _, _ in antworten], [200] * 8)
+            self.assertEqual(len({körper for _, _, körper in antworten}), 1)
+            self.assertEqual(len({kopf["etag"] for _, kopf, _ in antworten}), 1)
+            self.assertEqual(len(aufrufe), 1)
+            self.assertEqual(server.zähler["berechnet"], 1)
+            self.assertEqual(server.zähler["zusammengefasst"], 7)
+        asyncio.run(self.mit_server(prüfung))
+
+
+if __name__ == "__main__":
+    unittest.main()